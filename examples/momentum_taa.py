@@ -1,11 +1,11 @@
-import operator
 import os
 
+import numpy as np
 import pandas as pd
 import pytz
 
 from qstrader.alpha_model.alpha_model import AlphaModel
-from qstrader.alpha_model.fixed_signals import 
+from qstrader.alpha_model.fixed_signals import FixedSignalsAlphaModel
 from qstrader.asset.equity import Equity
 from qstrader.asset.universe.dynamic import DynamicUniverse
 from qstrader.asset.universe.static import StaticUniverse
@@ -71,25 +71,22 @@ class TopNMomentumAlphaModel(AlphaModel):
             restricted to the 'Top N'.
         """
         assets = self.signals['momentum'].assets
-        
-        # Calculate the holding-period return momenta for each asset,
-        # for the particular provided momentum lookback period
-        all_momenta = {
-            asset: self.signals['momentum'](
-                asset, self.mom_lookback
-            ) for asset in assets
-        }
-
-        # Obtain a list of the top performing assets by momentum
-        # restricted by the provided number of desired assets to
-        # trade per month
-        return [
-            asset[0] for asset in sorted(
-                all_momenta.items(),
-                key=operator.itemgetter(1),
-                reverse=True
-            )
-        ][:self.mom_top_n]
+
+        # Calculate the holding-period return momenta for all assets
+        # at once, for the particular provided momentum lookback period
+        all_momenta = self.signals['momentum'].evaluate(
+            assets, self.mom_lookback
+        )
+
+        # Obtain the top performing assets by momentum restricted by
+        # the provided number of desired assets to trade per month,
+        # without fully sorting the momenta of all assets
+        top_n = min(self.mom_top_n, len(assets))
+        if top_n == 0:
+            return []
+        top_idx = np.argpartition(-all_momenta, top_n - 1)[:top_n]
+        top_idx = top_idx[np.argsort(-all_momenta[top_idx], kind='stable')]
+        return [assets[idx] for idx in top_idx]
 
     def _generate_signals(
         self, dt, weights
@@ -148,9 +145,9 @@ class TopNMomentumAlphaModel(AlphaModel):
 
 
 if __name__ == "__main__":
-    # Duration of the backtest
-    start_dt = pd.Timestamp('1998-12-22 14:30:00', tz=pytz.UTC)
-    burn_in_dt = pd.Timestamp('1999-12-22 14:30:00', tz=pytz.UTC)
+    # Duration of the backtest, with the momentum lookback period
+    # warm-started from the historical prices prior to the start
+    start_dt = pd.Timestamp('1999-12-22 14:30:00', tz=pytz.UTC)
     end_dt = pd.Timestamp('2020-12-31 23:59:00', tz=pytz.UTC)
 
     # Model parameters
@@ -178,7 +175,9 @@ if __name__ == "__main__":
     # Generate the signals (in this case holding-period return based
     # momentum) used in the top-N momentum alpha model
     momentum = MomentumSignal(start_dt, strategy_universe, lookbacks=[mom_lookback])
-    signals = SignalsCollection({'momentum': momentum}, strategy_data_handler)
+    signals = SignalsCollection(
+        {'momentum': momentum}, strategy_data_handler, warm_start=True
+    )
 
     # Generate the alpha model instance for the top-N momentum alpha model
     strategy_alpha_model = TopNMomentumAlphaModel(
@@ -195,7 +194,6 @@ if __name__ == "__main__":
         rebalance='end_of_month',
         long_only=True,
         cash_buffer_percentage=0.01,
-        burn_in_dt=burn_in_dt,
         data_handler=strategy_data_handler
     )
     strategy_backtest.run()
@@ -211,7 +209,7 @@ if __name__ == "__main__":
     # 100% static allocation to the SPY ETF, with no rebalance
     benchmark_alpha_model = FixedSignalsAlphaModel({'EQ:SPY': 1.0})
     benchmark_backtest = BacktestTradingSession(
-        burn_in_dt,
+        start_dt,
         end_dt,
         benchmark_universe,
         benchmark_alpha_model,
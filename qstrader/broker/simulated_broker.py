@@ -664,10 +664,13 @@ class SimulatedBroker(Broker):
 
         # Update portfolio asset values
         for portfolio in self.portfolios:
-            for asset in self.portfolios[portfolio].pos_handler.positions:
-                mid_price = self.data_handler.get_asset_latest_mid_price(
-                    dt, asset
-                )
+            assets = list(self.portfolios[portfolio].pos_handler.positions)
+            if len(assets) == 0:
+                continue
+            mid_prices = self.data_handler.get_assets_latest_mid_prices(
+                dt, assets
+            )
+            for asset, mid_price in zip(assets, mid_prices):
                 self.portfolios[portfolio].update_market_value_of_asset(
                     asset, mid_price, self.current_dt
                 )
@@ -1,7 +1,9 @@
 from abc import ABCMeta, abstractmethod
 from qstrader.data.daily_bar_csv import DataSource
+from qstrader.data.price_series import BidAskPriceCursor
 from qstrader.asset.universe.universe import Universe
 import numpy as np
+import pandas as pd
 
 
 class DataHandler(object):
@@ -36,6 +38,12 @@ class DataHandler(object):
             "Should implement get_asset_latest_bid_ask_price()"
         )
 
+    @abstractmethod
+    def get_assets_latest_bid_ask_prices(self, dt, asset_symbols):
+        raise NotImplementedError(
+            "Should implement get_assets_latest_bid_ask_prices()"
+        )
+
     @abstractmethod
     def get_assets_historical_range_close_price(self, start_dt, end_dt, asset_symbols, adjusted=False):
         raise NotImplementedError(
@@ -44,29 +52,115 @@ class DataHandler(object):
 
 class BacktestDataHandler(DataHandler):
     """
+    Provides latest and historical asset pricing from one or more
+    data sources for use within a backtest.
+
+    Parameters
+    ----------
+    universe : `Universe`
+        The Asset Universe to obtain pricing for.
+    data_sources : `list[DataSource]`
+        The data sources to query, in order of priority. Each asset
+        is routed to the data sources holding it, which are queried
+        in this order, with a lower priority source only being used
+        if the higher priority sources do not yet have a price.
+    use_cursors : `Boolean`, optional
+        Whether to keep a per-asset row pointer into each data source
+        that supports it, which is advanced as simulation time moves
+        forward. This makes sequential latest-price lookups amortised
+        O(1), falling back to a binary search if an earlier timestamp
+        is requested. Cursors only serve single-asset lookups, as
+        batched lookups are served by the data source's price panel,
+        and they hold a reference to each asset's price series, which
+        is therefore not released by a lazily-loading data source.
+        Defaults to False.
     """
 
     def __init__(
         self,
         universe:Universe,
-        data_sources:DataSource=None
+        data_sources:DataSource=None,
+        use_cursors:bool=False
     ):
         super(BacktestDataHandler, self).__init__(universe, data_sources)
         #self.universe = universe
         #self.data_sources = data_sources
+        self.use_cursors = use_cursors
+        self.cursors = {}
+        self.asset_sources = self._create_asset_source_routing()
+
+    def _create_asset_source_routing(self):
+        """
+        Create the routing table from each asset symbol to the
+        data sources that hold it, in order of priority, so that
+        lookups do not need to query data sources without the asset.
+
+        Returns
+        -------
+        `dict{str: tuple(DataSource)}`
+            The asset symbol keyed tuples of data sources.
+        """
+        asset_sources = {}
+        if self.data_sources is None:
+            return asset_sources
+        for ds in self.data_sources:
+            for asset_symbol in ds.get_assets():
+                asset_sources[asset_symbol] = asset_sources.get(
+                    asset_symbol, ()
+                ) + (ds,)
+        return asset_sources
+
+    def _get_cursor(self, ds, asset_symbol):
+        """
+        Obtain (creating if necessary) the price cursor for an
+        asset within a particular data source.
+
+        Parameters
+        ----------
+        ds : `DataSource`
+            The data source holding the asset prices.
+        asset_symbol : `str`
+            The asset symbol to obtain the cursor for.
+
+        Returns
+        -------
+        `BidAskPriceCursor`
+            The price cursor for the asset.
+        """
+        key = (id(ds), asset_symbol)
+        cursor = self.cursors.get(key)
+        if cursor is None:
+            cursor = BidAskPriceCursor(ds.get_price_series(asset_symbol))
+            self.cursors[key] = cursor
+        return cursor
+
+    def _get_source_bid(self, ds, dt, asset_symbol):
+        """
+        Obtain the bid price from a single data source, via a
+        price cursor if enabled and supported by the source.
+        """
+        if self.use_cursors and hasattr(ds, 'get_price_series'):
+            return self._get_cursor(ds, asset_symbol).get_bid(dt)
+        return ds.get_bid(dt, asset_symbol)
+
+    def _get_source_ask(self, ds, dt, asset_symbol):
+        """
+        Obtain the ask price from a single data source, via a
+        price cursor if enabled and supported by the source.
+        """
+        if self.use_cursors and hasattr(ds, 'get_price_series'):
+            return self._get_cursor(ds, asset_symbol).get_ask(dt)
+        return ds.get_ask(dt, asset_symbol)
 
     def get_asset_latest_bid_price(self, dt, asset_symbol):
         """
         """
         # TODO: Check for asset in Universe
         bid = np.NaN
-        for ds in self.data_sources:
-            try:
-                bid = ds.get_bid(dt, asset_symbol)
-                if not np.isnan(bid):
-                    return bid
-            except Exception:
-                bid = np.NaN
+        for ds in self.asset_sources.get(asset_symbol, ()):
+            bid = self._get_source_bid(ds, dt, asset_symbol)
+            if not np.isnan(bid):
+                return bid
         return bid
 
     def get_asset_latest_ask_price(self, dt, asset_symbol):
@@ -74,13 +168,10 @@ class BacktestDataHandler(DataHandler):
         """
         # TODO: Check for asset in Universe
         ask = np.NaN
-        for ds in self.data_sources:
-            try:
-                ask = ds.get_ask(dt, asset_symbol)
-                if not np.isnan(ask):
-                    return ask
-            except Exception:
-                ask = np.NaN
+        for ds in self.asset_sources.get(asset_symbol, ()):
+            ask = self._get_source_ask(ds, dt, asset_symbol)
+            if not np.isnan(ask):
+                return ask
         return ask
 
     def get_asset_latest_bid_ask_price(self, dt, asset_symbol):
@@ -106,15 +197,245 @@ class BacktestDataHandler(DataHandler):
             mid = np.NaN
         return mid
 
+    def _get_source_bids_asks(self, ds, dt, asset_symbols):
+        """
+        Obtain the bid and ask prices of multiple assets from a single
+        data source, utilising its batched lookup if available.
+
+        Parameters
+        ----------
+        ds : `DataSource`
+            The data source to obtain prices from.
+        dt : `pd.Timestamp`
+            When to obtain the prices for.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain prices for, all of which
+            are held by the data source.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The bid and ask prices, NaN where unavailable.
+        """
+        if hasattr(ds, 'get_bids_asks'):
+            return ds.get_bids_asks(dt, asset_symbols)
+
+        bids = np.array([
+            self._get_source_bid(ds, dt, asset_symbol)
+            for asset_symbol in asset_symbols
+        ], dtype=np.float64)
+        asks = np.array([
+            self._get_source_ask(ds, dt, asset_symbol)
+            for asset_symbol in asset_symbols
+        ], dtype=np.float64)
+        return bids, asks
+
+    def get_assets_latest_bid_ask_prices(self, dt, asset_symbols):
+        """
+        Obtain the latest bid and ask prices for multiple assets
+        in a single call. Each asset is obtained from its highest
+        priority data source, with lower priority sources only
+        used for assets still lacking a price.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the prices for.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain prices for.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The bid and ask prices, aligned to the provided asset
+            symbols, with NaN where no price is available.
+        """
+        asset_symbols = list(asset_symbols)
+        bids = np.full(len(asset_symbols), np.NaN)
+        asks = np.full(len(asset_symbols), np.NaN)
+        routes = [
+            self.asset_sources.get(asset_symbol, ())
+            for asset_symbol in asset_symbols
+        ]
+        missing = [i for i, route in enumerate(routes) if len(route) > 0]
+
+        priority = 0
+        while len(missing) > 0:
+            # Group the assets still lacking a price by the data
+            # source at the current priority level of their route
+            source_indices = {}
+            for i in missing:
+                if priority < len(routes[i]):
+                    source_indices.setdefault(
+                        id(routes[i][priority]), (routes[i][priority], [])
+                    )[1].append(i)
+
+            missing = []
+            for ds, indices in source_indices.values():
+                indices = np.array(indices)
+                ds_bids, ds_asks = self._get_source_bids_asks(
+                    ds, dt, [asset_symbols[i] for i in indices]
+                )
+                found = ~np.isnan(ds_bids)
+                bids[indices[found]] = ds_bids[found]
+                asks[indices[found]] = ds_asks[found]
+                missing.extend(indices[~found])
+            priority += 1
+        return bids, asks
+
+    def get_assets_latest_mid_prices(self, dt, asset_symbols):
+        """
+        Obtain the latest mid prices for multiple assets
+        in a single call.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the prices for.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The mid prices, aligned to the provided asset symbols,
+            with NaN where no price is available.
+        """
+        bids, asks = self.get_assets_latest_bid_ask_prices(dt, asset_symbols)
+        return (bids + asks) / 2.0
+
+    def _get_source_historical_bids_asks(self, ds, dts, asset_symbols):
+        """
+        Obtain the bid and ask prices of multiple assets at multiple
+        timestamps from a single data source, utilising its batched
+        historical lookup if available.
+
+        Parameters
+        ----------
+        ds : `DataSource`
+            The data source to obtain prices from.
+        dts : `list[pd.Timestamp]`
+            When to obtain the prices for.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain prices for, all of which
+            are held by the data source.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The (timestamp x asset) bid and ask prices.
+        """
+        if hasattr(ds, 'get_historical_bids_asks'):
+            return ds.get_historical_bids_asks(dts, asset_symbols)
+
+        bids = np.full((len(dts), len(asset_symbols)), np.NaN)
+        asks = np.full((len(dts), len(asset_symbols)), np.NaN)
+        for row, dt in enumerate(dts):
+            bids[row], asks[row] = self._get_source_bids_asks(
+                ds, dt, asset_symbols
+            )
+        return bids, asks
+
+    def get_assets_historical_mid_prices(self, dts, asset_symbols):
+        """
+        Obtain the mid prices of multiple assets at each of multiple
+        timestamps, matching the values that would be obtained from
+        'get_assets_latest_mid_prices' at each timestamp.
+
+        Parameters
+        ----------
+        dts : `list[pd.Timestamp]`
+            When to obtain the prices for.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (timestamp x asset) mid prices, with NaN where
+            no price is available.
+        """
+        asset_symbols = list(asset_symbols)
+        bids = np.full((len(dts), len(asset_symbols)), np.NaN)
+        asks = np.full((len(dts), len(asset_symbols)), np.NaN)
+        routes = [
+            self.asset_sources.get(asset_symbol, ())
+            for asset_symbol in asset_symbols
+        ]
+
+        # Fill the prices from the data sources in priority order,
+        # with lower priority sources only used where prices are
+        # still missing
+        max_priority = max([len(route) for route in routes], default=0)
+        for priority in range(max_priority):
+            source_indices = {}
+            for i, route in enumerate(routes):
+                if priority < len(route):
+                    source_indices.setdefault(
+                        id(route[priority]), (route[priority], [])
+                    )[1].append(i)
+
+            for ds, indices in source_indices.values():
+                ds_bids, ds_asks = self._get_source_historical_bids_asks(
+                    ds, dts, [asset_symbols[i] for i in indices]
+                )
+                missing = np.isnan(bids[:, indices])
+                bids[:, indices] = np.where(missing, ds_bids, bids[:, indices])
+                asks[:, indices] = np.where(missing, ds_asks, asks[:, indices])
+        return (bids + asks) / 2.0
+
     def get_assets_historical_range_close_price(self, start_dt, end_dt, asset_symbols, adjusted=False):
         """
+        Obtain a multi-asset historical range of closing prices, with
+        each asset obtained from its highest priority data source.
+
+        Parameters
+        ----------
+        start_dt : `pd.Timestamp`
+            The starting datetime of the range to obtain.
+        end_dt : `pd.Timestamp`
+            The ending datetime of the range to obtain.
+        asset_symbols : `list[str]`
+            The asset symbols to obtain closing prices for.
+        adjusted : `Boolean`, optional
+            Whether to obtain the corporate-action adjusted closing
+            prices. Defaults to False.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The multi-asset closing prices DataFrame, or None if
+            there are no data sources.
         """
-        prices_df = None
-        for ds in self.data_sources:
-            try:
-                prices_df = ds.get_assets_historical_closes(start_dt, end_dt, asset_symbols, adjusted=adjusted)
-                if prices_df is not None:
-                    return prices_df
-            except Exception:
-                raise
-        return prices_df
+        if not self.data_sources:
+            return None
+
+        source_assets = {}
+        for asset_symbol in asset_symbols:
+            route = self.asset_sources.get(asset_symbol, ())
+            if len(route) > 0:
+                source_assets.setdefault(
+                    id(route[0]), (route[0], [])
+                )[1].append(asset_symbol)
+
+        if len(source_assets) <= 1:
+            ds, assets = next(
+                iter(source_assets.values()),
+                (self.data_sources[0], list(asset_symbols))
+            )
+            return ds.get_assets_historical_closes(
+                start_dt, end_dt, assets, adjusted=adjusted
+            )
+
+        prices_df = pd.concat(
+            [
+                ds.get_assets_historical_closes(
+                    start_dt, end_dt, assets, adjusted=adjusted
+                )
+                for ds, assets in source_assets.values()
+            ],
+            axis=1
+        ).sort_index()
+        return prices_df[
+            [asset for asset in asset_symbols if asset in prices_df.columns]
+        ]
@@ -0,0 +1,213 @@
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from qstrader.data.price_series import BidAskPriceSeries, ClosePriceSeries
+
+
+class PriceSeriesCache(object):
+    """
+    An on-disk cache of the converted bid/ask and closing price
+    arrays of CSV files, stored as one uncompressed NumPy '.npz'
+    file per CSV file alongside a JSON manifest.
+
+    Entries are keyed on the absolute CSV path, the price
+    adjustment flag and the cache format version, and are only
+    considered valid if the CSV modification time and size are
+    unchanged since the entry was written.
+
+    FORMAT_VERSION must be incremented whenever the conversion of
+    CSV files into price series, or the layout of the cached arrays,
+    changes, so that entries written by earlier versions are ignored
+    rather than served as stale prices.
+
+    Parameters
+    ----------
+    cache_dir : `str`
+        The directory in which to store the cached arrays. It is
+        created if it does not already exist.
+    """
+
+    MANIFEST_FILENAME = 'manifest.json'
+    FORMAT_VERSION = 1
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.manifest_path = os.path.join(self.cache_dir, self.MANIFEST_FILENAME)
+        self.manifest = self._read_manifest()
+        self.num_unwritten = 0
+
+    def _read_manifest(self):
+        """
+        Read the cache manifest from disk, treating a missing or
+        unreadable manifest as an empty cache.
+
+        Returns
+        -------
+        `dict{str: dict}`
+            The cache entries keyed by entry name.
+        """
+        try:
+            with open(self.manifest_path, 'r') as manifest_file:
+                return json.load(manifest_file)
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def _entry_name(cls, csv_path, adjust_prices):
+        """
+        Create the cache entry name for a CSV file and price
+        adjustment flag at the current cache format version.
+
+        Parameters
+        ----------
+        csv_path : `str`
+            The absolute path to the CSV file.
+        adjust_prices : `Boolean`
+            Whether the prices were adjusted for corporate actions.
+
+        Returns
+        -------
+        `str`
+            The cache entry name.
+        """
+        key = '%s|%s|%s' % (cls.FORMAT_VERSION, csv_path, bool(adjust_prices))
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _csv_stat(csv_path):
+        """
+        Obtain the modification time and size of a CSV file.
+
+        Parameters
+        ----------
+        csv_path : `str`
+            The absolute path to the CSV file.
+
+        Returns
+        -------
+        `tuple(int, int)`
+            The modification time (nanoseconds) and the size (bytes).
+        """
+        stat = os.stat(csv_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self, csv_path, adjust_prices):
+        """
+        Load the cached price series for a CSV file, if a valid
+        cache entry exists.
+
+        Parameters
+        ----------
+        csv_path : `str`
+            The path to the CSV file.
+        adjust_prices : `Boolean`
+            Whether the prices were adjusted for corporate actions.
+
+        Returns
+        -------
+        `tuple(BidAskPriceSeries, ClosePriceSeries)` or `None`
+            The cached price series, or None if not cached or stale.
+        """
+        csv_path = os.path.abspath(csv_path)
+        name = self._entry_name(csv_path, adjust_prices)
+        entry = self.manifest.get(name)
+        if entry is None:
+            return None
+
+        mtime_ns, size = self._csv_stat(csv_path)
+        if entry['mtime_ns'] != mtime_ns or entry['size'] != size:
+            return None
+
+        try:
+            with np.load(os.path.join(self.cache_dir, entry['filename']), allow_pickle=False) as arrays:
+                bid_ask = BidAskPriceSeries(
+                    arrays['bid_ask_timestamps'], arrays['bids'], arrays['asks']
+                )
+                close = ClosePriceSeries(
+                    arrays['close_timestamps'], arrays['closes'],
+                    arrays['adj_closes'] if 'adj_closes' in arrays.files else None
+                )
+        except (OSError, KeyError, ValueError):
+            return None
+        return bid_ask, close
+
+    def save(self, csv_path, adjust_prices, bid_ask, close):
+        """
+        Store the converted price series of a CSV file in the cache.
+        The manifest is not written until 'write_manifest' is called.
+
+        Parameters
+        ----------
+        csv_path : `str`
+            The path to the CSV file.
+        adjust_prices : `Boolean`
+            Whether the prices were adjusted for corporate actions.
+        bid_ask : `BidAskPriceSeries`
+            The converted bid/ask prices.
+        close : `ClosePriceSeries`
+            The daily closing prices.
+        """
+        csv_path = os.path.abspath(csv_path)
+        name = self._entry_name(csv_path, adjust_prices)
+        filename = '%s.npz' % name
+        mtime_ns, size = self._csv_stat(csv_path)
+
+        arrays = {
+            'bid_ask_timestamps': bid_ask.timestamps,
+            'bids': bid_ask.bids,
+            'asks': bid_ask.asks,
+            'close_timestamps': close.timestamps,
+            'closes': close.closes
+        }
+        if close.adj_closes is not None:
+            arrays['adj_closes'] = close.adj_closes
+
+        # Write to a temporary file first so that a partially
+        # written entry is never visible under its final name
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as tmp_file:
+            np.savez(tmp_file, **arrays)
+        os.replace(tmp_path, os.path.join(self.cache_dir, filename))
+
+        self.manifest[name] = {
+            'csv_path': csv_path,
+            'mtime_ns': mtime_ns,
+            'size': size,
+            'adjust_prices': bool(adjust_prices),
+            'format_version': self.FORMAT_VERSION,
+            'filename': filename
+        }
+        self.num_unwritten += 1
+
+    def write_manifest(self, amortised=False):
+        """
+        Write the cache manifest to disk if any entries have
+        been added since it was last written.
+
+        Entries absent from the written manifest are cache misses
+        rather than errors, so when entries are saved in many small
+        batches, such as by a lazily-loading data source, the
+        manifest can be written in an amortised manner, only once
+        the unwritten entries number at least the written entries.
+        This writes the manifest O(log N) times for N entries.
+
+        Parameters
+        ----------
+        amortised : `Boolean`, optional
+            Whether to defer writing until sufficient entries are
+            unwritten. Defaults to False.
+        """
+        if self.num_unwritten == 0:
+            return
+        if amortised and self.num_unwritten < len(self.manifest) - self.num_unwritten:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w') as tmp_file:
+            json.dump(self.manifest, tmp_file)
+        os.replace(tmp_path, self.manifest_path)
+        self.num_unwritten = 0
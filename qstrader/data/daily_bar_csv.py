@@ -1,21 +1,78 @@
-import functools
+import atexit
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import os
 
 import numpy as np
 import pandas as pd
 import pytz
 from qstrader import settings
+from qstrader.data.cache import PriceSeriesCache
+from qstrader.data.price_series import (
+    BidAskPricePanel, BidAskPriceSeries, ClosePricePanel, ClosePriceSeries
+)
+
+MARKET_OPEN_OFFSET_NS = pd.Timedelta(hours=14, minutes=30).value
+MARKET_CLOSE_OFFSET_NS = pd.Timedelta(hours=21, minutes=0).value
+
+# The data source used to convert CSV files within
+# each worker process of a parallel ingestion
+_csv_converter = None
+
+
+def _init_csv_converter(converter_class, config):
+    """
+    Create the data source used for CSV conversion within a worker
+    process from its parsing configuration alone, so that no loaded
+    prices are transferred to the worker.
+
+    Parameters
+    ----------
+    converter_class : `type`
+        The class of the data source.
+    config : `dict{str: object}`
+        The parsing configuration attributes of the data source.
+    """
+    global _csv_converter
+    _csv_converter = converter_class.__new__(converter_class)
+    _csv_converter.__dict__.update(config)
+
+
+def _convert_csv_file(csv_file):
+    """
+    Convert a single CSV file into price series within
+    a worker process.
+
+    Parameters
+    ----------
+    csv_file : `str`
+        The name of the CSV file.
+
+    Returns
+    -------
+    `tuple(BidAskPriceSeries, ClosePriceSeries)`
+        The bid/ask prices and daily closing prices.
+    """
+    return _csv_converter._convert_csv_into_price_series(csv_file)
+
 
 class DataSource():
     def __init__(self) -> None:
         pass
 
+    def get_assets(self):
+        raise NotImplementedError(
+            "Should implement get_assets()"
+        )
+
 
 class CSVDailyBarDataSource(DataSource):
     """
     Encapsulates loading, preparation and querying of CSV files of
-    daily 'bar' OHLCV data. The CSV files are converted into a intraday
-    timestamped Pandas DataFrame with opening and closing prices.
+    daily 'bar' OHLCV data. The CSV files are converted into intraday
+    timestamped opening and closing prices, stored per asset as
+    contiguous NumPy arrays in order to support fast binary-search
+    lookups of the latest available price.
 
     Optionally utilises adjusted closing prices (if available) to
     adjust both the close and open.
@@ -34,16 +91,61 @@ class CSVDailyBarDataSource(DataSource):
         An optional list of CSV symbols to restrict the data source to.
         The alternative is to convert all CSVs found within the
         provided directory.
+    cache_dir : `str`, optional
+        An optional directory in which to cache the converted price
+        arrays of each CSV file. Unchanged CSV files are subsequently
+        loaded from the cache rather than being re-parsed.
+    max_workers : `int`, optional
+        The number of worker processes used to parse and convert the
+        CSV files in parallel. Defaults to None, i.e. serial loading.
+    lazy : `Boolean`, optional
+        Whether to defer loading the CSV file of a symbol until its
+        prices are first requested. Defaults to False, i.e. all CSV
+        files are loaded upon construction.
+    max_loaded_symbols : `int`, optional
+        In lazy mode, the maximum number of symbols to keep loaded.
+        The least recently requested symbols are evicted beyond this
+        limit and are reloaded if subsequently requested. Defaults to
+        None, i.e. no eviction.
     """
 
-    def __init__(self, csv_dir, asset_type, adjust_prices=True, csv_symbols=None):
+    # The attributes required to parse and convert a CSV file,
+    # which are the only ones passed to worker processes
+    CONVERTER_ATTRIBUTES = ('csv_dir', 'asset_type', 'adjust_prices')
+
+    # The minimum number of CSV files per worker process, below
+    # which loading is carried out serially, as the start-up cost
+    # of the worker processes outweighs that of the conversion
+    MIN_FILES_PER_WORKER = 2
+
+    def __init__(
+        self, csv_dir, asset_type, adjust_prices=True,
+        csv_symbols=None, cache_dir=None, max_workers=None,
+        lazy=False, max_loaded_symbols=None
+    ):
         self.csv_dir = csv_dir
         self.asset_type = asset_type
         self.adjust_prices = adjust_prices
         self.csv_symbols = csv_symbols
-
-        self.asset_bar_frames = self._load_csvs_into_dfs()
-        self.asset_bid_ask_frames = self._convert_bars_into_bid_ask_dfs()
+        self.max_workers = max_workers
+        self.lazy = lazy
+        self.max_loaded_symbols = max_loaded_symbols
+        self.cache = PriceSeriesCache(cache_dir) if cache_dir is not None else None
+        if self.lazy and self.cache is not None:
+            # Write any manifest entries deferred by lazy loading
+            atexit.register(self.cache.write_manifest)
+
+        if self.lazy:
+            self.asset_bid_ask_prices = OrderedDict()
+            self.asset_close_prices = OrderedDict()
+            self.unavailable_assets = set()
+        else:
+            (
+                self.asset_bid_ask_prices,
+                self.asset_close_prices
+            ) = self._load_csvs_into_price_series()
+        self.bid_ask_panel = None
+        self.close_panel = None
 
     def _obtain_asset_csv_files(self):
         """
@@ -102,38 +204,15 @@ class CSVDailyBarDataSource(DataSource):
         csv_df = csv_df.set_index(csv_df.index.tz_localize(pytz.UTC))
         return csv_df
 
-    def _load_csvs_into_dfs(self):
+    def _convert_bar_frame_into_bid_ask_prices(self, bar_df):
         """
-        Load all CSVs in the CSV directory into Pandas DataFrames.
+        Converts the DataFrame from daily OHLCV 'bars' into arrays
+        of individually-timestamped open and closing prices.
 
-        Returns
-        -------
-        `dict{pd.DataFrame}`
-            The asset-symbol keyed dictionary of Pandas DataFrames
-            containing the timestamped price/volume data.
-        """
-        if settings.PRINT_EVENTS:
-            print("Loading CSV files into DataFrames...")
-        if self.csv_symbols is not None:
-            # TODO/NOTE: This assumes existence of CSV symbols
-            # within the provided directory.
-            csv_files = ['%s.csv' % symbol for symbol in self.csv_symbols]
-        else:
-            csv_files = self._obtain_asset_csv_files()
-
-        asset_frames = {}
-        for csv_file in csv_files:
-            asset_symbol = self._obtain_asset_symbol_from_filename(csv_file)
-            if settings.PRINT_EVENTS:
-                print("Loading CSV file for symbol '%s'..." % asset_symbol)
-            csv_df = self._load_csv_into_df(csv_file)
-            asset_frames[asset_symbol] = csv_df
-        return asset_frames
-
-    def _convert_bar_frame_into_bid_ask_df(self, bar_df):
-        """
-        Converts the DataFrame from daily OHLCV 'bars' into a DataFrame
-        of open and closing price timestamps.
+        The opening and closing prices are interleaved into
+        preallocated arrays, timestamped at 14:30 and 21:00 UTC
+        respectively. Missing prices are forward-filled from the
+        previous open or close.
 
         Optionally adjusts the open/close prices for corporate actions
         using any provided 'Adjusted Close' column.
@@ -145,11 +224,13 @@ class CSVDailyBarDataSource(DataSource):
 
         Returns
         -------
-        `pd.DataFrame`
+        `BidAskPriceSeries`
             The individually-timestamped open/closing prices, optionally
             adjusted for corporate actions.
         """
         bar_df = bar_df.sort_index()
+        opens = bar_df['Open'].to_numpy(dtype=np.float64)
+        closes = bar_df['Close'].to_numpy(dtype=np.float64)
         if self.adjust_prices:
             if 'Adj Close' not in bar_df.columns:
                 raise ValueError(
@@ -157,51 +238,363 @@ class CSVDailyBarDataSource(DataSource):
                     "Prices cannot be adjusted. Exiting."
                 )
 
-            # Restrict solely to the open/closing prices
-            oc_df = bar_df.loc[:, ['Open', 'Close', 'Adj Close']]
-
             # Adjust opening prices
-            oc_df['Adj Open'] = (oc_df['Adj Close'] / oc_df['Close']) * oc_df['Open']
-            oc_df = oc_df.loc[:, ['Adj Open', 'Adj Close']]
-            oc_df.columns = ['Open', 'Close']
+            adj_closes = bar_df['Adj Close'].to_numpy(dtype=np.float64)
+            opens = (adj_closes / closes) * opens
+            closes = adj_closes
+
+        # Interleave the open/close prices into separate
+        # appropriately timestamped rows
+        dates = bar_df.index.asi8
+        timestamps = np.empty(2 * len(dates), dtype=np.int64)
+        timestamps[0::2] = dates + MARKET_OPEN_OFFSET_NS
+        timestamps[1::2] = dates + MARKET_CLOSE_OFFSET_NS
+        prices = np.empty(2 * len(dates), dtype=np.float64)
+        prices[0::2] = opens
+        prices[1::2] = closes
+
+        # Duplicated dates can leave the interleaved rows unsorted
+        if np.any(timestamps[1:] < timestamps[:-1]):
+            order = np.argsort(timestamps, kind='stable')
+            timestamps = timestamps[order]
+            prices = prices[order]
+
+        # Forward-fill any missing prices
+        missing = np.isnan(prices)
+        if missing.any():
+            fill_idx = np.where(missing, 0, np.arange(len(prices)))
+            np.maximum.accumulate(fill_idx, out=fill_idx)
+            prices = prices[fill_idx]
+
+        # TODO: Unable to distinguish between Bid/Ask, implement later
+        return BidAskPriceSeries(timestamps, prices, prices)
+
+    def _convert_csv_into_price_series(self, csv_file):
+        """
+        Load a CSV file of daily OHLCV 'bars' and convert it into
+        array-backed individually-timestamped open/closing prices
+        along with the daily closing prices.
+
+        Parameters
+        ----------
+        csv_file : `str`
+            The name of the CSV file.
+
+        Returns
+        -------
+        `tuple(BidAskPriceSeries, ClosePriceSeries)`
+            The bid/ask prices and daily closing prices.
+        """
+        bar_df = self._load_csv_into_df(csv_file)
+        bid_ask = self._convert_bar_frame_into_bid_ask_prices(bar_df)
+        close = ClosePriceSeries.from_frame(bar_df)
+        return bid_ask, close
+
+    def _load_csvs_into_price_series(self):
+        """
+        Load all CSVs in the CSV directory (or those restricted to
+        the provided CSV symbols) into array-backed price series,
+        utilising the cache if one has been provided.
+
+        Returns
+        -------
+        `tuple(dict{BidAskPriceSeries}, dict{ClosePriceSeries})`
+            The asset-symbol keyed dictionaries of bid/ask prices
+            and daily closing prices.
+        """
+        if settings.PRINT_EVENTS:
+            print("Loading CSV files into price series...")
+        if self.csv_symbols is not None:
+            # TODO/NOTE: This assumes existence of CSV symbols
+            # within the provided directory.
+            csv_files = ['%s.csv' % symbol for symbol in self.csv_symbols]
         else:
-            oc_df = bar_df.loc[:, ['Open', 'Close']]
+            csv_files = self._obtain_asset_csv_files()
+        return self._load_csv_files_into_price_series(csv_files)
 
-        # Convert bars into separate rows for open/close prices
-        # appropriately timestamped
-        seq_oc_df = oc_df.T.unstack(level=0).reset_index()
-        seq_oc_df.columns = ['Date', 'Market', 'Price']
-        seq_oc_df.loc[seq_oc_df['Market'] == 'Open', 'Date'] += pd.Timedelta(hours=14, minutes=30)
-        seq_oc_df.loc[seq_oc_df['Market'] == 'Close', 'Date'] += pd.Timedelta(hours=21, minutes=00)
+    def _load_csv_files_into_price_series(self, csv_files):
+        """
+        Load the provided CSV files into array-backed price series,
+        utilising the cache if one has been provided.
 
-        # TODO: Unable to distinguish between Bid/Ask, implement later
-        dp_df = seq_oc_df[['Date', 'Price']]
-        dp_df['Bid'] = dp_df['Price']
-        dp_df['Ask'] = dp_df['Price']
-        dp_df = dp_df.loc[:, ['Date', 'Bid', 'Ask']].fillna(method='ffill').set_index('Date').sort_index()
-        return dp_df
+        Parameters
+        ----------
+        csv_files : `list[str]`
+            The names of the CSV files.
 
-    def _convert_bars_into_bid_ask_dfs(self):
+        Returns
+        -------
+        `tuple(dict{BidAskPriceSeries}, dict{ClosePriceSeries})`
+            The asset-symbol keyed dictionaries of bid/ask prices
+            and daily closing prices.
+        """
+        # Obtain any unchanged price series from the cache
+        cached_series = {}
+        if self.cache is not None:
+            for csv_file in csv_files:
+                price_series = self.cache.load(
+                    os.path.join(self.csv_dir, csv_file), self.adjust_prices
+                )
+                if price_series is not None:
+                    cached_series[csv_file] = price_series
+
+        # Parse and convert the remaining CSV files
+        uncached_files = [
+            csv_file for csv_file in csv_files if csv_file not in cached_series
+        ]
+        converted_series = dict(
+            zip(uncached_files, self._convert_csvs_into_price_series(uncached_files))
+        )
+        if self.cache is not None:
+            for csv_file, price_series in converted_series.items():
+                self.cache.save(
+                    os.path.join(self.csv_dir, csv_file),
+                    self.adjust_prices, *price_series
+                )
+            # Lazy loading saves entries in many small batches
+            self.cache.write_manifest(amortised=self.lazy)
+
+        asset_bid_ask_prices = {}
+        asset_close_prices = {}
+        for csv_file in csv_files:
+            asset_symbol = self._obtain_asset_symbol_from_filename(csv_file)
+            if csv_file in cached_series:
+                if settings.PRINT_EVENTS:
+                    print("Loaded cached prices for symbol '%s'..." % asset_symbol)
+                price_series = cached_series[csv_file]
+            else:
+                price_series = converted_series[csv_file]
+            asset_bid_ask_prices[asset_symbol] = price_series[0]
+            asset_close_prices[asset_symbol] = price_series[1]
+        return asset_bid_ask_prices, asset_close_prices
+
+    def _convert_csvs_into_price_series(self, csv_files):
         """
-        Convert all of the daily OHLCV 'bar' based DataFrames into
-        individually-timestamped open/closing price DataFrames.
+        Parse and convert multiple CSV files into price series,
+        either serially or across a pool of worker processes if
+        'max_workers' has been set and there are sufficient files,
+        such as for a small batch of lazily loaded symbols. Workers
+        only receive the parsing configuration and only the compact
+        price arrays are returned from them.
+
+        Parameters
+        ----------
+        csv_files : `list[str]`
+            The names of the CSV files.
 
         Returns
         -------
-        `dict{pd.DataFrame}`
-            The converted DataFrames.
+        `list[tuple(BidAskPriceSeries, ClosePriceSeries)]`
+            The bid/ask and daily closing prices, in the same
+            order as the provided CSV files.
         """
+        num_workers = min(
+            self.max_workers if self.max_workers is not None else 1,
+            len(csv_files) // self.MIN_FILES_PER_WORKER
+        )
+        if num_workers <= 1:
+            all_price_series = []
+            for csv_file in csv_files:
+                if settings.PRINT_EVENTS:
+                    print(
+                        "Loading and adjusting CSV file for symbol "
+                        "'%s'..." % self._obtain_asset_symbol_from_filename(csv_file)
+                    )
+                all_price_series.append(self._convert_csv_into_price_series(csv_file))
+            return all_price_series
+
         if settings.PRINT_EVENTS:
-            print("Adjusting pricing in CSV files...")
-        asset_bid_ask_frames = {}
-        for asset_symbol, bar_df in self.asset_bar_frames.items():
-            if settings.PRINT_EVENTS:
-                print("Adjusting CSV file for symbol '%s'..." % asset_symbol)
-            asset_bid_ask_frames[asset_symbol] = \
-                self._convert_bar_frame_into_bid_ask_df(bar_df)
-        return asset_bid_ask_frames
-
-    @functools.lru_cache(maxsize=1024 * 1024)
+            print(
+                "Loading and adjusting %s CSV files with %s worker "
+                "processes..." % (len(csv_files), num_workers)
+            )
+
+        chunksize = max(1, len(csv_files) // (4 * num_workers))
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_csv_converter,
+            initargs=(type(self), self._obtain_converter_config())
+        ) as executor:
+            return list(
+                executor.map(_convert_csv_file, csv_files, chunksize=chunksize)
+            )
+
+    def _obtain_converter_config(self):
+        """
+        Obtain the parsing configuration passed to worker processes,
+        excluding any loaded prices, panels and the cache.
+
+        Returns
+        -------
+        `dict{str: object}`
+            The parsing configuration attributes.
+        """
+        return {name: getattr(self, name) for name in self.CONVERTER_ATTRIBUTES}
+
+    def _obtain_csv_filename_from_asset_symbol(self, asset):
+        """
+        Return the CSV filename for a QSTrader asset symbol, which
+        is the inverse of '_obtain_asset_symbol_from_filename'.
+
+        TODO: Remove hardcoding to Equity asset types.
+
+        Parameters
+        ----------
+        asset : `str`
+            The QSTrader symbology of the asset. e.g. 'EQ:SPY'.
+
+        Returns
+        -------
+        `str` or `None`
+            The name of the CSV file, or None if the symbol is not
+            an Equity symbol.
+        """
+        if not asset.startswith('EQ:'):
+            return None
+        return '%s.csv' % asset[len('EQ:'):]
+
+    def _is_asset_csv_available(self, asset, csv_file):
+        """
+        Determine whether a CSV file for the asset can be loaded,
+        respecting any restriction to the provided CSV symbols.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol.
+        csv_file : `str` or `None`
+            The name of the CSV file for the asset.
+
+        Returns
+        -------
+        `Boolean`
+            Whether the CSV file can be loaded.
+        """
+        if csv_file is None:
+            return False
+        if self.csv_symbols is not None and asset[len('EQ:'):] not in self.csv_symbols:
+            return False
+        return os.path.isfile(os.path.join(self.csv_dir, csv_file))
+
+    def _ensure_assets_loaded(self, assets):
+        """
+        In lazy mode, load the CSV files of any provided assets that
+        are not yet loaded and mark all provided assets as recently
+        used, evicting the least recently used assets if the number of
+        loaded symbols exceeds 'max_loaded_symbols'.
+
+        Assets without an available CSV file are ignored, so that
+        subsequent lookups behave as for an unknown asset.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbols about to be queried.
+        """
+        if not self.lazy:
+            return
+
+        csv_files = []
+        for asset in assets:
+            if asset in self.asset_bid_ask_prices:
+                self.asset_bid_ask_prices.move_to_end(asset)
+                self.asset_close_prices.move_to_end(asset)
+            elif asset not in self.unavailable_assets:
+                csv_file = self._obtain_csv_filename_from_asset_symbol(asset)
+                if self._is_asset_csv_available(asset, csv_file):
+                    csv_files.append(csv_file)
+                else:
+                    self.unavailable_assets.add(asset)
+
+        if len(csv_files) == 0:
+            return
+
+        bid_ask_prices, close_prices = self._load_csv_files_into_price_series(
+            list(OrderedDict.fromkeys(csv_files))
+        )
+        self.asset_bid_ask_prices.update(bid_ask_prices)
+        self.asset_close_prices.update(close_prices)
+
+        if self.max_loaded_symbols is not None:
+            requested = set(assets)
+            evictable = [
+                asset for asset in self.asset_bid_ask_prices
+                if asset not in requested
+            ]
+            num_evict = len(self.asset_bid_ask_prices) - self.max_loaded_symbols
+            for asset in evictable[:max(num_evict, 0)]:
+                if settings.PRINT_EVENTS:
+                    print("Evicting prices for symbol '%s'..." % asset)
+                del self.asset_bid_ask_prices[asset]
+                del self.asset_close_prices[asset]
+
+        self._update_panels(bid_ask_prices, close_prices)
+
+    def _update_panels(self, bid_ask_prices, close_prices):
+        """
+        In lazy mode, update any existing price panels in place once
+        symbols have been loaded or evicted, removing the columns of
+        the evicted symbols and appending those of the newly loaded
+        symbols, rather than rebuilding the panels.
+
+        Parameters
+        ----------
+        bid_ask_prices : `dict{str: BidAskPriceSeries}`
+            The bid/ask price series of the newly loaded symbols.
+        close_prices : `dict{str: ClosePriceSeries}`
+            The close price series of the newly loaded symbols.
+        """
+        for panel, loaded, asset_series in [
+            (self.bid_ask_panel, self.asset_bid_ask_prices, bid_ask_prices),
+            (self.close_panel, self.asset_close_prices, close_prices)
+        ]:
+            if panel is None:
+                continue
+            panel.update_assets(
+                [asset for asset in panel.assets if asset not in loaded],
+                {
+                    asset: series for asset, series in asset_series.items()
+                    if asset in loaded and asset not in panel.asset_columns
+                }
+            )
+
+    def get_assets(self):
+        """
+        Obtain the asset symbols that this data source can provide
+        prices for. In lazy mode this includes symbols whose CSV
+        files have not yet been loaded.
+
+        Returns
+        -------
+        `list[str]`
+            The asset symbols available within the data source.
+        """
+        if not self.lazy:
+            return list(self.asset_bid_ask_prices.keys())
+        assets = []
+        for csv_file in sorted(self._obtain_asset_csv_files()):
+            asset = self._obtain_asset_symbol_from_filename(csv_file)
+            if self._is_asset_csv_available(asset, csv_file):
+                assets.append(asset)
+        return assets
+
+    def get_price_series(self, asset):
+        """
+        Obtain the array-backed bid/ask price series of an asset.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol to obtain the price series for.
+
+        Returns
+        -------
+        `BidAskPriceSeries`
+            The timestamped bid/ask prices.
+        """
+        self._ensure_assets_loaded([asset])
+        return self.asset_bid_ask_prices[asset]
+
     def get_bid(self, dt, asset):
         """
         Obtain the bid price of an asset at the provided timestamp.
@@ -216,16 +609,11 @@ class CSVDailyBarDataSource(DataSource):
         Returns
         -------
         `float`
-            The bid price.
+            The bid price, or NaN if prior to the first price.
         """
-        bid_ask_df = self.asset_bid_ask_frames[asset]
-        try:
-            bid = bid_ask_df.iloc[bid_ask_df.index.get_loc(dt, method='pad')]['Bid']
-        except KeyError:  # Before start date
-            return np.NaN
-        return bid
+        self._ensure_assets_loaded([asset])
+        return self.asset_bid_ask_prices[asset].get_bid(dt)
 
-    @functools.lru_cache(maxsize=1024 * 1024)
     def get_ask(self, dt, asset):
         """
         Obtain the ask price of an asset at the provided timestamp.
@@ -240,20 +628,95 @@ class CSVDailyBarDataSource(DataSource):
         Returns
         -------
         `float`
-            The ask price.
+            The ask price, or NaN if prior to the first price.
+        """
+        self._ensure_assets_loaded([asset])
+        return self.asset_bid_ask_prices[asset].get_ask(dt)
+
+    def get_bid_ask_panel(self):
+        """
+        Obtain the date-aligned bid/ask price panel of all (loaded)
+        assets, creating it on first usage. In lazy mode the panel
+        is updated with the columns of any further symbols loaded.
+
+        Returns
+        -------
+        `BidAskPricePanel`
+            The (timestamp x asset) bid/ask price panel.
+        """
+        if self.bid_ask_panel is None:
+            self.bid_ask_panel = BidAskPricePanel.from_series(
+                self.asset_bid_ask_prices
+            )
+        return self.bid_ask_panel
+
+    def get_bids_asks(self, dt, assets):
+        """
+        Obtain the bid and ask prices of multiple assets at the
+        provided timestamp. Assets not present in the data source,
+        or without a price yet, are given NaN prices.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the prices for.
+        assets : `list[str]`
+            The asset symbols to obtain prices for.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The bid and ask prices, aligned to the provided assets.
+        """
+        self._ensure_assets_loaded(assets)
+        return self.get_bid_ask_panel().get_bids_asks(dt, assets)
+
+    def get_historical_bids_asks(self, dts, assets):
+        """
+        Obtain the bid and ask prices of multiple assets at each of
+        multiple timestamps. Assets not present in the data source,
+        or without a price yet, are given NaN prices.
+
+        Parameters
+        ----------
+        dts : `list[pd.Timestamp]` or `pd.DatetimeIndex`
+            When to obtain the prices for.
+        assets : `list[str]`
+            The asset symbols to obtain prices for.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The (timestamp x asset) bid and ask prices.
         """
-        bid_ask_df = self.asset_bid_ask_frames[asset]
-        try:
-            ask = bid_ask_df.iloc[bid_ask_df.index.get_loc(dt, method='pad')]['Ask']
-        except KeyError:  # Before start date
-            return np.NaN
-        return ask
+        self._ensure_assets_loaded(assets)
+        return self.get_bid_ask_panel().get_historical_bids_asks(dts, assets)
 
-    def get_assets_historical_closes(self, start_dt, end_dt, assets):
+    def get_close_panel(self):
+        """
+        Obtain the date-aligned close price panel of all (loaded)
+        assets, creating it on first usage. In lazy mode the panel
+        is updated with the columns of any further symbols loaded.
+
+        Returns
+        -------
+        `ClosePricePanel`
+            The (date x asset) close price panel.
+        """
+        if self.close_panel is None:
+            self.close_panel = ClosePricePanel.from_series(
+                self.asset_close_prices
+            )
+        return self.close_panel
+
+    def get_assets_historical_closes(self, start_dt, end_dt, assets, adjusted=False):
         """
         Obtain a multi-asset historical range of closing prices as a DataFrame,
         indexed by timestamp with asset symbols as columns.
 
+        The prices are obtained from a precomputed date-aligned panel,
+        so contiguous selections of assets are returned without copying.
+
         Parameters
         ----------
         start_dt : `pd.Timestamp`
@@ -262,19 +725,16 @@ class CSVDailyBarDataSource(DataSource):
             The ending datetime of the range to obtain.
         assets : `list[str]`
             The list of asset symbols to obtain closing prices for.
+        adjusted : `Boolean`, optional
+            Whether to obtain the corporate-action adjusted closing
+            prices. Defaults to False.
 
         Returns
         -------
         `pd.DataFrame`
             The multi-asset closing prices DataFrame.
         """
-        close_series = []
-        for asset in assets:
-            if asset in self.asset_bar_frames.keys():
-                asset_close_prices = self.asset_bar_frames[asset][['Close']]
-                asset_close_prices.columns = [asset]
-                close_series.append(asset_close_prices)
-
-        prices_df = pd.concat(close_series, axis=1).dropna(how='all')
-        prices_df = prices_df.loc[start_dt:end_dt]
-        return prices_df
+        self._ensure_assets_loaded(assets)
+        return self.get_close_panel().get_closes(
+            start_dt, end_dt, assets, adjusted=adjusted
+        )
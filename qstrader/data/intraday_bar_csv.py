@@ -0,0 +1,517 @@
+import heapq
+import os
+
+import numpy as np
+import pandas as pd
+
+from qstrader.data.daily_bar_csv import DataSource
+from qstrader.data.price_series import timestamp_to_nanoseconds
+
+
+class IntradayBarStream(object):
+    """
+    Streams the closing prices of a single CSV file of intraday
+    'bar' OHLCV data in time order, reading the file in fixed-size
+    chunks so that only a single chunk is held in memory at a time.
+
+    The CSV file must be sorted by its 'Timestamp' column, with each
+    bar timestamped at its close. Naive timestamps are taken as UTC.
+
+    Latest price lookups advance through the file as the requested
+    timestamps move forward, so sequential lookups are amortised
+    O(1) per bar. A lookup prior to the current chunk rewinds the
+    stream to the start of the file.
+
+    Parameters
+    ----------
+    csv_path : `str`
+        The full path to the CSV file.
+    chunk_size : `int`
+        The number of bars to read per chunk.
+    """
+
+    def __init__(self, csv_path, chunk_size):
+        self.csv_path = csv_path
+        self.chunk_size = chunk_size
+        self._rewind()
+
+    def _rewind(self):
+        """
+        Restart the stream from the beginning of the CSV file.
+        """
+        self.chunks = self._read_chunks()
+        self.timestamps = np.empty(0, dtype=np.int64)
+        self.closes = np.empty(0, dtype=np.float64)
+        self.prev_timestamp = None
+        self.prev_close = np.NaN
+        self.exhausted = False
+
+    def _read_chunks(self):
+        """
+        Read the CSV file in chunks of bars.
+
+        Yields
+        ------
+        `tuple(np.ndarray, np.ndarray)`
+            The int64 nanosecond UTC timestamps and
+            closing prices of each chunk of bars.
+        """
+        reader = pd.read_csv(
+            self.csv_path, usecols=['Timestamp', 'Close'],
+            chunksize=self.chunk_size
+        )
+        for chunk_df in reader:
+            timestamps = pd.to_datetime(chunk_df['Timestamp'], utc=True)
+            yield (
+                timestamps.to_numpy(dtype='datetime64[ns]').view(np.int64),
+                chunk_df['Close'].to_numpy(dtype=np.float64)
+            )
+
+    def _advance(self, ts):
+        """
+        Read further chunks until the current chunk contains the
+        latest bar at or prior to the timestamp, or the file ends.
+
+        Parameters
+        ----------
+        ts : `int`
+            The nanosecond UTC timestamp.
+        """
+        while not self.exhausted and (
+            len(self.timestamps) == 0 or self.timestamps[-1] <= ts
+        ):
+            if len(self.timestamps) > 0:
+                self.prev_timestamp = self.timestamps[-1]
+                self.prev_close = self.closes[-1]
+            try:
+                self.timestamps, self.closes = next(self.chunks)
+            except StopIteration:
+                self.timestamps = np.empty(0, dtype=np.int64)
+                self.closes = np.empty(0, dtype=np.float64)
+                self.exhausted = True
+
+    def get_close(self, dt):
+        """
+        Obtain the closing price of the latest bar at or
+        prior to the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the closing price for.
+
+        Returns
+        -------
+        `float`
+            The closing price, or NaN if prior to the first bar.
+        """
+        ts = timestamp_to_nanoseconds(dt)
+        if self.prev_timestamp is not None and ts < self.prev_timestamp:
+            self._rewind()
+        self._advance(ts)
+        idx = np.searchsorted(self.timestamps, ts, side='right') - 1
+        if idx >= 0:
+            return self.closes[idx]
+        return self.prev_close
+
+
+class CSVIntradayBarDataSource(DataSource):
+    """
+    Encapsulates streaming and querying of CSV files of intraday
+    'bar' OHLCV data, such as minute bars, one file per asset.
+
+    Rather than loading the full history into memory, each CSV file
+    is read in fixed-size chunks as simulation time moves forward,
+    keeping memory usage bounded by the chunk size per asset. The
+    bid and ask prices at any timestamp are given by the closing
+    price of the latest bar, with each bar timestamped at its close.
+    Asset symbols are prefixed with 'EQ:', as for CSVDailyBarDataSource.
+
+    Batched latest price lookups are served from a (timestamp x asset)
+    window of forward-filled closing prices spanning the upcoming bars
+    of every queried asset, so that each lookup is a single binary
+    search and a vectorised gather. The window is rebuilt from the
+    asset streams once simulation time moves beyond it.
+
+    Historical lookups at many timestamps via 'get_historical_bids_asks'
+    read each CSV file once, independently of the latest price streams.
+
+    Parameters
+    ----------
+    csv_dir : `str`
+        The full path to the directory where the CSV is located.
+    asset_type : `str`
+        The asset type that the price/volume data is for.
+    csv_symbols : `list`, optional
+        An optional list of CSV symbols to restrict the data source to.
+        The alternative is to stream all CSVs found within the
+        provided directory.
+    chunk_size : `int`, optional
+        The number of bars to read per chunk. Defaults to 100,000.
+    window_size : `int`, optional
+        The maximum number of timestamps within the window of prices
+        used for batched lookups. Defaults to 1,000.
+    """
+
+    def __init__(
+        self, csv_dir, asset_type, csv_symbols=None,
+        chunk_size=100000, window_size=1000
+    ):
+        self.csv_dir = csv_dir
+        self.asset_type = asset_type
+        self.csv_symbols = csv_symbols
+        self.chunk_size = chunk_size
+        self.window_size = window_size
+        self.asset_csv_files = self._obtain_asset_csv_files()
+        self.asset_streams = {}
+        self.window_assets = []
+        self.window_columns = {}
+        self.window_timestamps = np.empty(0, dtype=np.int64)
+        self.window_prices = np.empty((0, 0), dtype=np.float64)
+        self.window_end = None
+
+    def _obtain_asset_csv_files(self):
+        """
+        Obtain the CSV filename of each asset in the CSV directory,
+        restricted to any provided CSV symbols.
+
+        Returns
+        -------
+        `dict{str: str}`
+            The CSV filenames keyed by asset symbol.
+        """
+        asset_csv_files = {}
+        for csv_file in sorted(os.listdir(self.csv_dir)):
+            if not csv_file.endswith('.csv'):
+                continue
+            symbol = csv_file.replace('.csv', '')
+            if self.csv_symbols is not None and symbol not in self.csv_symbols:
+                continue
+            asset_csv_files['EQ:%s' % symbol] = csv_file
+        return asset_csv_files
+
+    def _obtain_csv_path(self, asset):
+        """
+        Obtain the full path to the CSV file of an asset.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol.
+
+        Returns
+        -------
+        `str`
+            The full path to the CSV file.
+        """
+        return os.path.join(self.csv_dir, self.asset_csv_files[asset])
+
+    def _get_stream(self, asset):
+        """
+        Obtain (creating if necessary) the bar stream of an asset.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol.
+
+        Returns
+        -------
+        `IntradayBarStream`
+            The bar stream of the asset.
+        """
+        stream = self.asset_streams.get(asset)
+        if stream is None:
+            stream = IntradayBarStream(
+                self._obtain_csv_path(asset), self.chunk_size
+            )
+            self.asset_streams[asset] = stream
+        return stream
+
+    def get_assets(self):
+        """
+        Obtain the asset symbols available within the data source.
+
+        Returns
+        -------
+        `list[str]`
+            The asset symbols.
+        """
+        return list(self.asset_csv_files.keys())
+
+    def get_bid(self, dt, asset):
+        """
+        Obtain the bid price of an asset at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the bid price for.
+        asset : `str`
+            The asset symbol to obtain the bid price for.
+
+        Returns
+        -------
+        `float`
+            The bid price, or NaN if prior to the first bar.
+        """
+        return self._get_stream(asset).get_close(dt)
+
+    def get_ask(self, dt, asset):
+        """
+        Obtain the ask price of an asset at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the ask price for.
+        asset : `str`
+            The asset symbol to obtain the ask price for.
+
+        Returns
+        -------
+        `float`
+            The ask price, or NaN if prior to the first bar.
+        """
+        return self._get_stream(asset).get_close(dt)
+
+    def _load_window(self, ts, assets):
+        """
+        Build the window of forward-filled closing prices of the
+        provided assets, starting at the timestamp and ending at the
+        earliest final bar of the current chunks of their streams,
+        beyond which further chunks would be required, or once the
+        window holds 'window_size' timestamps.
+
+        Parameters
+        ----------
+        ts : `int`
+            The nanosecond UTC timestamp at which the window starts.
+        assets : `list[str]`
+            The asset symbols of the window columns.
+        """
+        streams = [self._get_stream(asset) for asset in assets]
+        dt = pd.Timestamp(ts, tz='UTC')
+        for stream in streams:
+            stream.get_close(dt)
+
+        # Once advanced, each unexhausted stream's current chunk ends
+        # after the timestamp and holds all of its bars until then
+        chunk_ends = [stream.timestamps[-1] for stream in streams if not stream.exhausted]
+        window_end = min(chunk_ends) if len(chunk_ends) > 0 else np.iinfo(np.int64).max
+        timestamps = np.unique(np.concatenate(
+            [np.array([ts], dtype=np.int64)] + [
+                stream.timestamps[
+                    np.searchsorted(stream.timestamps, ts, side='right'):
+                    np.searchsorted(stream.timestamps, window_end, side='right')
+                ]
+                for stream in streams
+            ]
+        ))
+        if len(timestamps) > self.window_size:
+            window_end = timestamps[self.window_size] - 1
+            timestamps = timestamps[:self.window_size]
+
+        prices = np.empty((len(timestamps), len(streams)), dtype=np.float64)
+        for col, stream in enumerate(streams):
+            rows = np.searchsorted(stream.timestamps, timestamps, side='right') - 1
+            prices[:, col] = stream.prev_close
+            valid = rows >= 0
+            prices[valid, col] = stream.closes[rows[valid]]
+
+        self.window_assets = list(assets)
+        self.window_columns = {asset: col for col, asset in enumerate(assets)}
+        self.window_timestamps = timestamps
+        self.window_prices = prices
+        self.window_end = window_end
+
+    def get_bids_asks(self, dt, assets):
+        """
+        Obtain the bid and ask prices of multiple assets at the
+        provided timestamp. Assets not present in the data source,
+        or without a price yet, are given NaN prices.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the prices for.
+        assets : `list[str]`
+            The asset symbols to obtain prices for.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The bid and ask prices, aligned to the provided assets.
+        """
+        ts = timestamp_to_nanoseconds(dt)
+        extra_assets = [
+            asset for asset in dict.fromkeys(assets)
+            if asset in self.asset_csv_files and asset not in self.window_columns
+        ]
+        if (
+            len(extra_assets) > 0 or self.window_end is None or
+            ts < self.window_timestamps[0] or ts > self.window_end
+        ):
+            self._load_window(ts, self.window_assets + extra_assets)
+
+        cols = np.fromiter(
+            (self.window_columns.get(asset, -1) for asset in assets),
+            dtype=np.int64, count=len(assets)
+        )
+        row = int(np.searchsorted(self.window_timestamps, ts, side='right')) - 1
+        prices = np.full(len(assets), np.NaN)
+        known = cols >= 0
+        prices[known] = self.window_prices[row, cols[known]]
+        return prices, prices.copy()
+
+    def get_historical_bids_asks(self, dts, assets):
+        """
+        Obtain the bid and ask prices of multiple assets at each of
+        multiple timestamps, reading each CSV file once up to the
+        latest timestamp. Assets not present in the data source, or
+        without a price yet, are given NaN prices.
+
+        Parameters
+        ----------
+        dts : `list[pd.Timestamp]` or `pd.DatetimeIndex`
+            When to obtain the prices for.
+        assets : `list[str]`
+            The asset symbols to obtain prices for.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The (timestamp x asset) bid and ask prices.
+        """
+        timestamps = pd.DatetimeIndex(dts).asi8
+        order = np.argsort(timestamps, kind='stable')
+        sorted_timestamps = timestamps[order]
+        prices = np.full((len(timestamps), len(assets)), np.NaN)
+        if len(timestamps) == 0:
+            return prices, prices.copy()
+
+        end_dt = pd.Timestamp(sorted_timestamps[-1], tz='UTC')
+        for col, asset in enumerate(assets):
+            if asset not in self.asset_csv_files:
+                continue
+            # Chunks are in time order, so the prices of each
+            # chunk supersede those of the chunks before it
+            asset_prices = np.full(len(timestamps), np.NaN)
+            for bar_timestamps, closes in self._read_asset_bars(asset, end_dt=end_dt):
+                rows = np.searchsorted(bar_timestamps, sorted_timestamps, side='right') - 1
+                valid = rows >= 0
+                asset_prices[valid] = closes[rows[valid]]
+            prices[order, col] = asset_prices
+        return prices, prices.copy()
+
+    def _read_asset_bars(self, asset, start_dt=None, end_dt=None):
+        """
+        Read the bars of an asset between two timestamps (inclusive),
+        independently of its latest price stream.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol.
+        start_dt : `pd.Timestamp`, optional
+            The starting timestamp. Defaults to the first bar.
+        end_dt : `pd.Timestamp`, optional
+            The ending timestamp. Defaults to the final bar.
+
+        Yields
+        ------
+        `tuple(np.ndarray, np.ndarray)`
+            The int64 nanosecond UTC timestamps and
+            closing prices of each chunk of bars.
+        """
+        start = timestamp_to_nanoseconds(start_dt) if start_dt is not None else None
+        end = timestamp_to_nanoseconds(end_dt) if end_dt is not None else None
+        chunks = IntradayBarStream(
+            self._obtain_csv_path(asset), self.chunk_size
+        )._read_chunks()
+        for timestamps, closes in chunks:
+            if end is not None and len(timestamps) > 0 and timestamps[0] > end:
+                break
+            selection = np.ones(len(timestamps), dtype=bool)
+            if start is not None:
+                selection &= timestamps >= start
+            if end is not None:
+                selection &= timestamps <= end
+            if selection.any():
+                yield timestamps[selection], closes[selection]
+
+    def stream_bars(self, assets=None, start_dt=None, end_dt=None):
+        """
+        Stream the bars of multiple assets merged into time order,
+        holding only a single chunk per asset in memory.
+
+        Parameters
+        ----------
+        assets : `list[str]`, optional
+            The asset symbols to stream. Defaults to all assets.
+        start_dt : `pd.Timestamp`, optional
+            The starting timestamp. Defaults to the first bar.
+        end_dt : `pd.Timestamp`, optional
+            The ending timestamp. Defaults to the final bar.
+
+        Yields
+        ------
+        `tuple(int, str, float)`
+            The nanosecond UTC timestamp, asset symbol and
+            closing price of each bar.
+        """
+        if assets is None:
+            assets = self.get_assets()
+
+        def asset_bars(asset):
+            for timestamps, closes in self._read_asset_bars(asset, start_dt, end_dt):
+                for ts, close in zip(timestamps.tolist(), closes.tolist()):
+                    yield ts, asset, close
+
+        return heapq.merge(
+            *[asset_bars(asset) for asset in assets], key=lambda bar: bar[0]
+        )
+
+    def get_assets_historical_closes(self, start_dt, end_dt, assets, adjusted=False):
+        """
+        Obtain a multi-asset historical range of bar closing prices as
+        a DataFrame, indexed by timestamp with asset symbols as columns.
+
+        Only the bars within the range are retained while the CSV files
+        are read in chunks. No corporate-action adjustment is available
+        for intraday bars, so 'adjusted' is ignored.
+
+        Parameters
+        ----------
+        start_dt : `pd.Timestamp`
+            The starting datetime of the range to obtain.
+        end_dt : `pd.Timestamp`
+            The ending datetime of the range to obtain.
+        assets : `list[str]`
+            The list of asset symbols to obtain closing prices for.
+        adjusted : `Boolean`, optional
+            Unused, as intraday bars are not adjusted.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The multi-asset closing prices DataFrame.
+        """
+        closes = {}
+        for asset in assets:
+            if asset not in self.asset_csv_files:
+                continue
+            chunks = list(self._read_asset_bars(asset, start_dt, end_dt))
+            timestamps = np.concatenate(
+                [chunk[0] for chunk in chunks] + [np.empty(0, dtype=np.int64)]
+            )
+            prices = np.concatenate(
+                [chunk[1] for chunk in chunks] + [np.empty(0, dtype=np.float64)]
+            )
+            closes[asset] = pd.Series(
+                prices, index=pd.DatetimeIndex(timestamps).tz_localize('UTC')
+            )
+        prices_df = pd.DataFrame(closes).sort_index()
+        return prices_df.reindex(
+            columns=[asset for asset in assets if asset in closes]
+        )
@@ -0,0 +1,915 @@
+import numpy as np
+import pandas as pd
+
+
+def timestamp_to_nanoseconds(dt):
+    """
+    Convert a timestamp into integer nanoseconds since the
+    UNIX epoch (UTC), which is the representation used for
+    the array-backed price lookups.
+
+    Timezone-naive timestamps are assumed to be UTC.
+
+    Parameters
+    ----------
+    dt : `pd.Timestamp` or `datetime.datetime`
+        The timestamp to convert.
+
+    Returns
+    -------
+    `int`
+        The nanoseconds since the epoch.
+    """
+    if not isinstance(dt, pd.Timestamp):
+        dt = pd.Timestamp(dt)
+    return dt.value
+
+
+class BidAskPriceSeries(object):
+    """
+    Array-backed storage of a single asset's timestamped bid/ask
+    prices. Timestamps are held as a sorted contiguous int64 array of
+    UTC nanoseconds with parallel float64 bid and ask arrays, so that
+    the 'latest price as of' lookup is a binary search. Where the bid
+    and ask prices are identical, such as for daily bar data, a single
+    array is shared between them.
+
+    Parameters
+    ----------
+    timestamps : `np.ndarray`
+        Sorted int64 UTC nanosecond timestamps.
+    bids : `np.ndarray`
+        The float64 bid prices aligned to the timestamps.
+    asks : `np.ndarray`
+        The float64 ask prices aligned to the timestamps.
+    """
+
+    def __init__(self, timestamps, bids, asks):
+        self.timestamps = np.ascontiguousarray(timestamps, dtype=np.int64)
+        self.bids = np.ascontiguousarray(bids, dtype=np.float64)
+        self.asks = np.ascontiguousarray(asks, dtype=np.float64)
+        if self.asks is not self.bids and np.array_equal(
+            self.bids, self.asks, equal_nan=True
+        ):
+            self.asks = self.bids
+
+    @classmethod
+    def from_frame(cls, bid_ask_df):
+        """
+        Create the price series from a DataFrame indexed by UTC
+        timestamp with 'Bid' and 'Ask' columns.
+
+        Parameters
+        ----------
+        bid_ask_df : `pd.DataFrame`
+            The timestamp-indexed bid/ask DataFrame.
+
+        Returns
+        -------
+        `BidAskPriceSeries`
+            The array-backed price series.
+        """
+        return cls(
+            bid_ask_df.index.asi8,
+            bid_ask_df['Bid'].to_numpy(),
+            bid_ask_df['Ask'].to_numpy()
+        )
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def index_at(self, ns):
+        """
+        Obtain the row index of the latest price at or prior to
+        the provided nanosecond timestamp.
+
+        Parameters
+        ----------
+        ns : `int`
+            The UTC nanosecond timestamp.
+
+        Returns
+        -------
+        `int`
+            The row index, or -1 if the timestamp precedes all prices.
+        """
+        return int(np.searchsorted(self.timestamps, ns, side='right')) - 1
+
+    def get_bid(self, dt):
+        """
+        Obtain the latest bid price at or prior to the timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the bid price for.
+
+        Returns
+        -------
+        `float`
+            The bid price, or NaN if prior to the first price.
+        """
+        idx = self.index_at(timestamp_to_nanoseconds(dt))
+        if idx < 0:
+            return np.NaN
+        return self.bids[idx]
+
+    def get_ask(self, dt):
+        """
+        Obtain the latest ask price at or prior to the timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the ask price for.
+
+        Returns
+        -------
+        `float`
+            The ask price, or NaN if prior to the first price.
+        """
+        idx = self.index_at(timestamp_to_nanoseconds(dt))
+        if idx < 0:
+            return np.NaN
+        return self.asks[idx]
+
+
+class ClosePriceSeries(object):
+    """
+    Array-backed storage of a single asset's daily closing prices,
+    and optionally its corporate-action adjusted closing prices.
+
+    Parameters
+    ----------
+    timestamps : `np.ndarray`
+        Sorted int64 UTC nanosecond timestamps of the daily bars.
+    closes : `np.ndarray`
+        The float64 closing prices aligned to the timestamps.
+    adj_closes : `np.ndarray`, optional
+        The float64 adjusted closing prices aligned to the timestamps.
+    """
+
+    def __init__(self, timestamps, closes, adj_closes=None):
+        self.timestamps = np.ascontiguousarray(timestamps, dtype=np.int64)
+        self.closes = np.ascontiguousarray(closes, dtype=np.float64)
+        self.adj_closes = (
+            np.ascontiguousarray(adj_closes, dtype=np.float64)
+            if adj_closes is not None else None
+        )
+
+    @classmethod
+    def from_frame(cls, bar_df):
+        """
+        Create the close price series from a daily 'bar' DataFrame
+        indexed by UTC timestamp with a 'Close' and (optionally)
+        an 'Adj Close' column.
+
+        Parameters
+        ----------
+        bar_df : `pd.DataFrame`
+            The daily 'bar' OHLCV DataFrame.
+
+        Returns
+        -------
+        `ClosePriceSeries`
+            The array-backed close price series.
+        """
+        adj_closes = (
+            bar_df['Adj Close'].to_numpy()
+            if 'Adj Close' in bar_df.columns else None
+        )
+        return cls(bar_df.index.asi8, bar_df['Close'].to_numpy(), adj_closes)
+
+    def __len__(self):
+        return len(self.timestamps)
+
+
+class BidAskPriceCursor(object):
+    """
+    A forward-moving row pointer into a BidAskPriceSeries.
+
+    Backtests query prices at monotonically increasing timestamps,
+    so the latest row can usually be found by stepping the pointer
+    forward a small number of rows from its previous position. If the
+    pointer would need to move a long way forward, or if an earlier
+    timestamp is requested, a binary search is used instead.
+
+    Parameters
+    ----------
+    series : `BidAskPriceSeries`
+        The price series to traverse.
+    max_steps : `int`, optional
+        The number of single-row steps to attempt before falling
+        back to a binary search over the remaining rows.
+    """
+
+    def __init__(self, series, max_steps=8):
+        self.series = series
+        self.max_steps = max_steps
+        self.ns = None
+        self.idx = -1
+
+    def seek(self, ns):
+        """
+        Move the cursor to the latest row at or prior to the
+        provided nanosecond timestamp.
+
+        Parameters
+        ----------
+        ns : `int`
+            The UTC nanosecond timestamp.
+
+        Returns
+        -------
+        `int`
+            The row index, or -1 if the timestamp precedes all prices.
+        """
+        if self.ns is None or ns < self.ns:
+            idx = self.series.index_at(ns)
+        else:
+            timestamps = self.series.timestamps
+            last_idx = len(timestamps) - 1
+            idx = self.idx
+            steps = 0
+            while idx < last_idx and timestamps[idx + 1] <= ns:
+                idx += 1
+                steps += 1
+                if steps == self.max_steps:
+                    idx += int(
+                        np.searchsorted(timestamps[idx + 1:], ns, side='right')
+                    )
+                    break
+        self.ns = ns
+        self.idx = idx
+        return idx
+
+    def get_bid(self, dt):
+        """
+        Obtain the latest bid price at or prior to the timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the bid price for.
+
+        Returns
+        -------
+        `float`
+            The bid price, or NaN if prior to the first price.
+        """
+        idx = self.seek(timestamp_to_nanoseconds(dt))
+        if idx < 0:
+            return np.NaN
+        return self.series.bids[idx]
+
+    def get_ask(self, dt):
+        """
+        Obtain the latest ask price at or prior to the timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the ask price for.
+
+        Returns
+        -------
+        `float`
+            The ask price, or NaN if prior to the first price.
+        """
+        idx = self.seek(timestamp_to_nanoseconds(dt))
+        if idx < 0:
+            return np.NaN
+        return self.series.asks[idx]
+
+
+class AssetColumnPanel(object):
+    """
+    Base class for date-aligned (timestamp x asset) price panels,
+    whose asset columns can be removed and appended in place, such
+    as when symbols are lazily loaded and evicted by a data source.
+
+    The matrices, named by MATRIX_NAMES, are stored with spare
+    column capacity, which is doubled once exhausted in the manner
+    of the rows of an ArrayAssetPriceBuffers, so that appending a
+    column is amortised O(T) for T timestamps rather than a copy of
+    the whole panel. Removed columns are replaced by the final
+    column. Matrices shared between names, such as identical bid
+    and ask prices, remain shared where possible.
+
+    Subclasses implement '_fill_matrices' and 'with_assets', the
+    latter being used if appended assets have timestamps that are
+    absent from the panel, requiring further rows.
+    """
+
+    MATRIX_NAMES = ()
+
+    def _attach_matrices(self, matrices):
+        """
+        Store the matrices, which may have spare column capacity,
+        and expose views onto their occupied columns.
+
+        Parameters
+        ----------
+        matrices : `list[np.ndarray]`
+            The matrices, aligned to MATRIX_NAMES.
+        """
+        self.storage = list(matrices)
+        self._update_views()
+
+    def _update_views(self):
+        """
+        Expose views onto the occupied columns of the stored
+        matrices, sharing a single view between shared matrices.
+        """
+        num_assets = len(self.assets)
+        views = {}
+        for name, matrix in zip(self.MATRIX_NAMES, self.storage):
+            view = views.get(id(matrix))
+            if view is None:
+                view = matrix if matrix.shape[1] == num_assets else matrix[:, :num_assets]
+                views[id(matrix)] = view
+            setattr(self, name, view)
+
+    def _unique_storage(self):
+        """
+        Obtain the indices of the distinct stored matrices.
+
+        Returns
+        -------
+        `list[int]`
+            The index of the first occurrence of each matrix.
+        """
+        return [
+            i for i, matrix in enumerate(self.storage)
+            if not any(matrix is other for other in self.storage[:i])
+        ]
+
+    def _remove_asset(self, asset):
+        """
+        Remove the column of an asset by moving the final
+        column into its place.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol to remove.
+        """
+        col = self.asset_columns.pop(asset)
+        last = len(self.assets) - 1
+        if col != last:
+            for i in self._unique_storage():
+                self.storage[i][:, col] = self.storage[i][:, last]
+            moved = self.assets[last]
+            self.assets[col] = moved
+            self.asset_columns[moved] = col
+        self.assets.pop()
+
+    def _append_matrices(self, assets, matrices):
+        """
+        Append columns to the stored matrices, unsharing and
+        growing them as required.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbols of the appended columns.
+        matrices : `list[np.ndarray]`
+            The columns of each matrix, aligned to MATRIX_NAMES.
+        """
+        num_assets = len(self.assets)
+        needed = num_assets + len(assets)
+
+        # A shared matrix can only remain shared if its columns are
+        for i in range(len(self.storage)):
+            for j in range(i):
+                if self.storage[i] is self.storage[j] and matrices[i] is not matrices[j]:
+                    self.storage[i] = self.storage[j].copy()
+
+        capacity = self.storage[0].shape[1]
+        if needed > capacity:
+            capacity = max(needed, 2 * capacity)
+            grown = {}
+            for i, matrix in enumerate(self.storage):
+                if id(matrix) not in grown:
+                    grown[id(matrix)] = np.full((matrix.shape[0], capacity), np.NaN)
+                    grown[id(matrix)][:, :num_assets] = matrix[:, :num_assets]
+                self.storage[i] = grown[id(matrix)]
+        for i in self._unique_storage():
+            self.storage[i][:, num_assets:needed] = matrices[i]
+
+        for asset in assets:
+            self.asset_columns[asset] = len(self.assets)
+            self.assets.append(asset)
+
+    def update_assets(self, removed_assets, asset_series=None):
+        """
+        Remove the columns of the provided assets and append those
+        of any further price series, in place.
+
+        Parameters
+        ----------
+        removed_assets : `list[str]`
+            The asset symbols to remove.
+        asset_series : `dict{str: object}`, optional
+            The asset-symbol keyed price series of further assets.
+        """
+        asset_series = asset_series if asset_series is not None else {}
+        timestamps = np.concatenate(
+            [np.empty(0, dtype=np.int64)] +
+            [series.timestamps for series in asset_series.values()]
+        )
+        if len(np.setdiff1d(timestamps, self.timestamps)) > 0:
+            removed = set(removed_assets)
+            panel = self.with_assets(
+                [asset for asset in self.assets if asset not in removed],
+                asset_series
+            )
+            self.__dict__.update(panel.__dict__)
+            return
+
+        for asset in removed_assets:
+            self._remove_asset(asset)
+        if len(asset_series) > 0:
+            self._append_matrices(
+                list(asset_series.keys()),
+                list(self._fill_matrices(self.timestamps, asset_series))
+            )
+        self._update_views()
+
+
+class BidAskPricePanel(AssetColumnPanel):
+    """
+    Date-aligned (timestamp x asset) matrices of bid/ask prices,
+    forward-filled from each asset's own price series onto the union
+    of all timestamps. Allows the latest prices of many assets to be
+    obtained with a single binary search and a vectorised gather.
+
+    Where every asset shares a single array between its bid and ask
+    prices a single matrix is likewise shared, halving the memory
+    usage. Further assets can be appended, and existing assets removed,
+    in place via 'update_assets'.
+
+    Parameters
+    ----------
+    timestamps : `np.ndarray`
+        Sorted int64 UTC nanosecond timestamps (the panel rows).
+    assets : `list[str]`
+        The asset symbols (the panel columns).
+    bids : `np.ndarray`
+        The float64 (timestamp x asset) bid prices.
+    asks : `np.ndarray`
+        The float64 (timestamp x asset) ask prices.
+    """
+
+    MATRIX_NAMES = ('bids', 'asks')
+
+    def __init__(self, timestamps, assets, bids, asks):
+        self.timestamps = np.ascontiguousarray(timestamps, dtype=np.int64)
+        self.assets = list(assets)
+        self.asset_columns = {
+            asset: col for col, asset in enumerate(self.assets)
+        }
+        self._attach_matrices([bids, asks])
+
+    @classmethod
+    def from_series(cls, asset_series):
+        """
+        Create the panel from a dictionary of per-asset price series.
+        Prices prior to the first timestamp of an asset are NaN.
+
+        Parameters
+        ----------
+        asset_series : `dict{str: BidAskPriceSeries}`
+            The asset-symbol keyed price series.
+
+        Returns
+        -------
+        `BidAskPricePanel`
+            The date-aligned price panel.
+        """
+        assets = list(asset_series.keys())
+        if len(assets) > 0:
+            timestamps = np.unique(
+                np.concatenate([series.timestamps for series in asset_series.values()])
+            )
+        else:
+            timestamps = np.empty(0, dtype=np.int64)
+        bids, asks = cls._fill_matrices(timestamps, asset_series)
+        return cls(timestamps, assets, bids, asks)
+
+    @staticmethod
+    def _fill_matrices(timestamps, asset_series):
+        """
+        Forward-fill the prices of each asset onto the timestamps,
+        sharing a single matrix if every asset shares its bid and
+        ask arrays.
+
+        Parameters
+        ----------
+        timestamps : `np.ndarray`
+            Sorted int64 UTC nanosecond timestamps (the rows).
+        asset_series : `dict{str: BidAskPriceSeries}`
+            The asset-symbol keyed price series (the columns).
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The (timestamp x asset) bid and ask prices.
+        """
+        shared = all(
+            series.asks is series.bids for series in asset_series.values()
+        )
+        bids = np.full((len(timestamps), len(asset_series)), np.NaN)
+        asks = bids if shared else np.full(bids.shape, np.NaN)
+        for col, series in enumerate(asset_series.values()):
+            rows = np.searchsorted(series.timestamps, timestamps, side='right') - 1
+            valid = rows >= 0
+            bids[valid, col] = series.bids[rows[valid]]
+            if not shared:
+                asks[valid, col] = series.asks[rows[valid]]
+        return bids, asks
+
+    def with_assets(self, assets, asset_series=None):
+        """
+        Create a panel restricted to the provided existing assets,
+        with the columns of any further price series appended. The
+        prices of the existing assets are gathered onto any further
+        timestamps with a single vectorised operation, rather than
+        being forward-filled from their price series again.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The existing assets to retain, in column order.
+        asset_series : `dict{str: BidAskPriceSeries}`, optional
+            The asset-symbol keyed price series of further assets.
+
+        Returns
+        -------
+        `BidAskPricePanel`
+            The updated price panel.
+        """
+        asset_series = asset_series if asset_series is not None else {}
+        cols = np.array(
+            [self.asset_columns[asset] for asset in assets], dtype=np.int64
+        )
+        timestamps = np.unique(np.concatenate(
+            [self.timestamps] + [series.timestamps for series in asset_series.values()]
+        ))
+
+        # Existing prices at each timestamp are those of the latest
+        # existing row, as the existing rows are already forward-filled
+        rows = np.searchsorted(self.timestamps, timestamps, side='right') - 1
+        valid = rows >= 0
+        bids = np.full((len(timestamps), len(cols)), np.NaN)
+        bids[valid] = self.bids[np.ix_(rows[valid], cols)]
+        if self.asks is self.bids:
+            asks = bids
+        else:
+            asks = np.full(bids.shape, np.NaN)
+            asks[valid] = self.asks[np.ix_(rows[valid], cols)]
+
+        if len(asset_series) > 0:
+            extra_bids, extra_asks = self._fill_matrices(timestamps, asset_series)
+            if asks is bids and extra_asks is extra_bids:
+                bids = np.hstack([bids, extra_bids])
+                asks = bids
+            else:
+                bids, asks = (
+                    np.hstack([bids, extra_bids]), np.hstack([asks, extra_asks])
+                )
+        return BidAskPricePanel(
+            timestamps, list(assets) + list(asset_series.keys()), bids, asks
+        )
+
+    def index_at(self, ns):
+        """
+        Obtain the row index of the latest prices at or prior to
+        the provided nanosecond timestamp.
+
+        Parameters
+        ----------
+        ns : `int`
+            The UTC nanosecond timestamp.
+
+        Returns
+        -------
+        `int`
+            The row index, or -1 if the timestamp precedes all prices.
+        """
+        return int(np.searchsorted(self.timestamps, ns, side='right')) - 1
+
+    def get_bid(self, dt, asset):
+        """
+        Obtain the latest bid price of an asset at or prior to
+        the timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the bid price for.
+        asset : `str`
+            The asset symbol to obtain the bid price for.
+
+        Returns
+        -------
+        `float`
+            The bid price, or NaN if prior to the first price.
+        """
+        col = self.asset_columns[asset]
+        row = self.index_at(timestamp_to_nanoseconds(dt))
+        if row < 0:
+            return np.NaN
+        return self.bids[row, col]
+
+    def get_ask(self, dt, asset):
+        """
+        Obtain the latest ask price of an asset at or prior to
+        the timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the ask price for.
+        asset : `str`
+            The asset symbol to obtain the ask price for.
+
+        Returns
+        -------
+        `float`
+            The ask price, or NaN if prior to the first price.
+        """
+        col = self.asset_columns[asset]
+        row = self.index_at(timestamp_to_nanoseconds(dt))
+        if row < 0:
+            return np.NaN
+        return self.asks[row, col]
+
+    def get_bids_asks(self, dt, assets):
+        """
+        Obtain the latest bid and ask prices of multiple assets at
+        or prior to the timestamp. Assets not present in the panel,
+        or without a price yet, are given NaN prices.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the prices for.
+        assets : `list[str]`
+            The asset symbols to obtain prices for.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The bid and ask prices, aligned to the provided assets.
+        """
+        cols = np.fromiter(
+            (self.asset_columns.get(asset, -1) for asset in assets),
+            dtype=np.int64, count=len(assets)
+        )
+        bids = np.full(len(assets), np.NaN)
+        asks = np.full(len(assets), np.NaN)
+
+        row = self.index_at(timestamp_to_nanoseconds(dt))
+        if row < 0:
+            return bids, asks
+
+        known = cols >= 0
+        bids[known] = self.bids[row, cols[known]]
+        asks[known] = self.asks[row, cols[known]]
+        return bids, asks
+
+    def get_historical_bids_asks(self, dts, assets):
+        """
+        Obtain the latest bid and ask prices of multiple assets at
+        or prior to each of multiple timestamps. Assets not present
+        in the panel, or without a price yet, are given NaN prices.
+
+        Parameters
+        ----------
+        dts : `list[pd.Timestamp]` or `pd.DatetimeIndex`
+            When to obtain the prices for.
+        assets : `list[str]`
+            The asset symbols to obtain prices for.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The (timestamp x asset) bid and ask prices, aligned to
+            the provided timestamps and assets.
+        """
+        cols = np.fromiter(
+            (self.asset_columns.get(asset, -1) for asset in assets),
+            dtype=np.int64, count=len(assets)
+        )
+        rows = np.searchsorted(
+            self.timestamps, pd.DatetimeIndex(dts).asi8, side='right'
+        ) - 1
+        bids = np.full((len(rows), len(assets)), np.NaN)
+        asks = np.full((len(rows), len(assets)), np.NaN)
+
+        valid = np.ix_(rows >= 0, cols >= 0)
+        selection = np.ix_(rows[rows >= 0], cols[cols >= 0])
+        bids[valid] = self.bids[selection]
+        asks[valid] = self.asks[selection]
+        return bids, asks
+
+
+class ClosePricePanel(AssetColumnPanel):
+    """
+    Date-aligned (date x asset) matrices of daily closing prices and
+    adjusted closing prices, built once from the per-asset close price
+    series. Prices are NaN where an asset has no bar on a date.
+
+    Range queries are resolved to integer row positions with a binary
+    search, so that contiguous selections are returned as views onto
+    the underlying matrices rather than copies. Further assets can be
+    appended, and existing assets removed, in place via 'update_assets'.
+
+    Parameters
+    ----------
+    timestamps : `np.ndarray`
+        Sorted int64 UTC nanosecond timestamps (the panel rows).
+    assets : `list[str]`
+        The asset symbols (the panel columns).
+    closes : `np.ndarray`
+        The float64 (date x asset) closing prices.
+    adj_closes : `np.ndarray`
+        The float64 (date x asset) adjusted closing prices.
+    """
+
+    MATRIX_NAMES = ('closes', 'adj_closes')
+
+    def __init__(self, timestamps, assets, closes, adj_closes):
+        self.timestamps = np.ascontiguousarray(timestamps, dtype=np.int64)
+        self.index = pd.DatetimeIndex(
+            pd.to_datetime(self.timestamps, utc=True), name='Date'
+        )
+        self.assets = list(assets)
+        self.asset_columns = {
+            asset: col for col, asset in enumerate(self.assets)
+        }
+        self._attach_matrices([closes, adj_closes])
+
+    @classmethod
+    def from_series(cls, asset_series):
+        """
+        Create the panel from a dictionary of per-asset close
+        price series, aligned on the union of all dates.
+
+        Parameters
+        ----------
+        asset_series : `dict{str: ClosePriceSeries}`
+            The asset-symbol keyed close price series.
+
+        Returns
+        -------
+        `ClosePricePanel`
+            The date-aligned close price panel.
+        """
+        assets = list(asset_series.keys())
+        if len(assets) > 0:
+            timestamps = np.unique(
+                np.concatenate([series.timestamps for series in asset_series.values()])
+            )
+        else:
+            timestamps = np.empty(0, dtype=np.int64)
+
+        closes, adj_closes = cls._fill_matrices(timestamps, asset_series)
+        return cls(timestamps, assets, closes, adj_closes)
+
+    @staticmethod
+    def _fill_matrices(timestamps, asset_series):
+        """
+        Place the prices of each asset at the rows of its dates.
+
+        Parameters
+        ----------
+        timestamps : `np.ndarray`
+            Sorted int64 UTC nanosecond timestamps (the rows), which
+            include every timestamp of the price series.
+        asset_series : `dict{str: ClosePriceSeries}`
+            The asset-symbol keyed close price series (the columns).
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The (date x asset) closing and adjusted closing prices.
+        """
+        closes = np.full((len(timestamps), len(asset_series)), np.NaN)
+        adj_closes = np.full((len(timestamps), len(asset_series)), np.NaN)
+        for col, series in enumerate(asset_series.values()):
+            rows = np.searchsorted(timestamps, series.timestamps)
+            closes[rows, col] = series.closes
+            if series.adj_closes is not None:
+                adj_closes[rows, col] = series.adj_closes
+        return closes, adj_closes
+
+    def with_assets(self, assets, asset_series=None):
+        """
+        Create a panel restricted to the provided existing assets,
+        with the columns of any further price series appended. The
+        prices of the existing assets are moved onto any further
+        dates with a single vectorised operation.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The existing assets to retain, in column order.
+        asset_series : `dict{str: ClosePriceSeries}`, optional
+            The asset-symbol keyed close price series of further assets.
+
+        Returns
+        -------
+        `ClosePricePanel`
+            The updated close price panel.
+        """
+        asset_series = asset_series if asset_series is not None else {}
+        cols = np.array(
+            [self.asset_columns[asset] for asset in assets], dtype=np.int64
+        )
+        timestamps = np.unique(np.concatenate(
+            [self.timestamps] + [series.timestamps for series in asset_series.values()]
+        ))
+
+        rows = np.searchsorted(timestamps, self.timestamps)
+        closes = np.full((len(timestamps), len(cols)), np.NaN)
+        adj_closes = np.full((len(timestamps), len(cols)), np.NaN)
+        closes[rows] = self.closes[:, cols]
+        adj_closes[rows] = self.adj_closes[:, cols]
+
+        if len(asset_series) > 0:
+            extra_closes, extra_adj_closes = self._fill_matrices(
+                timestamps, asset_series
+            )
+            closes = np.hstack([closes, extra_closes])
+            adj_closes = np.hstack([adj_closes, extra_adj_closes])
+        return ClosePricePanel(
+            timestamps, list(assets) + list(asset_series.keys()),
+            closes, adj_closes
+        )
+
+    def _row_range(self, start_dt, end_dt):
+        """
+        Obtain the (inclusive) range of rows between two timestamps
+        as a slice. A missing start or end leaves that side unbounded.
+        """
+        start = 0
+        end = len(self.timestamps)
+        if start_dt is not None:
+            start = int(np.searchsorted(
+                self.timestamps, timestamp_to_nanoseconds(start_dt), side='left'
+            ))
+        if end_dt is not None:
+            end = int(np.searchsorted(
+                self.timestamps, timestamp_to_nanoseconds(end_dt), side='right'
+            ))
+        return slice(start, max(start, end))
+
+    def _column_selection(self, assets):
+        """
+        Obtain the column selection for the provided assets, as a
+        slice if the columns are contiguous and in panel order, else
+        as an integer index array.
+        """
+        cols = [self.asset_columns[asset] for asset in assets]
+        if len(cols) > 0 and cols == list(range(cols[0], cols[0] + len(cols))):
+            return slice(cols[0], cols[0] + len(cols))
+        return np.array(cols, dtype=np.int64)
+
+    def get_closes(self, start_dt, end_dt, assets, adjusted=False):
+        """
+        Obtain a multi-asset historical range of closing prices as a
+        DataFrame, indexed by timestamp with asset symbols as columns.
+
+        Assets not present in the panel are omitted and dates without
+        a price for any of the requested assets are dropped.
+
+        Parameters
+        ----------
+        start_dt : `pd.Timestamp`
+            The starting datetime of the range to obtain.
+        end_dt : `pd.Timestamp`
+            The ending datetime of the range to obtain.
+        assets : `list[str]`
+            The list of asset symbols to obtain closing prices for.
+        adjusted : `Boolean`, optional
+            Whether to obtain the adjusted closing prices.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The multi-asset closing prices DataFrame.
+        """
+        assets = [asset for asset in assets if asset in self.asset_columns]
+        rows = self._row_range(start_dt, end_dt)
+        prices = self.adj_closes if adjusted else self.closes
+        values = prices[rows, self._column_selection(assets)]
+        index = self.index[rows]
+
+        # Drop dates on which none of the requested assets have a price
+        has_price = ~np.all(np.isnan(values), axis=1)
+        if not has_price.all():
+            values = values[has_price]
+            index = index[has_price]
+        return pd.DataFrame(values, index=index, columns=assets, copy=False)
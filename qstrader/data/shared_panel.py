@@ -0,0 +1,263 @@
+import json
+import os
+
+import numpy as np
+
+from qstrader.data.daily_bar_csv import DataSource
+from qstrader.data.price_series import BidAskPricePanel, ClosePricePanel
+
+
+MANIFEST_FILENAME = 'manifest.json'
+
+
+def publish_shared_panels(data_source, shared_dir):
+    """
+    Publish the bid/ask and close price panels of a loaded data source
+    as NumPy '.npy' files, so that they can be memory-mapped read-only
+    by other processes via a SharedPanelDataSource.
+
+    As the operating system shares the pages of a memory-mapped file
+    between processes, any number of worker processes attached to the
+    published panels use a single copy of the price data.
+
+    For a lazily-loading data source only the currently loaded
+    symbols are published.
+
+    Parameters
+    ----------
+    data_source : `CSVDailyBarDataSource`
+        The loaded data source to publish.
+    shared_dir : `str`
+        The directory to write the panels to. It is created if it
+        does not already exist.
+    """
+    os.makedirs(shared_dir, exist_ok=True)
+    bid_ask_panel = data_source.get_bid_ask_panel()
+    close_panel = data_source.get_close_panel()
+
+    # A single matrix shared between the bid and ask prices
+    # is only published once
+    shared_bid_ask = bid_ask_panel.asks is bid_ask_panel.bids
+    arrays = {
+        'bid_ask_timestamps': bid_ask_panel.timestamps,
+        'bids': bid_ask_panel.bids,
+        'close_timestamps': close_panel.timestamps,
+        'closes': close_panel.closes,
+        'adj_closes': close_panel.adj_closes
+    }
+    if not shared_bid_ask:
+        arrays['asks'] = bid_ask_panel.asks
+    for name, array in arrays.items():
+        np.save(
+            os.path.join(shared_dir, '%s.npy' % name),
+            np.ascontiguousarray(array),
+            allow_pickle=False
+        )
+
+    # The manifest is written last, so that its presence
+    # signifies a completely published set of panels
+    with open(os.path.join(shared_dir, MANIFEST_FILENAME), 'w') as manifest_file:
+        json.dump(
+            {
+                'bid_ask_assets': bid_ask_panel.assets,
+                'close_assets': close_panel.assets,
+                'shared_bid_ask': shared_bid_ask
+            },
+            manifest_file
+        )
+
+
+class SharedPanelDataSource(DataSource):
+    """
+    A read-only data source that attaches to price panels previously
+    published with 'publish_shared_panels', memory-mapping the panel
+    arrays rather than loading or copying them.
+
+    Intended for multi-process parameter sweeps, where each worker
+    process creates its own SharedPanelDataSource onto a single set of
+    panels published by the parent process.
+
+    Parameters
+    ----------
+    shared_dir : `str`
+        The directory containing the published panels.
+    """
+
+    def __init__(self, shared_dir):
+        self.shared_dir = shared_dir
+        manifest_path = os.path.join(self.shared_dir, MANIFEST_FILENAME)
+        if not os.path.isfile(manifest_path):
+            raise ValueError(
+                "Unable to locate published price panels in directory "
+                "'%s'. Cannot create SharedPanelDataSource." % self.shared_dir
+            )
+        with open(manifest_path, 'r') as manifest_file:
+            manifest = json.load(manifest_file)
+
+        bids = self._attach_array('bids')
+        self.bid_ask_panel = BidAskPricePanel(
+            self._attach_array('bid_ask_timestamps'),
+            manifest['bid_ask_assets'],
+            bids,
+            bids if manifest.get('shared_bid_ask') else self._attach_array('asks')
+        )
+        self.close_panel = ClosePricePanel(
+            self._attach_array('close_timestamps'),
+            manifest['close_assets'],
+            self._attach_array('closes'),
+            self._attach_array('adj_closes')
+        )
+
+    def _attach_array(self, name):
+        """
+        Memory-map a published panel array read-only.
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the published array.
+
+        Returns
+        -------
+        `np.memmap`
+            The read-only memory-mapped array.
+        """
+        return np.load(
+            os.path.join(self.shared_dir, '%s.npy' % name),
+            mmap_mode='r', allow_pickle=False
+        )
+
+    def get_assets(self):
+        """
+        Obtain the asset symbols present within the attached panels.
+
+        Returns
+        -------
+        `list[str]`
+            The asset symbols available within the data source.
+        """
+        return list(self.bid_ask_panel.assets)
+
+    def get_bid_ask_panel(self):
+        """
+        Obtain the attached date-aligned bid/ask price panel.
+
+        Returns
+        -------
+        `BidAskPricePanel`
+            The (timestamp x asset) bid/ask price panel.
+        """
+        return self.bid_ask_panel
+
+    def get_close_panel(self):
+        """
+        Obtain the attached date-aligned close price panel.
+
+        Returns
+        -------
+        `ClosePricePanel`
+            The (date x asset) close price panel.
+        """
+        return self.close_panel
+
+    def get_bid(self, dt, asset):
+        """
+        Obtain the bid price of an asset at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the bid price for.
+        asset : `str`
+            The asset symbol to obtain the bid price for.
+
+        Returns
+        -------
+        `float`
+            The bid price, or NaN if prior to the first price.
+        """
+        return self.bid_ask_panel.get_bid(dt, asset)
+
+    def get_ask(self, dt, asset):
+        """
+        Obtain the ask price of an asset at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the ask price for.
+        asset : `str`
+            The asset symbol to obtain the ask price for.
+
+        Returns
+        -------
+        `float`
+            The ask price, or NaN if prior to the first price.
+        """
+        return self.bid_ask_panel.get_ask(dt, asset)
+
+    def get_bids_asks(self, dt, assets):
+        """
+        Obtain the bid and ask prices of multiple assets at the
+        provided timestamp. Assets not present in the panel,
+        or without a price yet, are given NaN prices.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the prices for.
+        assets : `list[str]`
+            The asset symbols to obtain prices for.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The bid and ask prices, aligned to the provided assets.
+        """
+        return self.bid_ask_panel.get_bids_asks(dt, assets)
+
+    def get_historical_bids_asks(self, dts, assets):
+        """
+        Obtain the bid and ask prices of multiple assets at each of
+        multiple timestamps. Assets not present in the panel, or
+        without a price yet, are given NaN prices.
+
+        Parameters
+        ----------
+        dts : `list[pd.Timestamp]` or `pd.DatetimeIndex`
+            When to obtain the prices for.
+        assets : `list[str]`
+            The asset symbols to obtain prices for.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The (timestamp x asset) bid and ask prices.
+        """
+        return self.bid_ask_panel.get_historical_bids_asks(dts, assets)
+
+    def get_assets_historical_closes(self, start_dt, end_dt, assets, adjusted=False):
+        """
+        Obtain a multi-asset historical range of closing prices as a DataFrame,
+        indexed by timestamp with asset symbols as columns.
+
+        Parameters
+        ----------
+        start_dt : `pd.Timestamp`
+            The starting datetime of the range to obtain.
+        end_dt : `pd.Timestamp`
+            The ending datetime of the range to obtain.
+        assets : `list[str]`
+            The list of asset symbols to obtain closing prices for.
+        adjusted : `Boolean`, optional
+            Whether to obtain the corporate-action adjusted closing
+            prices. Defaults to False.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The multi-asset closing prices DataFrame.
+        """
+        return self.close_panel.get_closes(
+            start_dt, end_dt, assets, adjusted=adjusted
+        )
@@ -1,6 +1,7 @@
 import datetime
 
 from qstrader.exchange.exchange import Exchange
+from qstrader.exchange.trading_calendar import TradingCalendar
 
 
 class SimulatedExchange(Exchange):
@@ -16,10 +17,14 @@ class SimulatedExchange(Exchange):
     ----------
     start_dt : `pd.Timestamp`
         The starting time of the simulated exchange.
+    calendar : `TradingCalendar`, optional
+        The calendar of trading days, which should be shared with
+        the simulation engine. Defaults to every weekday.
     """
 
-    def __init__(self, start_dt):
+    def __init__(self, start_dt, calendar=None):
         self.start_dt = start_dt
+        self.calendar = calendar if calendar is not None else TradingCalendar()
 
         # TODO: Eliminate hardcoding of NYSE
         # TODO: Make these timezone-aware
@@ -32,10 +37,8 @@ class SimulatedExchange(Exchange):
         provided pandas Timestamp.
 
         This logic is simplistic in that it only checks whether
-        the provided time is between market hours on a weekday.
-
-        There is no historical calendar handling or concept of
-        exchange holidays.
+        the provided time is between market hours on a trading
+        day of the exchange calendar.
 
         Parameters
         ----------
@@ -47,6 +50,6 @@ class SimulatedExchange(Exchange):
         `Boolean`
             Whether the exchange is open at this timestamp.
         """
-        if dt.weekday() > 4:
+        if not self.calendar.is_trading_day(dt):
             return False
         return self.open_dt <= dt.time() and dt.time() < self.close_dt
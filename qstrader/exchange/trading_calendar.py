@@ -0,0 +1,226 @@
+import numpy as np
+import pandas as pd
+from pandas.tseries.holiday import (
+    GoodFriday,
+    Holiday,
+    USLaborDay,
+    USMemorialDay,
+    USPresidentsDay,
+    USThanksgivingDay,
+    nearest_workday,
+    sunday_to_monday
+)
+from pandas.tseries.offsets import DateOffset
+from dateutil.relativedelta import MO
+
+
+NYSE_HOLIDAY_RULES = [
+    # A New Year's Day falling on a Saturday is not observed
+    Holiday("New Year's Day", month=1, day=1, observance=sunday_to_monday),
+    Holiday(
+        'Martin Luther King Jr. Day', start_date='1998-01-01',
+        month=1, day=1, offset=DateOffset(weekday=MO(3))
+    ),
+    USPresidentsDay,
+    GoodFriday,
+    USMemorialDay,
+    Holiday(
+        'Juneteenth', start_date='2022-01-01',
+        month=6, day=19, observance=nearest_workday
+    ),
+    Holiday('Independence Day', month=7, day=4, observance=nearest_workday),
+    USLaborDay,
+    USThanksgivingDay,
+    Holiday('Christmas Day', month=12, day=25, observance=nearest_workday)
+]
+
+NYSE_SPECIAL_CLOSURES = [
+    '1994-04-27',  # National day of mourning for Richard Nixon
+    '2001-09-11',  # September 11 attacks
+    '2001-09-12',
+    '2001-09-13',
+    '2001-09-14',
+    '2004-06-11',  # National day of mourning for Ronald Reagan
+    '2007-01-02',  # National day of mourning for Gerald Ford
+    '2012-10-29',  # Hurricane Sandy
+    '2012-10-30',
+    '2018-12-05',  # National day of mourning for George H. W. Bush
+    '2025-01-09'   # National day of mourning for Jimmy Carter
+]
+
+
+class TradingCalendar(object):
+    """
+    A rule-based calendar of the days on which an exchange trades,
+    being the weekdays (Monday-Friday) that are not holidays.
+
+    Holidays are generated offline from pandas Holiday rules, along
+    with any additional one-off closures, and are cached per year.
+    Without any rules or closures every weekday is a trading day.
+
+    The calendar date of a timestamp is used to determine whether
+    it lies on a trading day, irrespective of its timezone.
+
+    Parameters
+    ----------
+    rules : `list[Holiday]`, optional
+        The pandas Holiday rules generating the recurring holidays.
+    closures : `list[str]`, optional
+        The dates of any additional one-off closures.
+    """
+
+    def __init__(self, rules=None, closures=None):
+        self.rules = list(rules) if rules is not None else []
+        self.closures = pd.DatetimeIndex(
+            closures if closures is not None else []
+        )
+        self.year_holidays = {}
+
+    def _obtain_year_holidays(self, start_year, end_year):
+        """
+        Obtain the holidays of a range of years, generating those
+        of any years not yet cached with a single pass of each rule.
+
+        Parameters
+        ----------
+        start_year : `int`
+            The first calendar year.
+        end_year : `int`
+            The last calendar year (inclusive).
+
+        Returns
+        -------
+        `np.ndarray`
+            The sorted int64 nanosecond timestamps (midnight)
+            of the holidays.
+        """
+        missing = [
+            year for year in range(start_year, end_year + 1)
+            if year not in self.year_holidays
+        ]
+        if len(missing) > 0:
+            start = pd.Timestamp(min(missing), 1, 1)
+            end = pd.Timestamp(max(missing), 12, 31)
+            dates = [rule.dates(start, end) for rule in self.rules]
+            dates.append(
+                self.closures[(self.closures >= start) & (self.closures <= end)]
+            )
+            holidays = np.unique(
+                np.concatenate(
+                    [pd.DatetimeIndex(d).asi8 for d in dates]
+                ).astype(np.int64)
+            )
+            years = pd.DatetimeIndex(holidays).year
+            for year in range(min(missing), max(missing) + 1):
+                self.year_holidays[year] = holidays[years == year]
+
+        return np.concatenate(
+            [self.year_holidays[year] for year in range(start_year, end_year + 1)]
+        )
+
+    def holidays(self, start_dt, end_dt):
+        """
+        Obtain the holidays between two timestamps (inclusive).
+
+        Parameters
+        ----------
+        start_dt : `pd.Timestamp`
+            The starting timestamp.
+        end_dt : `pd.Timestamp`
+            The ending timestamp.
+
+        Returns
+        -------
+        `pd.DatetimeIndex`
+            The (timezone-naive) dates of the holidays.
+        """
+        start = _calendar_date(start_dt)
+        end = _calendar_date(end_dt)
+        if end < start:
+            return pd.DatetimeIndex([])
+        holidays = pd.DatetimeIndex(
+            self._obtain_year_holidays(start.year, end.year)
+        )
+        return holidays[(holidays >= start) & (holidays <= end)]
+
+    def is_trading_day(self, dt):
+        """
+        Check whether a timestamp lies on a trading day.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp to check.
+
+        Returns
+        -------
+        `Boolean`
+            Whether the timestamp lies on a trading day.
+        """
+        if dt.weekday() > 4:
+            return False
+        if len(self.rules) == 0 and len(self.closures) == 0:
+            return True
+        date = _calendar_date(dt)
+        holidays = self.year_holidays.get(date.year)
+        if holidays is None:
+            holidays = self._obtain_year_holidays(date.year, date.year)
+        idx = np.searchsorted(holidays, date.value)
+        return idx == len(holidays) or holidays[idx] != date.value
+
+    def trading_day_mask(self, days):
+        """
+        Determine which of multiple timestamps lie on trading days.
+
+        Parameters
+        ----------
+        days : `pd.DatetimeIndex`
+            The timestamps to check.
+
+        Returns
+        -------
+        `np.ndarray`
+            The boolean mask of timestamps lying on trading days.
+        """
+        days = pd.DatetimeIndex(days)
+        mask = np.asarray(days.dayofweek < 5)
+        if len(days) == 0 or (len(self.rules) == 0 and len(self.closures) == 0):
+            return mask
+        if days.tz is not None:
+            days = days.tz_localize(None)
+        dates = days.normalize()
+        holidays = self.holidays(dates.min(), dates.max())
+        return mask & ~np.isin(dates.asi8, holidays.asi8)
+
+
+class NYSETradingCalendar(TradingCalendar):
+    """
+    The trading calendar of the New York Stock Exchange, generated
+    offline from its recurring holiday rules and the one-off
+    closures since 1990.
+    """
+
+    def __init__(self):
+        super().__init__(
+            rules=NYSE_HOLIDAY_RULES, closures=NYSE_SPECIAL_CLOSURES
+        )
+
+
+def _calendar_date(dt):
+    """
+    Obtain the timezone-naive calendar date (midnight) of a timestamp.
+
+    Parameters
+    ----------
+    dt : `pd.Timestamp`
+        The timestamp.
+
+    Returns
+    -------
+    `pd.Timestamp`
+        The calendar date of the timestamp.
+    """
+    dt = pd.Timestamp(dt)
+    if dt.tz is not None:
+        dt = dt.tz_localize(None)
+    return dt.normalize()
@@ -146,8 +146,14 @@ class DollarWeightedCashBufferedOrderSizer(OrderSizer):
         # Ensure weight vector sums to unity
         normalised_weights = self._normalise_weights(weights)
 
+        # Obtain all of the latest asset prices in a single lookup
+        sorted_weights = sorted(normalised_weights.items())
+        _, asset_prices = self.data_handler.get_assets_latest_bid_ask_prices(
+            dt, [asset for asset, _ in sorted_weights]
+        )
+
         target_portfolio = {}
-        for asset, weight in sorted(normalised_weights.items()):
+        for (asset, weight), asset_price in zip(sorted_weights, asset_prices):
             pre_cost_dollar_weight = cash_buffered_total_equity * weight
 
             # Estimate broker fees for this asset
@@ -158,10 +164,6 @@ class DollarWeightedCashBufferedOrderSizer(OrderSizer):
 
             # Calculate integral target asset quantity assuming broker costs
             after_cost_dollar_weight = pre_cost_dollar_weight - est_costs
-            asset_price = self.data_handler.get_asset_latest_ask_price(
-                dt, asset
-            )
-
             if np.isnan(asset_price):
                 raise ValueError(
                     'Asset price for "%s" at timestamp "%s" is Not-a-Number (NaN). '
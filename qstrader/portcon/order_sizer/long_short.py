@@ -131,8 +131,14 @@ class LongShortLeveragedOrderSizer(OrderSizer):
         # Scale weights to take into account gross exposure and leverage
         normalised_weights = self._normalise_weights(weights)
 
+        # Obtain all of the latest asset prices in a single lookup
+        sorted_weights = sorted(normalised_weights.items())
+        _, asset_prices = self.data_handler.get_assets_latest_bid_ask_prices(
+            dt, [asset for asset, _ in sorted_weights]
+        )
+
         target_portfolio = {}
-        for asset, weight in sorted(normalised_weights.items()):
+        for (asset, weight), asset_price in zip(sorted_weights, asset_prices):
             pre_cost_dollar_weight = total_equity * weight
 
             # Estimate broker fees for this asset
@@ -143,10 +149,6 @@ class LongShortLeveragedOrderSizer(OrderSizer):
 
             # Calculate integral target asset quantity assuming broker costs
             after_cost_dollar_weight = pre_cost_dollar_weight - est_costs
-            asset_price = self.data_handler.get_asset_latest_ask_price(
-                dt, asset
-            )
-
             if np.isnan(asset_price):
                 raise ValueError(
                     'Asset price for "%s" at timestamp "%s" is Not-a-Number (NaN). '
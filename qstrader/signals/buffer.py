@@ -1,4 +1,26 @@
 from collections import deque
+from itertools import islice
+
+import numpy as np
+
+
+def _check_lookback(lookback, max_lookback):
+    """
+    Ensure a requested lookback period can be served
+    by a price buffer.
+
+    Parameters
+    ----------
+    lookback : `int`
+        The requested lookback period.
+    max_lookback : `int`
+        The largest lookback period of the buffer.
+    """
+    if lookback > max_lookback:
+        raise ValueError(
+            'Unable to obtain a window of %s prices from a '
+            'price buffer of %s prices.' % (lookback, max_lookback)
+        )
 
 
 class AssetPriceBuffers(object):
@@ -7,6 +29,10 @@ class AssetPriceBuffers(object):
     based price buffers for usage in lookback-based
     indicator calculations.
 
+    A single deque of the largest lookback period is stored
+    per asset, with shorter lookback periods served as the
+    most recent prices of this deque.
+
     Parameters
     ----------
     assets : `list[str]`
@@ -18,59 +44,232 @@ class AssetPriceBuffers(object):
     def __init__(self, assets, lookbacks=[12]):
         self.assets = assets
         self.lookbacks = lookbacks
+        self.max_lookback = max(lookbacks)
         self.prices = self._create_all_assets_prices_buffer_dict()
+        self.counts = {}
+
+    def _create_all_assets_prices_buffer_dict(self):
+        """
+        Creates a dictionary of price buffers for all assets.
+
+        Returns
+        -------
+        `dict{str: deque[float]}`
+            The price buffer dictionary.
+        """
+        return {
+            asset: deque(maxlen=self.max_lookback)
+            for asset in self.assets
+        }
+
+    def add_asset(self, asset):
+        """
+        Add an asset to the list of current assets. This is necessary if
+        the asset is part of a DynamicUniverse and isn't present at
+        the beginning of a backtest.
 
-    @staticmethod
-    def _asset_lookback_key(asset, lookback):
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
         """
-        Create the buffer dictionary lookup key based
-        on asset name and lookback period.
+        if asset in self.assets:
+            raise ValueError(
+                'Unable to add asset "%s" since it already '
+                'exists in this price buffer.' % asset
+            )
+        else:
+            self.prices[asset] = deque(maxlen=self.max_lookback)
+
+    def append(self, asset, price):
+        """
+        Append a new price onto the price deque for
+        the specific asset provided.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        price : `float`
+            The new price of the asset.
+        """
+        if price <= 0.0:
+            raise ValueError(
+                'Unable to append non-positive price of "%0.2f" '
+                'to metrics buffer for Asset "%s".' % (price, asset)
+            )
+
+        # The asset may have been added to the universe subsequent
+        # to the beginning of the backtest and as such needs a
+        # newly created pricing buffer
+        if asset not in self.prices:
+            self.prices[asset] = deque(maxlen=self.max_lookback)
+        self.prices[asset].append(price)
+        self.counts[asset] = self.counts.get(asset, 0) + 1
+
+    def append_prices(self, assets, prices):
+        """
+        Append a new price onto the price deques for
+        each of the provided assets.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        prices : `list[float]` or `np.ndarray`
+            The new prices of the assets.
+        """
+        for asset, price in zip(assets, prices):
+            self.append(asset, price)
+
+    def count(self, asset):
+        """
+        Obtain the total number of prices appended for an
+        asset, including those no longer in the buffer.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+
+        Returns
+        -------
+        `int`
+            The number of prices appended.
+        """
+        return self.counts.get(asset, 0)
+
+    def window(self, asset, lookback):
+        """
+        Obtain the most recent prices of an asset for a
+        lookback period, in chronological order.
 
         Parameters
         ----------
         asset : `str`
             The asset symbol name.
         lookback : `int`
-            The lookback period.
+            The lookback period, which must not exceed the
+            largest lookback of the buffer.
 
         Returns
         -------
-        `str`
-            The lookup key.
+        `np.ndarray`
+            The (up to) 'lookback' most recent prices.
         """
-        return '%s_%s' % (asset, lookback)
+        _check_lookback(lookback, self.max_lookback)
+        prices = self.prices[asset]
+        return np.fromiter(
+            islice(prices, max(len(prices) - lookback, 0), None),
+            dtype=np.float64
+        )
 
-    def _create_single_asset_prices_buffer_dict(self, asset):
+    def windows(self, assets, lookback):
         """
-        Creates a dictionary of asset-lookback pair
-        price buffers for a single asset.
+        Obtain the most recent prices of multiple assets for a
+        lookback period, in chronological order, as a matrix. Assets
+        with fewer than 'lookback' prices are padded at the start
+        with NaN.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        lookback : `int`
+            The lookback period, which must not exceed the
+            largest lookback of the buffer.
 
         Returns
         -------
-        `dict{str: deque[float]}`
-            The price buffer dictionary.
+        `np.ndarray`
+            The (n_assets x lookback) matrix of recent prices.
         """
-        return {
-            AssetPriceBuffers._asset_lookback_key(
-                asset, lookback
-            ): deque(maxlen=lookback)
-            for lookback in self.lookbacks
-        }
+        windows = np.full((len(assets), lookback), np.NaN)
+        for row, asset in enumerate(assets):
+            window = self.window(asset, lookback)
+            windows[row, lookback - len(window):] = window
+        return windows
 
-    def _create_all_assets_prices_buffer_dict(self):
+
+class ArrayAssetPriceBuffers(object):
+    """
+    Array-backed alternative to AssetPriceBuffers, which stores the
+    prices of all assets in a single (n_assets x max_lookback) NumPy
+    ring buffer, with one row per asset and a per-asset write cursor.
+
+    Each ring buffer row is stored twice side-by-side, so that the
+    most recent prices of any lookback period are always a contiguous
+    slice of the row, which is returned as a view without copying.
+
+    Parameters
+    ----------
+    assets : `list[str]`
+        The list of assets to create price buffers for.
+    lookbacks : `list[int]`, optional
+        The number of lookback periods to store prices for.
+    """
+
+    def __init__(self, assets, lookbacks=[12]):
+        self.assets = assets
+        self.lookbacks = lookbacks
+        self.max_lookback = max(lookbacks)
+        self.asset_rows = {}
+        self.prices = np.full(
+            (max(len(assets), 1), 2 * self.max_lookback), np.NaN
+        )
+        self.counts = np.zeros(self.prices.shape[0], dtype=np.int64)
+        for asset in assets:
+            self._create_asset_row(asset)
+
+    def _create_asset_row(self, asset):
+        """
+        Assign a ring buffer row to an asset, doubling the
+        capacity of the ring buffer if it is full.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+
+        Returns
+        -------
+        `int`
+            The ring buffer row of the asset.
+        """
+        row = len(self.asset_rows)
+        if row == self.prices.shape[0]:
+            self.prices = np.vstack(
+                [self.prices, np.full(self.prices.shape, np.NaN)]
+            )
+            self.counts = np.concatenate(
+                [self.counts, np.zeros(len(self.counts), dtype=np.int64)]
+            )
+        self.asset_rows[asset] = row
+        return row
+
+    def _obtain_asset_rows(self, assets):
         """
-        Creates a dictionary of asset-lookback pair
-        price buffers for all assets.
+        Obtain the ring buffer rows of the provided assets, creating
+        rows for any assets that do not yet have one.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
 
         Returns
         -------
-        `dict{str: deque[float]}`
-            The price buffer dictionary.
+        `np.ndarray`
+            The ring buffer rows of the assets.
         """
-        prices = {}
-        for asset in self.assets:
-            prices.update(self._create_single_asset_prices_buffer_dict(asset))
-        return prices
+        return np.array(
+            [
+                self.asset_rows[asset] if asset in self.asset_rows
+                else self._create_asset_row(asset)
+                for asset in assets
+            ],
+            dtype=np.int64
+        )
 
     def add_asset(self, asset):
         """
@@ -83,17 +282,17 @@ class AssetPriceBuffers(object):
         asset : `str`
             The asset symbol name.
         """
-        if asset in self.assets:
+        if asset in self.asset_rows:
             raise ValueError(
                 'Unable to add asset "%s" since it already '
                 'exists in this price buffer.' % asset
             )
         else:
-            self.prices.update(self._create_single_asset_prices_buffer_dict(asset))
+            self._create_asset_row(asset)
 
     def append(self, asset, price):
         """
-        Append a new price onto the price deque for
+        Append a new price onto the ring buffer for
         the specific asset provided.
 
         Parameters
@@ -103,22 +302,109 @@ class AssetPriceBuffers(object):
         price : `float`
             The new price of the asset.
         """
-        if price <= 0.0:
+        self.append_prices([asset], [price])
+
+    def append_prices(self, assets, prices):
+        """
+        Append a new price for each of the provided assets onto
+        the ring buffer, as a single vectorised write.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The unique asset symbol names.
+        prices : `list[float]` or `np.ndarray`
+            The new prices of the assets.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        non_positive = np.flatnonzero(prices <= 0.0)
+        if len(non_positive) > 0:
             raise ValueError(
                 'Unable to append non-positive price of "%0.2f" '
-                'to metrics buffer for Asset "%s".' % (price, asset)
+                'to metrics buffer for Asset "%s".' % (
+                    prices[non_positive[0]], assets[non_positive[0]]
+                )
             )
 
         # The asset may have been added to the universe subsequent
         # to the beginning of the backtest and as such needs a
-        # newly created pricing buffer
-        asset_lookback_key = AssetPriceBuffers._asset_lookback_key(asset, self.lookbacks[0])
-        if asset_lookback_key not in self.prices:
-            self.prices.update(self._create_single_asset_prices_buffer_dict(asset))
-
-        for lookback in self.lookbacks:
-            self.prices[
-                AssetPriceBuffers._asset_lookback_key(
-                    asset, lookback
-                )
-            ].append(price)
+        # newly created ring buffer row
+        rows = self._obtain_asset_rows(assets)
+        cols = self.counts[rows] % self.max_lookback
+        self.prices[rows, cols] = prices
+        self.prices[rows, cols + self.max_lookback] = prices
+        self.counts[rows] += 1
+
+    def count(self, asset):
+        """
+        Obtain the total number of prices appended for an
+        asset, including those no longer in the buffer.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+
+        Returns
+        -------
+        `int`
+            The number of prices appended.
+        """
+        row = self.asset_rows.get(asset)
+        if row is None:
+            return 0
+        return int(self.counts[row])
+
+    def window(self, asset, lookback):
+        """
+        Obtain the most recent prices of an asset for a lookback
+        period, in chronological order, as a view onto the ring
+        buffer. The view is only valid until the next append.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        lookback : `int`
+            The lookback period, which must not exceed the
+            largest lookback of the buffer.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (up to) 'lookback' most recent prices.
+        """
+        _check_lookback(lookback, self.max_lookback)
+        row = self.asset_rows[asset]
+        num_prices = min(lookback, self.counts[row])
+        end = self.counts[row] % self.max_lookback + self.max_lookback
+        return self.prices[row, end - num_prices:end]
+
+    def windows(self, assets, lookback):
+        """
+        Obtain the most recent prices of multiple assets for a
+        lookback period, in chronological order, as a matrix. Assets
+        with fewer than 'lookback' prices are padded at the start
+        with NaN.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        lookback : `int`
+            The lookback period, which must not exceed the largest
+            lookback of the buffer.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (n_assets x lookback) matrix of recent prices.
+        """
+        _check_lookback(lookback, self.max_lookback)
+        rows = np.array([self.asset_rows[asset] for asset in assets], dtype=np.int64)
+        counts = self.counts[rows]
+        ends = counts % self.max_lookback + self.max_lookback
+        cols = ends[:, np.newaxis] + np.arange(-lookback, 0)
+        windows = self.prices[rows[:, np.newaxis], cols]
+        windows[np.arange(-lookback, 0) < -counts[:, np.newaxis]] = np.NaN
+        return windows
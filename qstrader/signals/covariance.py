@@ -0,0 +1,188 @@
+import numpy as np
+
+from qstrader.signals.rolling import RollingCovariance
+from qstrader.signals.signal import Signal
+
+
+class CovarianceSignal(Signal):
+    """
+    Indicator class to calculate the lookback-period (population)
+    covariance and correlation matrices of the daily returns of
+    all assets in the universe.
+
+    Running sums of returns and return cross-products are kept for
+    each lookback and updated as each row of prices is appended, in
+    O(N^2) for N assets, so that each query returns the current
+    matrix without rescanning the lookback window. Prices should
+    therefore be appended for all assets at once via 'append_prices',
+    as is carried out by a SignalsCollection. The signal does not
+    implement 'precompute', so a SignalsCollection containing it
+    raises a ValueError if precomputed, while warm-starting is
+    supported.
+
+    Missing prices are forward-filled, giving a zero return, as are
+    the returns of an asset prior to its first price.
+
+    Parameters
+    ----------
+    start_dt : `pd.Timestamp`
+        The starting datetime (UTC) of the signal.
+    universe : `Universe`
+        The universe of assets to calculate the signals for.
+    lookbacks : `list[int]`
+        The number of returns in each lookback period.
+    array_buffers : `Boolean`, optional
+        Whether to store prices in a single NumPy ring buffer rather
+        than in per-asset deques. Defaults to False.
+    recompute_interval : `int`, optional
+        The number of returns after which the running sums are
+        recomputed exactly. Defaults to the largest lookback.
+    """
+
+    def __init__(
+        self, start_dt, universe, lookbacks,
+        array_buffers=False, recompute_interval=None
+    ):
+        # The running sums are updated as each row of prices is
+        # appended, so only the most recent price needs to be buffered
+        super().__init__(
+            start_dt, universe, [1], array_buffers=array_buffers
+        )
+        self.return_lookbacks = list(lookbacks)
+        self.recompute_interval = (
+            recompute_interval if recompute_interval is not None
+            else max(lookbacks)
+        )
+        self.asset_columns = {}
+        self.moments = RollingCovariance(
+            self.return_lookbacks, self.recompute_interval
+        )
+        self._update_asset_columns()
+
+    @property
+    def num_warm_start_prices(self):
+        """
+        The number of historical prices needed to warm-start the
+        running sums of the largest lookback of returns.
+
+        Returns
+        -------
+        `int`
+            The number of historical prices.
+        """
+        return max(self.return_lookbacks) + 1
+
+    def _update_asset_columns(self):
+        """
+        Assign a column of the running sums to any assets
+        that have been added to the universe.
+        """
+        extra_assets = [
+            asset for asset in self.assets if asset not in self.asset_columns
+        ]
+        for asset in extra_assets:
+            self.asset_columns[asset] = len(self.asset_columns)
+        if len(extra_assets) > 0:
+            self.moments.add_assets(len(extra_assets))
+
+    def on_prices_appended(self, assets):
+        """
+        Update the running sums with the returns of the row of
+        prices that has been appended.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names that received a new price.
+        """
+        self._update_asset_columns()
+        prices = np.full(len(self.asset_columns), np.NaN)
+        for asset in assets:
+            col = self.asset_columns.get(asset)
+            if col is not None:
+                prices[col] = self.buffers.window(asset, 1)[-1]
+        self.moments.append_prices(prices)
+
+    def covariance(self, assets, lookback):
+        """
+        Obtain the covariance matrix of the daily returns
+        of the provided assets.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (n_assets x n_assets) covariance matrix, aligned
+            to the assets.
+        """
+        self._update_asset_columns()
+        cols = [self.asset_columns[asset] for asset in assets]
+        return self.moments.covariance(lookback)[np.ix_(cols, cols)]
+
+    def correlation(self, assets, lookback):
+        """
+        Obtain the correlation matrix of the daily returns
+        of the provided assets.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (n_assets x n_assets) correlation matrix, aligned
+            to the assets, which is NaN for any asset with zero
+            variance of returns.
+        """
+        cov = self.covariance(assets, lookback)
+        stds = np.sqrt(np.maximum(np.diag(cov), 0.0))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return cov / np.outer(stds, stds)
+
+    def evaluate(self, assets, lookback):
+        """
+        Obtain the variance of the daily returns
+        for multiple assets at once.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The variance of returns, aligned to the assets.
+        """
+        return np.diag(self.covariance(assets, lookback)).copy()
+
+    def __call__(self, asset, lookback):
+        """
+        Obtain the variance of the daily
+        returns for the asset.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `float`
+            The variance of returns.
+        """
+        return self.evaluate([asset], lookback)[0]
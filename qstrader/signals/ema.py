@@ -0,0 +1,177 @@
+import numpy as np
+
+from qstrader.signals.rolling import (
+    ExponentialAverages, exponential_moving_averages
+)
+from qstrader.signals.signal import Signal
+
+EMA_WARM_START_SPANS = 5
+
+
+class EMASignal(Signal):
+    """
+    Indicator class to calculate the exponential moving
+    average of a set of prices, with a smoothing factor
+    of 2 / (N + 1) for a lookback (span) of N periods.
+
+    As an exponential moving average depends upon every price
+    rather than a fixed window, the averages are kept in
+    (asset x span) arrays, which are updated with array
+    operations each time new prices are appended.
+
+    Parameters
+    ----------
+    start_dt : `pd.Timestamp`
+        The starting datetime (UTC) of the signal.
+    universe : `Universe`
+        The universe of assets to calculate the signals for.
+    lookbacks : `list[int]`
+        The spans of the exponential moving averages.
+    array_buffers : `Boolean`, optional
+        Whether to store prices in a single NumPy ring buffer rather
+        than in per-asset deques. Defaults to False.
+    """
+
+    evaluate_aliases = ('ema',)
+
+    def __init__(self, start_dt, universe, lookbacks, array_buffers=False):
+        # The averages are updated as each price is appended,
+        # so only the most recent price needs to be buffered
+        super().__init__(
+            start_dt, universe, [1], array_buffers=array_buffers
+        )
+        self.spans = list(lookbacks)
+        self.averages = ExponentialAverages(self.spans)
+
+    @property
+    def num_warm_start_prices(self):
+        """
+        The number of historical prices needed to warm-start the
+        exponential moving averages. Prices older than
+        EMA_WARM_START_SPANS multiples of the largest span carry
+        a weight of less than exp(-2 * EMA_WARM_START_SPANS).
+
+        Returns
+        -------
+        `int`
+            The number of historical prices.
+        """
+        return EMA_WARM_START_SPANS * max(self.spans)
+
+    def on_prices_appended(self, assets):
+        """
+        Update the exponential moving averages of the
+        assets that have received a new price.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names that received a new price.
+        """
+        self.averages.append_prices(
+            self._obtain_state_rows(assets, self.averages),
+            self.buffers.windows(assets, 1)[:, -1]
+        )
+
+    def _exponential_moving_average(self, asset, lookback):
+        """
+        Calculate the exponential moving average for the
+        provided span for a particular asset.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        lookback : `int`
+            The span of the exponential moving average.
+
+        Returns
+        -------
+        `float`
+            The EMA value ('trend') for the span.
+        """
+        return self.ema([asset], lookback)[0]
+
+    def ema(self, assets, lookback):
+        """
+        Calculate the exponential moving average for
+        multiple assets at once.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        lookback : `int`
+            The span of the exponential moving average.
+
+        Returns
+        -------
+        `np.ndarray`
+            The trend (EMA) for the span, aligned to the assets.
+        """
+        return self.averages.mean(
+            lookback, self._obtain_state_rows(assets, self.averages)
+        )
+
+    def precompute(self, prices, appended, lookback):
+        """
+        Calculate the trend (EMA) at every row of a (time x asset)
+        matrix of prices at once, matching the values obtained by
+        appending the prices one row at a time.
+
+        Parameters
+        ----------
+        prices : `np.ndarray`
+            The (time x asset) matrix of prices.
+        appended : `np.ndarray`
+            The (time x asset) boolean matrix of whether each price
+            is appended, which is False prior to an asset entering
+            the universe.
+        lookback : `int`
+            The span of the exponential moving average.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (time x asset) matrix of the trend (EMA).
+        """
+        return exponential_moving_averages(
+            np.where(appended, prices, np.NaN), 2.0 / (lookback + 1.0)
+        )
+
+    def evaluate(self, assets, lookback):
+        """
+        Calculate the trend (EMA) for multiple assets at once.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        lookback : `int`
+            The span of the exponential moving average.
+
+        Returns
+        -------
+        `np.ndarray`
+            The trend (EMA), aligned to the assets.
+        """
+        return self.ema(assets, lookback)
+
+    def __call__(self, asset, lookback):
+        """
+        Calculate the exponential moving average
+        for the asset.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        lookback : `int`
+            The span of the exponential moving average.
+
+        Returns
+        -------
+        `float`
+            The trend (EMA) for the span.
+        """
+        return self._exponential_moving_average(asset, lookback)
@@ -1,6 +1,6 @@
 import numpy as np
-import pandas as pd
 
+from qstrader.signals.rolling import forward_fill_rows
 from qstrader.signals.signal import Signal
 
 
@@ -22,31 +22,47 @@ class MomentumSignal(Signal):
         The universe of assets to calculate the signals for.
     lookbacks : `list[int]`
         The number of lookback periods to store prices for.
+    array_buffers : `Boolean`, optional
+        Whether to store prices in a single NumPy ring buffer rather
+        than in per-asset deques. Defaults to False.
     """
 
-    def __init__(self, start_dt, universe, lookbacks):
+    evaluate_aliases = ('momentum',)
+
+    def __init__(self, start_dt, universe, lookbacks, array_buffers=False):
         bumped_lookbacks = [lookback + 1 for lookback in lookbacks]
-        super().__init__(start_dt, universe, bumped_lookbacks)
+        super().__init__(
+            start_dt, universe, bumped_lookbacks, array_buffers=array_buffers
+        )
 
     @staticmethod
-    def _asset_lookback_key(asset, lookback):
+    def _endpoint_returns(windows):
         """
-        Create the buffer dictionary lookup key based
-        on asset name and lookback period.
+        Calculate the cumulative return of each row of a matrix of
+        prices, which is the ratio of the last to the first available
+        (non-NaN) price. Rows with fewer than two available prices
+        have a cumulative return of zero.
 
         Parameters
         ----------
-        asset : `str`
-            The asset symbol name.
-        lookback : `int`
-            The lookback period.
+        windows : `np.ndarray`
+            The (n_assets x n_prices) matrix of prices.
 
         Returns
         -------
-        `str`
-            The lookup key.
+        `np.ndarray`
+            The cumulative return of each row.
         """
-        return '%s_%s' % (asset, lookback + 1)
+        available = ~np.isnan(windows)
+        rows = np.arange(windows.shape[0])
+        first = np.argmax(available, axis=1)
+        last = windows.shape[1] - 1 - np.argmax(available[:, ::-1], axis=1)
+        returns = np.zeros(windows.shape[0])
+        has_returns = np.sum(available, axis=1) >= 2
+        returns[has_returns] = (
+            windows[rows, last][has_returns] / windows[rows, first][has_returns]
+        ) - 1.0
+        return returns
 
     def _cumulative_return(self, asset, lookback):
         """
@@ -54,6 +70,10 @@ class MomentumSignal(Signal):
         lookback period ('momentum') based on the price
         buffers for a particular asset.
 
+        As the compounded returns telescope, this is the ratio
+        of the endpoint prices of the lookback window, making
+        the calculation O(1) when both endpoints are available.
+
         Parameters
         ----------
         asset : `str`
@@ -66,15 +86,97 @@ class MomentumSignal(Signal):
         `float`
             The cumulative return ('momentum') for the period.
         """
-        series = pd.Series(
-            self.buffers.prices[MomentumSignal._asset_lookback_key(asset, lookback)]
+        # The buffers store one more price than the lookback
+        # period, as N returns require N + 1 prices
+        window = self.buffers.window(asset, lookback + 1)
+        if len(window) < 2:
+            return 0.0
+        if not (np.isnan(window[0]) or np.isnan(window[-1])):
+            return window[-1] / window[0] - 1.0
+        return MomentumSignal._endpoint_returns(window[np.newaxis, :])[0]
+
+    def momentum(self, assets, lookback):
+        """
+        Calculate the lookback-period momentum for multiple
+        assets at once, e.g. for cross-sectional ranking.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The momentum for the period, aligned to the assets.
+        """
+        return MomentumSignal._endpoint_returns(
+            self.buffers.windows(assets, lookback + 1)
         )
-        returns = series.pct_change().dropna().to_numpy()
 
-        if len(returns) < 1:
-            return 0.0
-        else:
-            return (np.cumprod(1.0 + np.array(returns)) - 1.0)[-1]
+    def precompute(self, prices, appended, lookback):
+        """
+        Calculate the momentum at every row of a (time x asset)
+        matrix of prices at once, matching the values obtained by
+        appending the prices one row at a time.
+
+        Parameters
+        ----------
+        prices : `np.ndarray`
+            The (time x asset) matrix of prices.
+        appended : `np.ndarray`
+            The (time x asset) boolean matrix of whether each price
+            is appended, which is False prior to an asset entering
+            the universe.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (time x asset) matrix of the momentum.
+        """
+        prices = np.where(appended, prices, np.NaN)
+        num_rows = prices.shape[0]
+        available = ~np.isnan(prices)
+
+        # The latest available price at or prior to each row, and the
+        # earliest available price at or subsequent to the start of
+        # each row's lookback window, or the number of rows if none
+        last = forward_fill_rows(available)
+        first = (num_rows - 1) - forward_fill_rows(available[::-1])[::-1]
+        first = first[np.maximum(np.arange(num_rows) - lookback, 0)]
+
+        has_returns = first < last
+        last_prices = np.take_along_axis(prices, np.clip(last, 0, None), axis=0)
+        first_prices = np.take_along_axis(
+            prices, np.clip(first, None, num_rows - 1), axis=0
+        )
+        values = np.zeros(prices.shape)
+        values[has_returns] = (
+            last_prices[has_returns] / first_prices[has_returns]
+        ) - 1.0
+        return values
+
+    def evaluate(self, assets, lookback):
+        """
+        Calculate the momentum for multiple assets at once.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The momentum, aligned to the assets.
+        """
+        return self.momentum(assets, lookback)
 
     def __call__(self, asset, lookback):
         """
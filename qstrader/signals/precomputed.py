@@ -0,0 +1,170 @@
+import numpy as np
+import pandas as pd
+
+
+class PrecomputedSignal(object):
+    """
+    Serves the values of a signal from (time x asset) matrices
+    calculated once over the whole price history, rather than by
+    appending prices to the signal one timestamp at a time.
+
+    The values of each lookback period are calculated on first
+    usage via the 'precompute' method of the wrapped signal. The
+    values served are those of the latest timestamp provided to
+    'set_timestamp', prior to which the wrapped signal is used.
+    Assets without a column in the price matrix are given NaN values.
+
+    The vectorised methods listed in the 'evaluate_aliases' of the
+    wrapped signal, such as 'MomentumSignal.momentum', are served
+    from the precomputed values, while any other attributes, such
+    as 'lookbacks', are obtained from the wrapped signal.
+
+    Parameters
+    ----------
+    signal : `Signal`
+        The signal to precompute.
+    dts : `list[pd.Timestamp]`
+        The timestamps at which the signal is updated.
+    assets : `list[str]`
+        The asset symbols of the price matrix columns.
+    prices : `np.ndarray`
+        The (time x asset) matrix of prices at each timestamp.
+    appended : `np.ndarray`
+        The (time x asset) boolean matrix of whether each price
+        is appended to the signal.
+    """
+
+    def __init__(self, signal, dts, assets, prices, appended):
+        self.signal = signal
+        self.timestamps = pd.DatetimeIndex(dts).asi8
+        self.asset_columns = {asset: col for col, asset in enumerate(assets)}
+        self.prices = prices
+        self.appended = appended
+        self.values = {}
+        self.row = -1
+
+    def __getattr__(self, name):
+        """
+        Serve the vectorised methods equivalent to 'evaluate' from
+        the precomputed values and obtain any other attributes not
+        defined here from the wrapped signal.
+
+        Parameters
+        ----------
+        name : `str`
+            The attribute name.
+
+        Returns
+        -------
+        `object`
+            The attribute.
+        """
+        # Guard against recursion prior to the wrapped signal being set
+        if name == 'signal':
+            raise AttributeError(name)
+        if name in self.signal.evaluate_aliases:
+            return self.evaluate
+        return getattr(self.signal, name)
+
+    @property
+    def assets(self):
+        """
+        The current assets of the wrapped signal.
+        """
+        return self.signal.assets
+
+    def update_assets(self, dt):
+        """
+        Ensure that any new additions to the universe are
+        added to the wrapped signal.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The update timestamp for the signal.
+        """
+        self.signal.update_assets(dt)
+
+    def set_timestamp(self, dt):
+        """
+        Set the timestamp at which to serve the signal values.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The update timestamp for the signal.
+        """
+        self.row = int(
+            np.searchsorted(self.timestamps, pd.Timestamp(dt).value, side='right')
+        ) - 1
+
+    def _obtain_values(self, lookback):
+        """
+        Obtain the (time x asset) matrix of signal values for
+        a lookback period, calculating it on first usage.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (time x asset) matrix of signal values.
+        """
+        values = self.values.get(lookback)
+        if values is None:
+            values = self.signal.precompute(self.prices, self.appended, lookback)
+            self.values[lookback] = values
+        return values
+
+    def evaluate(self, assets, lookback):
+        """
+        Obtain the signal for multiple assets at once.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The signal values, aligned to the assets.
+        """
+        if self.row < 0:
+            return self.signal.evaluate(assets, lookback)
+        cols = np.fromiter(
+            (self.asset_columns.get(asset, -1) for asset in assets),
+            dtype=np.int64, count=len(assets)
+        )
+        values = np.full(len(assets), np.NaN)
+        known = cols >= 0
+        values[known] = self._obtain_values(lookback)[self.row, cols[known]]
+        return values
+
+    def __call__(self, asset, lookback):
+        """
+        Obtain the signal for the asset.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `float`
+            The signal value.
+        """
+        if self.row < 0:
+            return self.signal(asset, lookback)
+        col = self.asset_columns.get(asset)
+        if col is None:
+            return np.NaN
+        return self._obtain_values(lookback)[self.row, col]
@@ -0,0 +1,645 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def rolling_window_sums(values, lookback):
+    """
+    Calculate the sums of each column of a (time x asset) matrix
+    over a rolling window of rows, with the windows of the first
+    rows containing only the rows available so far.
+
+    Parameters
+    ----------
+    values : `np.ndarray`
+        The (time x asset) matrix of values.
+    lookback : `int`
+        The number of rows in each rolling window.
+
+    Returns
+    -------
+    `np.ndarray`
+        The (time x asset) matrix of rolling window sums.
+    """
+    padded = np.concatenate(
+        [np.zeros((lookback - 1,) + values.shape[1:], dtype=values.dtype), values]
+    )
+    return sliding_window_view(padded, lookback, axis=0).sum(axis=-1)
+
+
+def forward_fill_rows(available):
+    """
+    Obtain, for each element of a (time x asset) matrix, the row
+    of the latest available element at or prior to it.
+
+    Parameters
+    ----------
+    available : `np.ndarray`
+        The (time x asset) boolean matrix of available elements.
+
+    Returns
+    -------
+    `np.ndarray`
+        The (time x asset) matrix of rows, or -1 if
+        there is no prior available element.
+    """
+    rows = np.arange(available.shape[0])[:, np.newaxis]
+    return np.maximum.accumulate(np.where(available, rows, -1), axis=0)
+
+
+def _recent_ring_values(ring, counts, rows, lookback, fill):
+    """
+    Obtain the (up to) 'lookback' most recent values of the provided
+    rows of a ring buffer, in chronological order, padded at the start
+    for rows with fewer values.
+
+    Parameters
+    ----------
+    ring : `np.ndarray`
+        The (n_rows x max_lookback) ring buffer.
+    counts : `np.ndarray`
+        The total number of values written to each row.
+    rows : `np.ndarray`
+        The rows to obtain the values of.
+    lookback : `int`
+        The number of values to obtain.
+    fill : `float`
+        The value to pad rows with fewer values with.
+
+    Returns
+    -------
+    `np.ndarray`
+        The (len(rows) x lookback) matrix of recent values.
+    """
+    counts = counts[rows]
+    offsets = np.arange(-lookback, 0)
+    values = ring[
+        rows[:, np.newaxis], (counts[:, np.newaxis] + offsets) % ring.shape[1]
+    ]
+    return np.where(offsets >= -counts[:, np.newaxis], values, fill)
+
+
+def exponential_moving_averages(prices, alpha, block_decay=1e-3):
+    """
+    Calculate the exponential moving average of each column of a
+    (time x asset) matrix of prices, seeded with the first available
+    price of each column, where missing (NaN) prices leave the
+    average unchanged.
+
+    The recurrence is solved in closed form with cumulative sums over
+    blocks of rows, within which the decay of the smoothing factor
+    is bounded by 'block_decay' to limit the loss of precision, so
+    that only one Python iteration is needed per block of rows.
+
+    Parameters
+    ----------
+    prices : `np.ndarray`
+        The (time x asset) matrix of prices.
+    alpha : `float`
+        The smoothing factor of the exponential moving average.
+    block_decay : `float`, optional
+        The smallest decay of the smoothing factor within a block.
+
+    Returns
+    -------
+    `np.ndarray`
+        The (time x asset) matrix of exponential moving averages,
+        which is NaN prior to the first available price.
+    """
+    available = ~np.isnan(prices)
+    num_rows, num_cols = prices.shape
+    if num_rows == 0:
+        return np.empty(prices.shape)
+    if alpha >= 1.0:
+        last = forward_fill_rows(available)
+        averages = np.take_along_axis(prices, np.clip(last, 0, None), axis=0)
+        averages[last < 0] = np.NaN
+        return averages
+
+    # Each average starts from the first available price of its
+    # column, which the seeding row then leaves unchanged
+    first = np.argmax(available, axis=0)
+    averages = prices[first, np.arange(num_cols)]
+    block_size = max(int(np.log(block_decay) / np.log1p(-alpha)), 1)
+    decays = (1.0 - alpha) ** np.arange(block_size + 1)
+
+    values = np.where(available, prices, 0.0)
+    for start in range(0, num_rows, block_size):
+        end = min(start + block_size, num_rows)
+        block = values[start:end]
+        block_available = available[start:end]
+        if block_available.all():
+            block_decays = decays[1:end - start + 1, np.newaxis]
+        else:
+            block_decays = decays[np.cumsum(block_available, axis=0)]
+        block *= alpha / block_decays
+        np.cumsum(block, axis=0, out=block)
+        block += averages
+        block *= block_decays
+        averages = block[-1]
+    values[np.arange(num_rows)[:, np.newaxis] < first] = np.NaN
+    return values
+
+
+class RollingReturnMoments(object):
+    """
+    Running sums of returns and squared returns of multiple assets,
+    one row per asset, over several rolling lookback periods, updated
+    in O(1) per asset and lookback for each appended price.
+
+    The returns are stored in an (n_assets x max_lookback) ring buffer,
+    from which the sums are periodically recomputed to bound the
+    accumulation of floating point error.
+
+    Parameters
+    ----------
+    lookbacks : `list[int]`
+        The number of returns in each rolling lookback period.
+    recompute_interval : `int`
+        The number of returns of an asset after which its running
+        sums are recomputed from the stored returns.
+    num_assets : `int`, optional
+        The initial number of assets. Defaults to zero.
+    """
+
+    def __init__(self, lookbacks, recompute_interval, num_assets=0):
+        self.lookbacks = lookbacks
+        self.max_lookback = max(lookbacks)
+        self.recompute_interval = recompute_interval
+        self.num_assets = 0
+        self.last_prices = np.empty(0)
+        self.returns = np.empty((0, self.max_lookback))
+        self.num_returns = np.empty(0, dtype=np.int64)
+        self.sums = np.empty((0, len(lookbacks)))
+        self.sq_sums = np.empty((0, len(lookbacks)))
+        self.num_updates = np.empty(0, dtype=np.int64)
+        self.add_assets(num_assets)
+
+    def add_assets(self, num_assets):
+        """
+        Add further assets, which have no prices or returns.
+
+        Parameters
+        ----------
+        num_assets : `int`
+            The number of assets to add.
+        """
+        self.num_assets += num_assets
+        self.last_prices = np.concatenate(
+            [self.last_prices, np.full(num_assets, np.NaN)]
+        )
+        self.returns = np.pad(self.returns, ((0, num_assets), (0, 0)))
+        self.num_returns = np.pad(self.num_returns, (0, num_assets))
+        self.sums = np.pad(self.sums, ((0, num_assets), (0, 0)))
+        self.sq_sums = np.pad(self.sq_sums, ((0, num_assets), (0, 0)))
+        self.num_updates = np.pad(self.num_updates, (0, num_assets))
+
+    def append_prices(self, rows, prices):
+        """
+        Append a new price for each of the provided (unique) assets,
+        updating the rolling sums with their returns. Missing (NaN)
+        prices are forward-filled from the last available price,
+        while prices prior to the first available price have no return.
+
+        Parameters
+        ----------
+        rows : `np.ndarray`
+            The rows of the assets.
+        prices : `np.ndarray`
+            The new prices of the assets.
+        """
+        last_prices = self.last_prices[rows]
+        missing = np.isnan(prices)
+        has_return = ~np.isnan(last_prices)
+        with np.errstate(invalid='ignore'):
+            returns = np.where(missing, 0.0, prices / last_prices - 1.0)
+        self.last_prices[rows] = np.where(missing, last_prices, prices)
+        self._append_returns(rows[has_return], returns[has_return])
+
+    def _append_returns(self, rows, returns):
+        """
+        Add a return to all rolling sums of each of the provided
+        assets, removing the returns leaving each lookback period.
+
+        Parameters
+        ----------
+        rows : `np.ndarray`
+            The rows of the assets.
+        returns : `np.ndarray`
+            The new returns of the assets.
+        """
+        num_returns = self.num_returns[rows]
+        for col, lookback in enumerate(self.lookbacks):
+            old_returns = np.where(
+                num_returns >= lookback,
+                self.returns[rows, (num_returns - lookback) % self.max_lookback],
+                0.0
+            )
+            self.sums[rows, col] += returns - old_returns
+            self.sq_sums[rows, col] += returns * returns - old_returns * old_returns
+        self.returns[rows, num_returns % self.max_lookback] = returns
+        self.num_returns[rows] += 1
+
+        self.num_updates[rows] += 1
+        recompute_rows = rows[self.num_updates[rows] >= self.recompute_interval]
+        if len(recompute_rows) > 0:
+            self._recompute(recompute_rows)
+
+    def _recompute(self, rows):
+        """
+        Recompute the rolling sums of the provided
+        assets exactly from the stored returns.
+
+        Parameters
+        ----------
+        rows : `np.ndarray`
+            The rows of the assets.
+        """
+        for col, lookback in enumerate(self.lookbacks):
+            returns = _recent_ring_values(
+                self.returns, self.num_returns, rows, lookback, fill=0.0
+            )
+            self.sums[rows, col] = returns.sum(axis=1)
+            self.sq_sums[rows, col] = (returns * returns).sum(axis=1)
+        self.num_updates[rows] = 0
+
+    def std(self, lookback, rows):
+        """
+        Calculate the (population) standard deviation of the
+        returns within the lookback period of each provided asset.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The lookback period.
+        rows : `np.ndarray`
+            The rows of the assets.
+
+        Returns
+        -------
+        `np.ndarray`
+            The standard deviations of returns, which are zero
+            for assets without any returns.
+        """
+        col = self.lookbacks.index(lookback)
+        num_returns = np.minimum(lookback, self.num_returns[rows])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = self.sums[rows, col] / num_returns
+            variances = self.sq_sums[rows, col] / num_returns - means * means
+        return np.where(num_returns > 0, np.sqrt(np.maximum(variances, 0.0)), 0.0)
+
+
+class RollingPriceSums(object):
+    """
+    Running sums of the prices of multiple assets, one row per asset,
+    over several rolling lookback periods, updated in O(1) per asset
+    and lookback for each appended price.
+
+    Missing (NaN) prices are counted separately, so that the mean
+    of any lookback period containing one is NaN. The prices are
+    stored in an (n_assets x max_lookback) ring buffer, from which
+    the sums are periodically recomputed to bound the accumulation
+    of floating point error.
+
+    Parameters
+    ----------
+    lookbacks : `list[int]`
+        The number of prices in each rolling lookback period.
+    recompute_interval : `int`
+        The number of prices of an asset after which its running
+        sums are recomputed from the stored prices.
+    num_assets : `int`, optional
+        The initial number of assets. Defaults to zero.
+    """
+
+    def __init__(self, lookbacks, recompute_interval, num_assets=0):
+        self.lookbacks = lookbacks
+        self.max_lookback = max(lookbacks)
+        self.recompute_interval = recompute_interval
+        self.num_assets = 0
+        self.prices = np.empty((0, self.max_lookback))
+        self.num_prices = np.empty(0, dtype=np.int64)
+        self.sums = np.empty((0, len(lookbacks)))
+        self.num_missing = np.empty((0, len(lookbacks)), dtype=np.int64)
+        self.num_updates = np.empty(0, dtype=np.int64)
+        self.add_assets(num_assets)
+
+    def add_assets(self, num_assets):
+        """
+        Add further assets, which have no prices.
+
+        Parameters
+        ----------
+        num_assets : `int`
+            The number of assets to add.
+        """
+        self.num_assets += num_assets
+        self.prices = np.pad(self.prices, ((0, num_assets), (0, 0)))
+        self.num_prices = np.pad(self.num_prices, (0, num_assets))
+        self.sums = np.pad(self.sums, ((0, num_assets), (0, 0)))
+        self.num_missing = np.pad(self.num_missing, ((0, num_assets), (0, 0)))
+        self.num_updates = np.pad(self.num_updates, (0, num_assets))
+
+    def append_prices(self, rows, prices):
+        """
+        Append a new price for each of the provided (unique) assets,
+        removing the prices leaving each lookback period from its sum.
+
+        Parameters
+        ----------
+        rows : `np.ndarray`
+            The rows of the assets.
+        prices : `np.ndarray`
+            The new prices of the assets.
+        """
+        num_prices = self.num_prices[rows]
+        missing = np.isnan(prices)
+        for col, lookback in enumerate(self.lookbacks):
+            old_prices = np.where(
+                num_prices >= lookback,
+                self.prices[rows, (num_prices - lookback) % self.max_lookback],
+                0.0
+            )
+            old_missing = np.isnan(old_prices)
+            self.num_missing[rows, col] += missing.astype(np.int64) - old_missing
+            self.sums[rows, col] += (
+                np.where(missing, 0.0, prices) - np.where(old_missing, 0.0, old_prices)
+            )
+        self.prices[rows, num_prices % self.max_lookback] = prices
+        self.num_prices[rows] += 1
+
+        self.num_updates[rows] += 1
+        recompute_rows = rows[self.num_updates[rows] >= self.recompute_interval]
+        if len(recompute_rows) > 0:
+            self._recompute(recompute_rows)
+
+    def _recompute(self, rows):
+        """
+        Recompute the rolling sums of the provided
+        assets exactly from the stored prices.
+
+        Parameters
+        ----------
+        rows : `np.ndarray`
+            The rows of the assets.
+        """
+        for col, lookback in enumerate(self.lookbacks):
+            prices = _recent_ring_values(
+                self.prices, self.num_prices, rows, lookback, fill=0.0
+            )
+            self.sums[rows, col] = np.nansum(prices, axis=1)
+        self.num_updates[rows] = 0
+
+    def mean(self, lookback, rows):
+        """
+        Calculate the mean of the prices within the lookback
+        period of each provided asset.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The lookback period.
+        rows : `np.ndarray`
+            The rows of the assets.
+
+        Returns
+        -------
+        `np.ndarray`
+            The mean prices, which are NaN for assets without any
+            prices or with a missing price within the lookback period.
+        """
+        col = self.lookbacks.index(lookback)
+        num_prices = np.minimum(lookback, self.num_prices[rows])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = self.sums[rows, col] / num_prices
+        return np.where(
+            (num_prices > 0) & (self.num_missing[rows, col] == 0), means, np.NaN
+        )
+
+
+class ExponentialAverages(object):
+    """
+    Exponential moving averages of the prices of multiple assets,
+    one row per asset, for several spans, updated in O(1) per asset
+    and span for each appended price, where the smoothing factor of
+    a span N is 2 / (N + 1).
+
+    Each average is seeded with the first available price, while
+    missing (NaN) prices leave the averages unchanged.
+
+    Parameters
+    ----------
+    lookbacks : `list[int]`
+        The spans of the exponential moving averages.
+    num_assets : `int`, optional
+        The initial number of assets. Defaults to zero.
+    """
+
+    def __init__(self, lookbacks, num_assets=0):
+        self.lookbacks = lookbacks
+        self.alphas = 2.0 / (np.array(lookbacks, dtype=np.float64) + 1.0)
+        self.num_assets = 0
+        self.averages = np.empty((0, len(lookbacks)))
+        self.add_assets(num_assets)
+
+    def add_assets(self, num_assets):
+        """
+        Add further assets, which have no prices.
+
+        Parameters
+        ----------
+        num_assets : `int`
+            The number of assets to add.
+        """
+        self.num_assets += num_assets
+        self.averages = np.concatenate(
+            [self.averages, np.full((num_assets, len(self.lookbacks)), np.NaN)]
+        )
+
+    def append_prices(self, rows, prices):
+        """
+        Append a new price for each of the provided (unique) assets,
+        updating their exponential moving averages.
+
+        Parameters
+        ----------
+        rows : `np.ndarray`
+            The rows of the assets.
+        prices : `np.ndarray`
+            The new prices of the assets.
+        """
+        averages = self.averages[rows]
+        prices = prices[:, np.newaxis]
+        self.averages[rows] = np.where(
+            np.isnan(prices), averages,
+            np.where(
+                np.isnan(averages), prices,
+                averages + self.alphas * (prices - averages)
+            )
+        )
+
+    def mean(self, lookback, rows):
+        """
+        Obtain the exponential moving average for a
+        span of each provided asset.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The span of the exponential moving average.
+        rows : `np.ndarray`
+            The rows of the assets.
+
+        Returns
+        -------
+        `np.ndarray`
+            The exponential moving averages, which are NaN for
+            assets without any available prices.
+        """
+        return self.averages[rows, self.lookbacks.index(lookback)]
+
+
+class RollingCovariance(object):
+    """
+    Running sums of the returns and return cross-products of a set
+    of assets over several rolling lookback periods, updated in
+    O(N^2) per row of prices for N assets.
+
+    The returns are stored in a (max_lookback x N) ring buffer, from
+    which the sums are periodically recomputed to bound the
+    accumulation of floating point error.
+
+    Missing (NaN) prices are forward-filled from the last available
+    price, giving a zero return, as do prices prior to the first
+    available price of an asset. Rows of prices where no asset has
+    a prior price do not produce a row of returns.
+
+    Parameters
+    ----------
+    lookbacks : `list[int]`
+        The number of returns in each rolling lookback period.
+    recompute_interval : `int`
+        The number of rows of returns after which the running
+        sums are recomputed from the stored returns.
+    num_assets : `int`, optional
+        The initial number of assets. Defaults to zero.
+    """
+
+    def __init__(self, lookbacks, recompute_interval, num_assets=0):
+        self.lookbacks = lookbacks
+        self.max_lookback = max(lookbacks)
+        self.recompute_interval = recompute_interval
+        self.num_assets = num_assets
+        self.reset()
+
+    def reset(self):
+        """
+        Discard all prices and returns.
+        """
+        self.num_returns = 0
+        self.last_prices = np.full(self.num_assets, np.NaN)
+        self.returns = np.zeros((self.max_lookback, self.num_assets))
+        self.sums = {
+            lookback: np.zeros(self.num_assets) for lookback in self.lookbacks
+        }
+        self.cross_sums = {
+            lookback: np.zeros((self.num_assets, self.num_assets))
+            for lookback in self.lookbacks
+        }
+        self.num_updates = 0
+
+    def add_assets(self, num_assets):
+        """
+        Add further assets, which have zero returns for all
+        rows of returns prior to their addition.
+
+        Parameters
+        ----------
+        num_assets : `int`
+            The number of assets to add.
+        """
+        self.num_assets += num_assets
+        self.last_prices = np.concatenate(
+            [self.last_prices, np.full(num_assets, np.NaN)]
+        )
+        self.returns = np.pad(self.returns, ((0, 0), (0, num_assets)))
+        for lookback in self.lookbacks:
+            self.sums[lookback] = np.pad(self.sums[lookback], (0, num_assets))
+            self.cross_sums[lookback] = np.pad(
+                self.cross_sums[lookback], ((0, num_assets), (0, num_assets))
+            )
+
+    def append_prices(self, prices):
+        """
+        Append a new row of prices, updating the rolling
+        sums with its returns.
+
+        Parameters
+        ----------
+        prices : `np.ndarray`
+            The new prices of each asset.
+        """
+        has_return = ~np.isnan(prices) & ~np.isnan(self.last_prices)
+        returns = np.zeros(self.num_assets)
+        returns[has_return] = prices[has_return] / self.last_prices[has_return] - 1.0
+        self.last_prices = np.where(np.isnan(prices), self.last_prices, prices)
+        if has_return.any():
+            self._append_returns(returns)
+
+    def _append_returns(self, returns):
+        """
+        Add a row of returns to all rolling sums, removing the
+        row of returns leaving each lookback period.
+
+        Parameters
+        ----------
+        returns : `np.ndarray`
+            The new returns of each asset.
+        """
+        for lookback in self.lookbacks:
+            if self.num_returns >= lookback:
+                old_returns = self.returns[(self.num_returns - lookback) % self.max_lookback]
+                self.sums[lookback] -= old_returns
+                self.cross_sums[lookback] -= np.outer(old_returns, old_returns)
+            self.sums[lookback] += returns
+            self.cross_sums[lookback] += np.outer(returns, returns)
+        self.returns[self.num_returns % self.max_lookback] = returns
+        self.num_returns += 1
+
+        self.num_updates += 1
+        if self.num_updates >= self.recompute_interval:
+            self._recompute()
+
+    def _recompute(self):
+        """
+        Recompute all rolling sums exactly from the stored returns.
+        """
+        for lookback in self.lookbacks:
+            num_returns = min(lookback, self.num_returns)
+            returns = self.returns[
+                (self.num_returns - num_returns + np.arange(num_returns)) % self.max_lookback
+            ]
+            self.sums[lookback] = returns.sum(axis=0)
+            self.cross_sums[lookback] = returns.T @ returns
+        self.num_updates = 0
+
+    def covariance(self, lookback):
+        """
+        Calculate the (population) covariance matrix of the
+        returns within the lookback period.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (N x N) covariance matrix, or a matrix of
+            NaN if there are no returns.
+        """
+        num_returns = min(lookback, self.num_returns)
+        if num_returns < 1:
+            return np.full((self.num_assets, self.num_assets), np.NaN)
+        means = self.sums[lookback] / num_returns
+        return self.cross_sums[lookback] / num_returns - np.outer(means, means)
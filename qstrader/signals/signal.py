@@ -1,8 +1,9 @@
+import numpy as np
 import pandas as pd
 from abc import ABCMeta, abstractmethod
 from qstrader.asset.universe.universe import Universe
 
-from qstrader.signals.buffer import AssetPriceBuffers
+from qstrader.signals.buffer import AssetPriceBuffers, ArrayAssetPriceBuffers
 
 
 class Signal(object):
@@ -18,30 +19,60 @@ class Signal(object):
         The universe of assets to calculate the signals for.
     lookbacks : `list[int]`
         The number of lookback periods to store prices for.
+    array_buffers : `Boolean`, optional
+        Whether to store prices in a single NumPy ring buffer rather
+        than in per-asset deques. Defaults to False.
     """
 
     __metaclass__ = ABCMeta
 
-    def __init__(self, start_dt:pd.Timestamp, universe:Universe, lookbacks:int):
+    # The names of any vectorised methods equivalent to 'evaluate',
+    # which a PrecomputedSignal serves from its precomputed values
+    evaluate_aliases = ()
+
+    def __init__(self, start_dt:pd.Timestamp, universe:Universe, lookbacks:int, array_buffers:bool=False):
         self.start_dt = start_dt
         self.universe = universe    
         self.lookbacks = lookbacks
+        self.array_buffers = array_buffers
         self.assets = self.universe.get_assets(start_dt)
         self.buffers = self._create_asset_price_buffers()
+        self.state_rows = {}
 
     def _create_asset_price_buffers(self):
         """
-        Create an AssetPriceBuffers instance.
+        Create an AssetPriceBuffers (or ArrayAssetPriceBuffers)
+        instance.
 
         Returns
         -------
-        `AssetPriceBuffers`
+        `AssetPriceBuffers` or `ArrayAssetPriceBuffers`
             Stores the asset price buffers for the signal.
         """
+        if self.array_buffers:
+            return ArrayAssetPriceBuffers(
+                self.assets, lookbacks=self.lookbacks
+            )
         return AssetPriceBuffers(
             self.assets, lookbacks=self.lookbacks
         )
 
+    @property
+    def num_warm_start_prices(self):
+        """
+        The number of historical prices needed to warm-start the
+        signal, such that it matches a signal that had been appended
+        prices throughout its history. Defaults to the largest
+        lookback, while signals that keep running state beyond
+        their buffered prices should override this.
+
+        Returns
+        -------
+        `int`
+            The number of historical prices.
+        """
+        return max(self.lookbacks)
+
     def append(self, asset:str, price:float):
         """
         Append a new price onto the price buffer for
@@ -55,6 +86,65 @@ class Signal(object):
             The new price of the asset.
         """
         self.buffers.append(asset, price)
+        self.on_prices_appended([asset])
+
+    def append_prices(self, assets:list, prices):
+        """
+        Append a new price onto the price buffers for
+        each of the provided assets.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        prices : `list[float]` or `np.ndarray`
+            The new prices of the assets.
+        """
+        self.buffers.append_prices(assets, prices)
+        self.on_prices_appended(assets)
+
+    def on_prices_appended(self, assets:list):
+        """
+        Called once new prices for the provided assets have been
+        appended to the price buffers. Signals that keep incremental
+        state can override this to update it with the latest buffered
+        prices, which every appended price passes through. By default
+        does nothing.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names that received a new price.
+        """
+        pass
+
+    def _obtain_state_rows(self, assets:list, state):
+        """
+        Obtain the rows of the provided assets within a multi-asset
+        incremental state, adding rows for any assets without one.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        state : `object`
+            The incremental state, providing 'add_assets(num_assets)'.
+
+        Returns
+        -------
+        `np.ndarray`
+            The rows of the assets.
+        """
+        extra_assets = [
+            asset for asset in dict.fromkeys(assets) if asset not in self.state_rows
+        ]
+        for asset in extra_assets:
+            self.state_rows[asset] = len(self.state_rows)
+        if len(extra_assets) > 0:
+            state.add_assets(len(extra_assets))
+        return np.array(
+            [self.state_rows[asset] for asset in assets], dtype=np.int64
+        )
 
     def update_assets(self, dt:pd.Timestamp):
         """
@@ -73,6 +163,55 @@ class Signal(object):
         for extra_asset in extra_assets:
             self.assets.append(extra_asset)
 
+    def evaluate(self, assets:list, lookback:int):
+        """
+        Calculate the signal for multiple assets at once, e.g. for
+        cross-sectional ranking. Signals with a vectorised calculation
+        should override this, otherwise '__call__' is used per asset.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The signal values, aligned to the assets.
+        """
+        return np.array(
+            [self(asset, lookback) for asset in assets], dtype=np.float64
+        )
+
+    def precompute(self, prices, appended, lookback:int):
+        """
+        Calculate the signal at every row of a (time x asset) matrix
+        of prices at once, such that each row matches the value the
+        signal would have after being appended the prices up to and
+        including that row.
+
+        Parameters
+        ----------
+        prices : `np.ndarray`
+            The (time x asset) matrix of prices.
+        appended : `np.ndarray`
+            The (time x asset) boolean matrix of whether each price
+            is appended, which is False prior to an asset entering
+            the universe.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (time x asset) matrix of signal values.
+        """
+        raise NotImplementedError(
+            "Should implement precompute()"
+        )
+
     @abstractmethod
     def __call__(self, asset:str, lookback:int):
         raise NotImplementedError(
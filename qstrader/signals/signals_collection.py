@@ -1,4 +1,10 @@
+import numpy as np
+import pandas as pd
+
 from qstrader.data.backtest_data_handler import DataHandler
+from qstrader.signals.buffer import AssetPriceBuffers, ArrayAssetPriceBuffers
+from qstrader.signals.precomputed import PrecomputedSignal
+from qstrader.signals.signal import Signal
 
 
 class SignalsCollection(object):
@@ -12,18 +18,98 @@ class SignalsCollection(object):
     Ensures each signal receives a new data point at the
     appropriate simulation iteration rate.
 
+    All signals read from a single price buffer owned by the
+    collection, which stores the largest lookback of any signal,
+    so that each asset price is only obtained and stored once per
+    update. Signals should therefore not be appended to directly
+    once added to the collection.
+
+    In precomputed mode the whole price history at the update
+    timestamps is obtained once via 'precompute_signals', after
+    which each signal is replaced by a PrecomputedSignal serving
+    values calculated with vectorised rolling operations, and
+    updates only advance the current timestamp.
+
+    The shared price buffer can instead be warm-started in bulk
+    from the historical daily closes prior to the start of a
+    backtest via 'warm_start_buffers', allowing a backtest to begin
+    at its burn-in date rather than simulating the lookback period.
+
     Parameters
     ----------
     signals : `dict{str: Signal}`
         Map of signal name to derived instance of Signal
     data_handler : `DataHandler`
         The data handler used to obtain pricing.
+    precompute : `Boolean`, optional
+        Whether the signals should be precomputed over the whole
+        price history prior to a backtest. Defaults to False.
+    warm_start : `Boolean`, optional
+        Whether the price buffer should be filled from historical
+        closing prices prior to a backtest. Defaults to False.
+    warm_start_adjusted : `Boolean`, optional
+        Whether to warm-start from the corporate-action adjusted
+        closing prices, which should match the pricing of the data
+        sources. Defaults to True.
     """
 
-    def __init__(self, signals, data_handler:DataHandler):
+    def __init__(
+        self,
+        signals,
+        data_handler:DataHandler,
+        precompute:bool=False,
+        warm_start:bool=False,
+        warm_start_adjusted:bool=True
+    ):
         self.signals = signals
         self.data_handler = data_handler
+        self.precompute = precompute
+        self.precomputed = False
+        self.warm_start = warm_start
+        self.warm_start_adjusted = warm_start_adjusted
+        self.warm_start_dts = []
+        self.warm_start_prices = None
         self.warmup = 0  # Used for 'burn in'
+        self.assets = []
+        self._update_assets()
+        self.buffers = self._create_shared_price_buffers()
+
+    def _update_assets(self):
+        """
+        Add any assets of the signals that are not yet in the
+        collection's list of assets, preserving their order.
+        """
+        known_assets = set(self.assets)
+        for signal in self.signals.values():
+            for asset in signal.assets:
+                if asset not in known_assets:
+                    known_assets.add(asset)
+                    self.assets.append(asset)
+
+    def _create_shared_price_buffers(self):
+        """
+        Create the price buffers shared by all signals, storing the
+        largest lookback of any signal, and attach them to each signal.
+        A NumPy ring buffer is used if all signals request one.
+
+        Returns
+        -------
+        `AssetPriceBuffers` or `ArrayAssetPriceBuffers`
+            The shared price buffers.
+        """
+        if len(self.signals) == 0:
+            return None
+        max_lookback = max(
+            max(signal.lookbacks) for signal in self.signals.values()
+        )
+        if all(signal.array_buffers for signal in self.signals.values()):
+            buffers_class = ArrayAssetPriceBuffers
+        else:
+            buffers_class = AssetPriceBuffers
+        buffers = buffers_class(list(self.assets), lookbacks=[max_lookback])
+        for signal in self.signals.values():
+            signal.buffers = buffers
+        return buffers
 
     def __getitem__(self, signal):
         """
@@ -41,6 +127,127 @@ class SignalsCollection(object):
         """
         return self.signals[signal]
 
+    def _obtain_appended_assets(self, dts):
+        """
+        Determine the assets that will receive a price at each of the
+        update timestamps, as these grow with any DynamicUniverse.
+
+        Parameters
+        ----------
+        dts : `list[pd.Timestamp]`
+            The update timestamps.
+
+        Returns
+        -------
+        `tuple(list[str], np.ndarray)`
+            The assets and the (time x asset) boolean matrix
+            of whether each asset receives a price.
+        """
+        assets = list(self.assets)
+        entry_rows = {asset: 0 for asset in assets}
+        for row, dt in enumerate(dts):
+            for signal in self.signals.values():
+                for asset in signal.universe.get_assets(dt):
+                    if asset not in entry_rows:
+                        entry_rows[asset] = row
+                        assets.append(asset)
+
+        entry_rows = np.array([entry_rows[asset] for asset in assets], dtype=np.int64)
+        appended = np.arange(len(dts))[:, np.newaxis] >= entry_rows[np.newaxis, :]
+        return assets, appended
+
+    def warm_start_buffers(self, dt, num_prices=None):
+        """
+        Fill the shared price buffer with the historical daily closing
+        prices of the current assets prior to the date of the provided
+        timestamp, as if the signals had been updated once per trading
+        day. Missing closes are forward-filled, as for the latest
+        prices obtained during a backtest.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The starting timestamp of the backtest. Closing prices
+            from this date onwards are not appended.
+        num_prices : `int`, optional
+            The number of closing prices to append. Defaults to the
+            largest number of warm-start prices needed by any signal,
+            which can exceed the shared buffer's lookback for signals
+            that keep running state, such as covariances or EMAs.
+        """
+        if self.buffers is None:
+            return
+        if num_prices is None:
+            num_prices = max(
+                signal.num_warm_start_prices for signal in self.signals.values()
+            )
+
+        prices_df = self.data_handler.get_assets_historical_range_close_price(
+            None, dt, self.assets, adjusted=self.warm_start_adjusted
+        )
+        if prices_df is None or num_prices <= 0:
+            return
+        prices_df = prices_df[prices_df.index < pd.Timestamp(dt).normalize()]
+        prices_df = prices_df.reindex(columns=self.assets).ffill().iloc[-num_prices:]
+
+        prices = prices_df.to_numpy(dtype=np.float64)
+        for row_prices in prices:
+            self.buffers.append_prices(self.assets, row_prices)
+            for signal in self.signals.values():
+                signal.on_prices_appended(self.assets)
+        self.warm_start_dts = list(prices_df.index)
+        self.warm_start_prices = prices
+        self.warmup += len(prices)
+
+    def precompute_signals(self, dts):
+        """
+        Obtain the prices of all assets at every update timestamp and
+        replace each signal with a PrecomputedSignal serving values
+        calculated over this whole history, preceded by any prices
+        appended by 'warm_start_buffers'.
+
+        Parameters
+        ----------
+        dts : `list[pd.Timestamp]`
+            The timestamps at which 'update' will be called.
+
+        Raises
+        ------
+        `ValueError`
+            If any signal does not implement 'precompute'.
+        """
+        unsupported = [
+            name for name, signal in self.signals.items()
+            if type(signal).precompute is Signal.precompute
+        ]
+        if len(unsupported) > 0:
+            raise ValueError(
+                "Signals %s do not support precomputation. Cannot "
+                "precompute the SignalsCollection, use it without "
+                "'precompute' instead." % ', '.join(sorted(unsupported))
+            )
+
+        dts = list(dts)
+        assets, appended = self._obtain_appended_assets(dts)
+        prices = self.data_handler.get_assets_historical_mid_prices(dts, assets)
+
+        # Prepend any warm-start prices, which were appended
+        # for the assets known at the time of the warm start
+        if self.warm_start_prices is not None:
+            num_cols = self.warm_start_prices.shape[1]
+            warm_prices = np.full((len(self.warm_start_dts), len(assets)), np.NaN)
+            warm_prices[:, :num_cols] = self.warm_start_prices
+            warm_appended = np.zeros(warm_prices.shape, dtype=bool)
+            warm_appended[:, :num_cols] = True
+            dts = self.warm_start_dts + dts
+            prices = np.vstack([warm_prices, prices])
+            appended = np.vstack([warm_appended, appended])
+        self.signals = {
+            name: PrecomputedSignal(signal, dts, assets, prices, appended)
+            for name, signal in self.signals.items()
+        }
+        self.precomputed = True
+
     def update(self, dt):
         """
         Updates the universe (if dynamic) for each signal as well
@@ -56,10 +263,16 @@ class SignalsCollection(object):
         for name, signal in self.signals.items():
             self.signals[name].update_assets(dt)
 
-        # Update all of the signals with new prices
-        for name, signal in self.signals.items():
-            assets = signal.assets
-            for asset in assets:
-                price = self.data_handler.get_asset_latest_mid_price(dt, asset)
-                self.signals[name].append(asset, price)
+        self._update_assets()
+
+        if self.precomputed:
+            for signal in self.signals.values():
+                signal.set_timestamp(dt)
+
+        # Update the shared buffers with a single price per asset
+        elif self.buffers is not None:
+            prices = self.data_handler.get_assets_latest_mid_prices(dt, self.assets)
+            self.buffers.append_prices(self.assets, prices)
+            for signal in self.signals.values():
+                signal.on_prices_appended(self.assets)
         self.warmup += 1
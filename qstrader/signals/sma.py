@@ -1,5 +1,6 @@
 import numpy as np
 
+from qstrader.signals.rolling import RollingPriceSums, rolling_window_sums
 from qstrader.signals.signal import Signal
 
 
@@ -8,6 +9,11 @@ class SMASignal(Signal):
     Indicator class to calculate simple moving average
     of last N periods for a set of prices.
 
+    Running sums of prices are kept in (asset x lookback) arrays,
+    which are updated with array operations as each row of prices
+    is appended, so that a query for any number of assets is a
+    single vectorised gather rather than O(lookback) per asset.
+
     Parameters
     ----------
     start_dt : `pd.Timestamp`
@@ -16,10 +22,43 @@ class SMASignal(Signal):
         The universe of assets to calculate the signals for.
     lookbacks : `list[int]`
         The number of lookback periods to store prices for.
+    array_buffers : `Boolean`, optional
+        Whether to store prices in a single NumPy ring buffer rather
+        than in per-asset deques. Defaults to False.
+    recompute_interval : `int`, optional
+        The number of prices after which the running sums are
+        recomputed exactly. Defaults to the largest lookback.
     """
 
-    def __init__(self, start_dt, universe, lookbacks):
-        super().__init__(start_dt, universe, lookbacks)
+    evaluate_aliases = ('sma',)
+
+    def __init__(
+        self, start_dt, universe, lookbacks,
+        array_buffers=False, recompute_interval=None
+    ):
+        super().__init__(
+            start_dt, universe, lookbacks, array_buffers=array_buffers
+        )
+        self.recompute_interval = (
+            recompute_interval if recompute_interval is not None
+            else max(lookbacks)
+        )
+        self.sums = RollingPriceSums(self.lookbacks, self.recompute_interval)
+
+    def on_prices_appended(self, assets):
+        """
+        Update the running sums of the assets
+        that have received a new price.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names that received a new price.
+        """
+        self.sums.append_prices(
+            self._obtain_state_rows(assets, self.sums),
+            self.buffers.windows(assets, 1)[:, -1]
+        )
 
     def _simple_moving_average(self, asset, lookback):
         """
@@ -39,7 +78,78 @@ class SMASignal(Signal):
         `float`
             The SMA value ('trend') for the period.
         """
-        return np.mean(self.buffers.prices['%s_%s' % (asset, lookback)])
+        return self.sma([asset], lookback)[0]
+
+    def sma(self, assets, lookback):
+        """
+        Calculate the lookback-period trend for
+        multiple assets at once.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The trend (SMA) for the period, aligned to the assets.
+        """
+        return self.sums.mean(
+            lookback, self._obtain_state_rows(assets, self.sums)
+        )
+
+    def precompute(self, prices, appended, lookback):
+        """
+        Calculate the trend (SMA) at every row of a (time x asset)
+        matrix of prices at once, matching the values obtained by
+        appending the prices one row at a time.
+
+        Parameters
+        ----------
+        prices : `np.ndarray`
+            The (time x asset) matrix of prices.
+        appended : `np.ndarray`
+            The (time x asset) boolean matrix of whether each price
+            is appended, which is False prior to an asset entering
+            the universe.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (time x asset) matrix of the trend (SMA).
+        """
+        missing = appended & np.isnan(prices)
+        num_prices = rolling_window_sums(appended.astype(np.int64), lookback)
+        num_missing = rolling_window_sums(missing.astype(np.int64), lookback)
+        sums = rolling_window_sums(
+            np.where(appended & ~missing, prices, 0.0), lookback
+        )
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / num_prices
+        return np.where((num_prices > 0) & (num_missing == 0), means, np.NaN)
+
+    def evaluate(self, assets, lookback):
+        """
+        Calculate the trend (SMA) for multiple assets at once.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The trend (SMA), aligned to the assets.
+        """
+        return self.sma(assets, lookback)
 
     def __call__(self, asset, lookback):
         """
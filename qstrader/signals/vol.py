@@ -1,6 +1,8 @@
 import numpy as np
-import pandas as pd
 
+from qstrader.signals.rolling import (
+    RollingReturnMoments, forward_fill_rows, rolling_window_sums
+)
 from qstrader.signals.signal import Signal
 
 
@@ -13,6 +15,12 @@ class VolatilitySignal(Signal):
     lookback parameter the volatility is calculated on
     this subset.
 
+    Running sums of returns and squared returns are kept in
+    (asset x lookback) arrays, which are updated with array
+    operations as each row of prices is appended, so that a
+    query for any number of assets is a single vectorised
+    calculation rather than O(lookback) per asset.
+
     Parameters
     ----------
     start_dt : `pd.Timestamp`
@@ -21,31 +29,47 @@ class VolatilitySignal(Signal):
         The universe of assets to calculate the signals for.
     lookbacks : `list[int]`
         The number of lookback periods to store prices for.
+    array_buffers : `Boolean`, optional
+        Whether to store prices in a single NumPy ring buffer rather
+        than in per-asset deques. Defaults to False.
+    recompute_interval : `int`, optional
+        The number of returns after which the running sums are
+        recomputed exactly. Defaults to the largest lookback.
     """
 
-    def __init__(self, start_dt, universe, lookbacks):
+    evaluate_aliases = ('volatility',)
+
+    def __init__(
+        self, start_dt, universe, lookbacks,
+        array_buffers=False, recompute_interval=None
+    ):
         bumped_lookbacks = [lookback + 1 for lookback in lookbacks]
-        super().__init__(start_dt, universe, bumped_lookbacks)
+        super().__init__(
+            start_dt, universe, bumped_lookbacks, array_buffers=array_buffers
+        )
+        self.return_lookbacks = list(lookbacks)
+        self.recompute_interval = (
+            recompute_interval if recompute_interval is not None
+            else max(lookbacks)
+        )
+        self.moments = RollingReturnMoments(
+            self.return_lookbacks, self.recompute_interval
+        )
 
-    @staticmethod
-    def _asset_lookback_key(asset, lookback):
+    def on_prices_appended(self, assets):
         """
-        Create the buffer dictionary lookup key based
-        on asset name and lookback period.
+        Update the running return moments of the
+        assets that have received a new price.
 
         Parameters
         ----------
-        asset : `str`
-            The asset symbol name.
-        lookback : `int`
-            The lookback period.
-
-        Returns
-        -------
-        `str`
-            The lookup key.
+        assets : `list[str]`
+            The asset symbol names that received a new price.
         """
-        return '%s_%s' % (asset, lookback + 1)
+        self.moments.append_prices(
+            self._obtain_state_rows(assets, self.moments),
+            self.buffers.windows(assets, 1)[:, -1]
+        )
 
     def _annualised_vol(self, asset, lookback):
         """
@@ -65,19 +89,92 @@ class VolatilitySignal(Signal):
         `float`
             The annualised volatility of returns.
         """
-        series = pd.Series(
-            self.buffers.prices[
-                VolatilitySignal._asset_lookback_key(
-                    asset, lookback
-                )
-            ]
-        )
-        returns = series.pct_change().dropna().to_numpy()
+        return self.volatility([asset], lookback)[0]
+
+    def volatility(self, assets, lookback):
+        """
+        Calculate the annualised volatility of returns
+        for multiple assets at once.
 
-        if len(returns) < 1:
-            return 0.0
-        else:
-            return np.std(returns) * np.sqrt(252)
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The annualised volatility, aligned to the assets.
+        """
+        return self.moments.std(
+            lookback, self._obtain_state_rows(assets, self.moments)
+        ) * np.sqrt(252)
+
+    def precompute(self, prices, appended, lookback):
+        """
+        Calculate the annualised volatility of returns at every row of a (time x asset)
+        matrix of prices at once, matching the values obtained by
+        appending the prices one row at a time.
+
+        Parameters
+        ----------
+        prices : `np.ndarray`
+            The (time x asset) matrix of prices.
+        appended : `np.ndarray`
+            The (time x asset) boolean matrix of whether each price
+            is appended, which is False prior to an asset entering
+            the universe.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (time x asset) matrix of the annualised volatility.
+        """
+        prices = np.where(appended, prices, np.NaN)
+        available = ~np.isnan(prices)
+
+        # Missing prices are forward-filled from the last available
+        # price, while prices prior to the first have no return
+        last = forward_fill_rows(available)
+        filled = np.take_along_axis(prices, np.clip(last, 0, None), axis=0)
+        filled[last < 0] = np.NaN
+        prev_filled = np.full(prices.shape, np.NaN)
+        prev_filled[1:] = filled[:-1]
+        with np.errstate(invalid='ignore'):
+            returns = np.where(available, prices / prev_filled - 1.0, 0.0)
+        has_return = ~np.isnan(prev_filled)
+        returns[~has_return] = 0.0
+
+        num_returns = rolling_window_sums(has_return.astype(np.int64), lookback)
+        sums = rolling_window_sums(returns, lookback)
+        sq_sums = rolling_window_sums(returns * returns, lookback)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / num_returns
+            variances = np.maximum(sq_sums / num_returns - means * means, 0.0)
+        return np.where(num_returns > 0, np.sqrt(variances), 0.0) * np.sqrt(252)
+
+    def evaluate(self, assets, lookback):
+        """
+        Calculate the annualised volatility of returns
+        for multiple assets at once.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The annualised volatility, aligned to the assets.
+        """
+        return self.volatility(assets, lookback)
 
     def __call__(self, asset, lookback):
         """
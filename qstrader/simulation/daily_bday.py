@@ -1,12 +1,22 @@
-import datetime
-
+import numpy as np
 import pandas as pd
-from pandas.tseries.offsets import BDay
 import pytz
 
+from qstrader.exchange.trading_calendar import TradingCalendar
 from qstrader.simulation.sim_engine import SimulationEngine
 from qstrader.simulation.event import SimulationEvent
 
+EVENT_TYPES = ('pre_market', 'market_open', 'market_close', 'post_market')
+EVENT_OFFSETS_NS = np.array(
+    [
+        0,
+        pd.Timedelta(hours=14, minutes=30).value,
+        pd.Timedelta(hours=21, minutes=0).value,
+        pd.Timedelta(hours=23, minutes=59).value
+    ],
+    dtype=np.int64
+)
+
 
 class DailyBusinessDaySimulationEngine(SimulationEngine):
     """
@@ -14,14 +24,20 @@ class DailyBusinessDaySimulationEngine(SimulationEngine):
     frequency defaulting to typical business days, that is
     Monday-Friday.
 
-    In particular it does not take into account any specific
-    regional holidays, such as Federal Holidays in the USA or
-    Bank Holidays in the UK.
+    Regional holidays, such as Federal Holidays in the USA or
+    Bank Holidays in the UK, are only skipped if a TradingCalendar
+    with the appropriate holiday rules is provided.
 
     It produces a pre-market event, a market open event,
     a market closing event and a post-market event for every day
     between the starting and ending dates.
 
+    The full event timeline is generated once on construction, as
+    an array of nanosecond UTC timestamps along with a parallel
+    array of event type codes indexing into EVENT_TYPES. This
+    supports len() and indexing or slicing of the events, e.g. for
+    progress reporting.
+
     Parameters
     ----------
     starting_day : `pd.Timestamp`
@@ -32,9 +48,15 @@ class DailyBusinessDaySimulationEngine(SimulationEngine):
         Whether to include a pre-market event
     post_market : `Boolean`, optional
         Whether to include a post-market event
+    calendar : `TradingCalendar`, optional
+        The calendar of trading days, which should be shared with
+        the exchange. Defaults to every weekday.
     """
 
-    def __init__(self, starting_day, ending_day, pre_market=True, post_market=True):
+    def __init__(
+        self, starting_day, ending_day, pre_market=True, post_market=True,
+        calendar=None
+    ):
         if ending_day < starting_day:
             raise ValueError(
                 "Ending date time %s is earlier than starting date time %s. "
@@ -46,22 +68,135 @@ class DailyBusinessDaySimulationEngine(SimulationEngine):
         self.ending_day = ending_day
         self.pre_market = pre_market
         self.post_market = post_market
+        self.calendar = calendar if calendar is not None else TradingCalendar()
         self.business_days = self._generate_business_days()
+        self.timestamps, self.event_codes = self._generate_timeline()
 
     def _generate_business_days(self):
         """
         Generate the list of business days using midnight UTC as
         the timestamp.
 
+        The trading days of a calendar day range are selected, which
+        without any holidays matches a BDay range while avoiding its
+        per-day offset arithmetic.
+
         Returns
         -------
         `list[pd.Timestamp]`
             The business day range list.
         """
         days = pd.date_range(
-            self.starting_day, self.ending_day, freq=BDay()
+            self.starting_day, self.ending_day, freq='D'
+        )
+        return days[self.calendar.trading_day_mask(days)]
+
+    def _generate_timeline(self):
+        """
+        Generate the timestamps and event type codes of all events,
+        by offsetting the business days for each included event type.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The int64 nanosecond UTC timestamps of the events and
+            their event type codes, in chronological order.
+        """
+        codes = np.array(
+            [
+                code for code, event_type in enumerate(EVENT_TYPES)
+                if (
+                    (event_type != 'pre_market' or self.pre_market) and
+                    (event_type != 'post_market' or self.post_market)
+                )
+            ],
+            dtype=np.int8
+        )
+
+        # Use the calendar date of each business day at midnight UTC
+        days = self.business_days
+        if days.tz is not None:
+            days = days.tz_localize(None)
+        days = days.normalize().asi8
+
+        timestamps = (
+            days[:, np.newaxis] + EVENT_OFFSETS_NS[codes][np.newaxis, :]
+        ).ravel()
+        event_codes = np.tile(codes, len(days))
+        return timestamps, event_codes
+
+    def _create_events(self, timestamps, event_codes):
+        """
+        Create the SimulationEvents for arrays of
+        timestamps and event type codes.
+
+        Parameters
+        ----------
+        timestamps : `np.ndarray`
+            The int64 nanosecond UTC timestamps of the events.
+        event_codes : `np.ndarray`
+            The event type codes of the events.
+
+        Returns
+        -------
+        `list[SimulationEvent]`
+            The simulation events.
+        """
+        return [
+            SimulationEvent(ts, EVENT_TYPES[code]) for ts, code in zip(
+                pd.DatetimeIndex(timestamps, tz=pytz.utc), event_codes
+            )
+        ]
+
+    @property
+    def market_close_timestamps(self):
+        """
+        The timestamps of the market close events, at which
+        signals are updated.
+
+        Returns
+        -------
+        `np.ndarray`
+            The int64 nanosecond UTC timestamps, in chronological order.
+        """
+        return self.timestamps[
+            self.event_codes == EVENT_TYPES.index('market_close')
+        ]
+
+    def __len__(self):
+        """
+        Obtain the number of simulation events.
+
+        Returns
+        -------
+        `int`
+            The number of simulation events.
+        """
+        return len(self.timestamps)
+
+    def __getitem__(self, index):
+        """
+        Obtain a simulation event, or a list of
+        simulation events for a slice.
+
+        Parameters
+        ----------
+        index : `int` or `slice`
+            The position(s) of the events in the timeline.
+
+        Returns
+        -------
+        `SimulationEvent` or `list[SimulationEvent]`
+            The simulation event(s).
+        """
+        if isinstance(index, slice):
+            return self._create_events(
+                self.timestamps[index], self.event_codes[index]
+            )
+        return SimulationEvent(
+            pd.Timestamp(self.timestamps[index], tz=pytz.utc),
+            EVENT_TYPES[self.event_codes[index]]
         )
-        return days
 
     def __iter__(self):
         """
@@ -73,35 +208,6 @@ class DailyBusinessDaySimulationEngine(SimulationEngine):
         `SimulationEvent`
             Market time simulation event to yield
         """
-        for index, bday in enumerate(self.business_days):
-            year = bday.year
-            month = bday.month
-            day = bday.day
-
-            if self.pre_market:
-                yield SimulationEvent(
-                    pd.Timestamp(
-                        datetime.datetime(year, month, day), tz='UTC'
-                    ), event_type="pre_market"
-                )
-
-            yield SimulationEvent(
-                pd.Timestamp(
-                    datetime.datetime(year, month, day, 14, 30),
-                    tz=pytz.utc
-                ), event_type="market_open"
-            )
-
-            yield SimulationEvent(
-                pd.Timestamp(
-                    datetime.datetime(year, month, day, 21, 00),
-                    tz=pytz.utc
-                ), event_type="market_close"
-            )
-
-            if self.post_market:
-                yield SimulationEvent(
-                    pd.Timestamp(
-                        datetime.datetime(year, month, day, 23, 59), tz='UTC'
-                    ), event_type="post_market"
-                )
+        timestamps = pd.DatetimeIndex(self.timestamps, tz=pytz.utc)
+        for ts, code in zip(timestamps, self.event_codes):
+            yield SimulationEvent(ts, EVENT_TYPES[code])
@@ -0,0 +1,122 @@
+from qstrader.simulation.sim_engine import SimulationEngine
+
+
+class EventSkippingSimulationEngine(SimulationEngine):
+    """
+    A SimulationEngine subclass that wraps another simulation engine
+    and only yields those of its events that can change the state
+    of a backtest, skipping the remainder.
+
+    An event is yielded if it is of a type on which prices are
+    always updated (by default 'market_close', on which signals are
+    updated and the equity curve is recorded), if it lies on one of
+    the provided price update timestamps, if it is a rebalance event,
+    or if the broker has pending orders that could be executed.
+
+    Skipping the remaining events, such as a 'market_open' with no
+    orders to execute, avoids a full broker revaluation whose market
+    values are superseded at the next yielded event, and so leaves
+    the equity curve unchanged.
+
+    The pending order state is checked as each event is reached, so
+    orders submitted at a rebalance are executed at the next event
+    at which the exchange is open.
+
+    Parameters
+    ----------
+    sim_engine : `SimulationEngine`
+        The simulation engine generating all events.
+    rebalance_schedule : `Rebalance`
+        The rebalance schedule of the quant trading system.
+    broker : `Broker`
+        The broker whose pending orders require events to be yielded.
+    update_event_types : `tuple[str]`, optional
+        The event types that are always yielded.
+        Defaults to ('market_close',).
+    price_update_dts : `list[pd.Timestamp]`, optional
+        Any further timestamps of price updates that are always yielded.
+    """
+
+    def __init__(
+        self,
+        sim_engine,
+        rebalance_schedule,
+        broker,
+        update_event_types=('market_close',),
+        price_update_dts=None
+    ):
+        self.sim_engine = sim_engine
+        self.rebalance_schedule = rebalance_schedule
+        self.broker = broker
+        self.update_event_types = frozenset(update_event_types)
+        self.price_update_dts = frozenset(
+            dt.value for dt in price_update_dts
+        ) if price_update_dts is not None else frozenset()
+        self.num_skipped = 0
+
+    @property
+    def market_close_timestamps(self):
+        """
+        The timestamps of the market close events of the wrapped
+        simulation engine, which are never skipped.
+
+        Returns
+        -------
+        `np.ndarray`
+            The int64 nanosecond UTC timestamps, in chronological order.
+        """
+        return self.sim_engine.market_close_timestamps
+
+    def _has_pending_orders(self):
+        """
+        Check whether the broker has any orders awaiting execution.
+        Brokers that do not expose their open orders are assumed to
+        always have pending orders.
+
+        Returns
+        -------
+        `Boolean`
+            Whether the broker has pending orders.
+        """
+        open_orders = getattr(self.broker, 'open_orders', None)
+        if open_orders is None:
+            return True
+        return any(not orders.empty() for orders in open_orders.values())
+
+    def _is_state_changing_event(self, event):
+        """
+        Check whether an event can change the state of a backtest.
+
+        Parameters
+        ----------
+        event : `SimulationEvent`
+            The simulation event.
+
+        Returns
+        -------
+        `Boolean`
+            Whether the event can change the backtest state.
+        """
+        return (
+            event.event_type in self.update_event_types or
+            event.ts.value in self.price_update_dts or
+            self.rebalance_schedule.is_rebalance_event(event.ts) or
+            self._has_pending_orders()
+        )
+
+    def __iter__(self):
+        """
+        Generate the events of the wrapped simulation engine
+        that can change the state of a backtest.
+
+        Yields
+        ------
+        `SimulationEvent`
+            Market time simulation event to yield
+        """
+        self.num_skipped = 0
+        for event in self.sim_engine:
+            if self._is_state_changing_event(event):
+                yield event
+            else:
+                self.num_skipped += 1
@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+import pytz
+
+from qstrader.exchange.trading_calendar import TradingCalendar
+from qstrader.simulation.daily_bday import EVENT_OFFSETS_NS
+from qstrader.simulation.event import SimulationEvent
+from qstrader.simulation.sim_engine import SimulationEngine
+
+INTRADAY_EVENT_TYPES = ('market_open', 'market_bar', 'market_close')
+
+
+class IntradayBarSimulationEngine(SimulationEngine):
+    """
+    A SimulationEngine subclass that generates events on an intraday
+    bar frequency, such as every minute, for each trading day.
+
+    For every trading day it produces a market open event, a market
+    bar event at the close of each bar within the trading session
+    and a market closing event, which coincides with the close of
+    the final bar. The trading session matches the market open and
+    close times of the DailyBusinessDaySimulationEngine.
+
+    As a multi-decade minute timeline runs to millions of events,
+    only the trading days are generated on construction. The event
+    timestamps of each day are generated as it is reached, keeping
+    memory usage bounded irrespective of the simulation length.
+
+    Parameters
+    ----------
+    starting_day : `pd.Timestamp`
+        The starting day of the simulation.
+    ending_day : `pd.Timestamp`
+        The ending day of the simulation.
+    bar_minutes : `int`, optional
+        The length of each bar in minutes. Defaults to one minute.
+    calendar : `TradingCalendar`, optional
+        The calendar of trading days, which should be shared with
+        the exchange. Defaults to every weekday.
+    """
+
+    def __init__(self, starting_day, ending_day, bar_minutes=1, calendar=None):
+        if ending_day < starting_day:
+            raise ValueError(
+                "Ending date time %s is earlier than starting date time %s. "
+                "Cannot create IntradayBarSimulationEngine "
+                "instance." % (ending_day, starting_day)
+            )
+
+        self.starting_day = starting_day
+        self.ending_day = ending_day
+        self.bar_minutes = bar_minutes
+        self.calendar = calendar if calendar is not None else TradingCalendar()
+        self.trading_days = self._generate_trading_days()
+        self.day_offsets, self.day_event_codes = self._generate_day_offsets()
+
+    def _generate_trading_days(self):
+        """
+        Generate the calendar dates (midnight UTC) of the trading days.
+
+        Returns
+        -------
+        `np.ndarray`
+            The int64 nanosecond timestamps of the trading days.
+        """
+        days = pd.date_range(
+            self.starting_day, self.ending_day, freq='D'
+        )
+        days = days[self.calendar.trading_day_mask(days)]
+        if days.tz is not None:
+            days = days.tz_localize(None)
+        return days.normalize().asi8
+
+    def _generate_day_offsets(self):
+        """
+        Generate the offsets from midnight and event type codes of
+        the events of a single trading day.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The int64 nanosecond offsets of the events and
+            their event type codes, in chronological order.
+        """
+        market_open = EVENT_OFFSETS_NS[1]
+        market_close = EVENT_OFFSETS_NS[2]
+        bar_ns = pd.Timedelta(minutes=self.bar_minutes).value
+        bar_offsets = np.arange(
+            market_open + bar_ns, market_close, bar_ns, dtype=np.int64
+        )
+        offsets = np.concatenate(
+            [[market_open], bar_offsets, [market_close]]
+        ).astype(np.int64)
+        event_codes = np.full(len(offsets), 1, dtype=np.int8)
+        event_codes[0] = 0
+        event_codes[-1] = 2
+        return offsets, event_codes
+
+    @property
+    def market_timestamps(self):
+        """
+        The timestamps of the market open and market close events of
+        every trading day, at which scheduled rebalances can occur,
+        without generating the timestamps of every bar.
+
+        Returns
+        -------
+        `np.ndarray`
+            The int64 nanosecond UTC timestamps, in chronological order.
+        """
+        return (
+            self.trading_days[:, np.newaxis] +
+            self.day_offsets[[0, -1]][np.newaxis, :]
+        ).ravel()
+
+    @property
+    def market_close_timestamps(self):
+        """
+        The timestamps of the market close events, at which
+        signals are updated.
+
+        Returns
+        -------
+        `np.ndarray`
+            The int64 nanosecond UTC timestamps, in chronological order.
+        """
+        return self.market_timestamps[1::2]
+
+    def __len__(self):
+        """
+        Obtain the number of simulation events.
+
+        Returns
+        -------
+        `int`
+            The number of simulation events.
+        """
+        return len(self.trading_days) * len(self.day_offsets)
+
+    def __iter__(self):
+        """
+        Generate the market open, market bar and market close
+        timestamps and event information of each trading day.
+
+        Yields
+        ------
+        `SimulationEvent`
+            Market time simulation event to yield
+        """
+        event_types = [INTRADAY_EVENT_TYPES[code] for code in self.day_event_codes]
+        for day in self.trading_days:
+            timestamps = pd.DatetimeIndex(day + self.day_offsets, tz=pytz.utc)
+            for ts, event_type in zip(timestamps, event_types):
+                yield SimulationEvent(ts, event_type)
@@ -1,3 +1,7 @@
+import numpy as np
+import pandas as pd
+
+from qstrader.exchange.trading_calendar import TradingCalendar
 from qstrader.system.rebalance.rebalance import Rebalance
 
 
@@ -7,16 +11,67 @@ class BuyAndHoldRebalance(Rebalance):
     order to create a single set of orders at the beginning of
     a backtest, with no further rebalances carried out.
 
+    The rebalance is carried out at the market close of the first
+    trading day of the calendar from the start date onwards.
+
     Parameters
     ----------
     start_dt : `pd.Timestamp`
         The starting datetime of the buy and hold rebalance.
+    calendar : `TradingCalendar`, optional
+        The calendar of trading days, which should be shared with
+        the simulation engine. Defaults to every weekday.
     """
 
-    def __init__(self, start_dt):
+    def __init__(self, start_dt, calendar=None):
         self.start_dt = start_dt
+        self.calendar = calendar if calendar is not None else TradingCalendar()
         self.pre_market_time = self.set_market_time(False)
-        #self.rebalances = [start_dt]
+        self.rebalance_dt = self._obtain_rebalance_dt()
+
+    def _obtain_rebalance_dt(self):
+        """
+        Obtain the first market time on a trading day
+        from the start date onwards.
+
+        Returns
+        -------
+        `pd.Timestamp`
+            The timestamp of the single rebalance.
+        """
+        hour, minute, second = self.pre_market_time
+        market_offset = pd.Timedelta(hours=hour, minutes=minute, seconds=second)
+        day = self.start_dt.normalize()
+        while (
+            day + market_offset < self.start_dt or
+            not self.calendar.is_trading_day(day)
+        ):
+            day += pd.Timedelta(days=1)
+        return day + market_offset
+
+    def _is_rebalance_time(self, dt):
+        return dt == self.rebalance_dt
+
+    def _rebalance_mask(self, dts):
+        """
+        Determine the first timestamp of a timeline at the market
+        time on a trading day from the start date onwards.
+
+        Parameters
+        ----------
+        dts : `pd.DatetimeIndex`
+            The (UTC) timestamps of the timeline.
 
-    def is_rebalance_event(self, dt):
-        return dt >= self.start_dt and self.is_market_time(self.pre_market_time, dt)
+        Returns
+        -------
+        `np.ndarray`
+            The boolean mask of the single rebalance event.
+        """
+        candidates = np.flatnonzero(
+            np.asarray(dts >= self.start_dt) &
+            self.market_time_mask(self.pre_market_time, dts) &
+            self.calendar.trading_day_mask(dts)
+        )
+        mask = np.zeros(len(dts), dtype=bool)
+        mask[candidates[:1]] = True
+        return mask
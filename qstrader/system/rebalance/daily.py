@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytz
 
@@ -31,27 +32,9 @@ class DailyRebalance(Rebalance):
     ):
         self.start_date = start_date
         #self.end_date = end_date
-        self.market_time = self._set_market_time(pre_market)
+        self.market_time = self.set_market_time(pre_market)
         #self.rebalances = self._generate_rebalances()
 
-    def _set_market_time(self, pre_market):
-        """
-        Determines whether to use market open or market close
-        as the rebalance time.
-
-        Parameters
-        ----------
-        pre_market : `Boolean`
-            Whether to use market open or market close
-            as the rebalance time.
-
-        Returns
-        -------
-        `str`
-            The string representation of the market time.
-        """
-        return "14:30:00" if pre_market else "21:00:00"
-
     # def _generate_rebalances(self):
     #     """
     #     Output the rebalance timestamp list.
@@ -74,5 +57,25 @@ class DailyRebalance(Rebalance):
 
     #     return rebalance_times
 
-    def is_rebalance_event(self, dt):
+    def _is_rebalance_time(self, dt):
         return dt >= self.start_date and self.is_market_time(self.market_time, dt)
+
+    def _rebalance_mask(self, dts):
+        """
+        Determine which of the timestamps of a timeline
+        lie at the market time.
+
+        Parameters
+        ----------
+        dts : `pd.DatetimeIndex`
+            The (UTC) timestamps of the timeline.
+
+        Returns
+        -------
+        `np.ndarray`
+            The boolean mask of rebalance events.
+        """
+        return (
+            np.asarray(dts >= self.start_date) &
+            self.market_time_mask(self.market_time, dts)
+        )
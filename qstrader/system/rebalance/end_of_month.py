@@ -1,6 +1,8 @@
+import numpy as np
 import pandas as pd
 import pytz
 
+from qstrader.exchange.trading_calendar import TradingCalendar, _calendar_date
 from qstrader.system.rebalance.rebalance import Rebalance
 
 
@@ -8,7 +10,12 @@ class EndOfMonthRebalance(Rebalance):
     """
     Generates a list of rebalance timestamps for pre- or post-market,
     for the final calendar day of the month between the starting and
-    ending dates provided.
+    ending dates provided, or optionally for the final business day.
+
+    The final business day of each month is its final trading day
+    according to the calendar, which accounts for any holidays, and
+    is used both when checking individual timestamps and when the
+    schedule is compiled against the timeline of a simulation engine.
 
     All timestamps produced are set to UTC.
 
@@ -16,31 +23,125 @@ class EndOfMonthRebalance(Rebalance):
     ----------
     start_dt : `pd.Timestamp`
         The starting datetime of the rebalance range.
-    end_dt : `pd.Timestamp`
-        The ending datetime of the rebalance range.
     pre_market : `Boolean`, optional
         Whether to carry out the rebalance at market open/close on
         the final day of the month. Defaults to False, i.e at
         market close.
+    business_month_end : `Boolean`, optional
+        Whether to rebalance on the final business day of the month
+        rather than the final calendar day, which is skipped if it
+        is not a business day. Defaults to False.
+    calendar : `TradingCalendar`, optional
+        The calendar of trading days, which should be shared with
+        the simulation engine. Defaults to every weekday.
     """
 
     def __init__(
         self,
         start_dt,
         #end_dt,
-        pre_market=False
+        pre_market=False,
+        business_month_end=False,
+        calendar=None
     ):
         self.start_dt = start_dt
         #self.end_dt = end_dt
         self.market_time = self.set_market_time(pre_market)
+        self.business_month_end = business_month_end
+        self.calendar = calendar if calendar is not None else TradingCalendar()
+        self.month_end_days = {}
         #self.rebalances = self._generate_rebalances()
 
-    
-    def is_rebalance_event(self, dt):
-        return dt >= self.start_dt and dt.is_month_end and self.is_market_time(self.market_time, dt)
+    def _obtain_month_end_day(self, year, month):
+        """
+        Obtain the final trading day of a month, caching it per month.
+
+        Parameters
+        ----------
+        year : `int`
+            The calendar year.
+        month : `int`
+            The calendar month.
+
+        Returns
+        -------
+        `int`
+            The int64 nanosecond timestamp (midnight) of the final
+            trading day, or -1 if the month has no trading days.
+        """
+        month_end_day = self.month_end_days.get((year, month))
+        if month_end_day is None:
+            month_start = pd.Timestamp(year, month, 1)
+            days = pd.date_range(
+                month_start, periods=month_start.days_in_month, freq='D'
+            )
+            trading_days = days[self.calendar.trading_day_mask(days)]
+            month_end_day = trading_days[-1].value if len(trading_days) > 0 else -1
+            self.month_end_days[(year, month)] = month_end_day
+        return month_end_day
+
+    def _is_month_end(self, dt):
+        """
+        Check whether a timestamp lies on the final (calendar
+        or business) day of its month.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp to check.
+
+        Returns
+        -------
+        `Boolean`
+            Whether the timestamp lies on the final day of the month.
+        """
+        if self.business_month_end:
+            return (
+                _calendar_date(dt).value ==
+                self._obtain_month_end_day(dt.year, dt.month)
+            )
+        return dt.is_month_end
+
+    def _is_rebalance_time(self, dt):
+        return dt >= self.start_dt and self._is_month_end(dt) and self.is_market_time(self.market_time, dt)
+
+    def _rebalance_mask(self, dts):
+        """
+        Determine which of the timestamps of a timeline lie at the
+        market time on the final (calendar or business) day of
+        the month.
+
+        Parameters
+        ----------
+        dts : `pd.DatetimeIndex`
+            The (UTC) timestamps of the timeline.
+
+        Returns
+        -------
+        `np.ndarray`
+            The boolean mask of rebalance events.
+        """
+        mask = (
+            np.asarray(dts >= self.start_dt) &
+            self.market_time_mask(self.market_time, dts)
+        )
+        if not self.business_month_end:
+            return mask & np.asarray(dts.is_month_end)
 
+        dates = dts.tz_localize(None) if dts.tz is not None else dts
+        dates = dates.normalize()
+        months, month_idx = np.unique(
+            np.asarray(dates.year * 12 + dates.month - 1), return_inverse=True
+        )
+        month_end_days = np.array(
+            [
+                self._obtain_month_end_day(month // 12, month % 12 + 1)
+                for month in months
+            ],
+            dtype=np.int64
+        )
+        return mask & (dates.asi8 == month_end_days[month_idx])
 
-    
     # def _generate_rebalances(self):
     #     """
     #     Utilise the Pandas date_range method to create the appropriate
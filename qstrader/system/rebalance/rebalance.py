@@ -1,19 +1,95 @@
 from abc import ABCMeta, abstractmethod
 
+import numpy as np
+import pandas as pd
+import pytz
+
 
 class Rebalance(object):
     """
     Interface to a generic list of system logic and
     trade order rebalance timestamps.
+
+    The schedule can optionally be compiled against the timeline
+    of a simulation engine via 'compile', after which each check
+    of a rebalance event is a single hash lookup of its nanosecond
+    timestamp rather than an evaluation of the schedule predicates.
     """
 
     __metaclass__ = ABCMeta
 
-    @abstractmethod
+    rebalance_set = None
+
     def is_rebalance_event(self, dt) -> bool:
+        """
+        Check whether a timestamp is part of the rebalance schedule,
+        via the compiled schedule if available.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp to check.
+
+        Returns
+        -------
+        `Boolean`
+            Whether the timestamp is a rebalance event.
+        """
+        if self.rebalance_set is not None:
+            return dt.value in self.rebalance_set
+        return self._is_rebalance_time(dt)
+
+    @abstractmethod
+    def _is_rebalance_time(self, dt) -> bool:
         raise NotImplementedError(
-            "Should implement is_rebalance_event()"
+            "Should implement _is_rebalance_time()"
         )
+
+    def _rebalance_mask(self, dts):
+        """
+        Determine which of the timestamps of a timeline are rebalance
+        events. Subclasses should override this with a vectorised
+        calculation, otherwise each timestamp is checked in turn.
+
+        Parameters
+        ----------
+        dts : `pd.DatetimeIndex`
+            The (UTC) timestamps of the timeline.
+
+        Returns
+        -------
+        `np.ndarray`
+            The boolean mask of rebalance events.
+        """
+        return np.array([self.is_rebalance_event(dt) for dt in dts], dtype=bool)
+
+    def compile(self, timestamps):
+        """
+        Compile the rebalance schedule against the timeline of a
+        simulation engine into a set of nanosecond timestamps, such
+        that subsequent checks are O(1) hash lookups.
+
+        Parameters
+        ----------
+        timestamps : `np.ndarray` or `list[pd.Timestamp]`
+            The timeline, either as int64 nanosecond UTC timestamps
+            or as timestamps.
+
+        Returns
+        -------
+        `np.ndarray`
+            The boolean mask of rebalance events within the timeline.
+        """
+        if isinstance(timestamps, np.ndarray) and timestamps.dtype == np.int64:
+            dts = pd.DatetimeIndex(timestamps).tz_localize(pytz.utc)
+        else:
+            dts = pd.DatetimeIndex(timestamps)
+            if dts.tz is None:
+                dts = dts.tz_localize(pytz.utc)
+        self.rebalance_set = None
+        mask = np.asarray(self._rebalance_mask(dts), dtype=bool)
+        self.rebalance_set = frozenset(dts.asi8[mask].tolist())
+        return mask
     
     def set_market_time(self, pre_market:bool):
         """
@@ -37,7 +113,27 @@ class Rebalance(object):
     def is_market_time(self, market_time, dt) -> bool:
         return dt.hour == market_time[0] and dt.minute == market_time[1] and dt.second == market_time[2]
 
+    def market_time_mask(self, market_time, dts):
+        """
+        Determine which of multiple timestamps lie at a market time.
+
+        Parameters
+        ----------
+        market_time : `tuple(int)`
+            The (hour, minute, second) of the market time.
+        dts : `pd.DatetimeIndex`
+            The timestamps to check.
 
+        Returns
+        -------
+        `np.ndarray`
+            The boolean mask of timestamps at the market time.
+        """
+        return np.asarray(
+            (dts.hour == market_time[0]) &
+            (dts.minute == market_time[1]) &
+            (dts.second == market_time[2])
+        )
 
     # @abstractmethod
     # def output_rebalances(self):
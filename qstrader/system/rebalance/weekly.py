@@ -67,7 +67,29 @@ class WeeklyRebalance(Rebalance):
         result = np.where(self.weekdays == weekday)
         return result[0][0]
 
+    def _is_rebalance_time(self, dt) -> bool:
+        return dt >= self.start_date and self.weekday == dt.day_of_week and self.is_market_time(self.pre_market_time, dt)
+
+    def _rebalance_mask(self, dts):
+        """
+        Determine which of the timestamps of a timeline lie at the
+        market time on the rebalance weekday.
 
+        Parameters
+        ----------
+        dts : `pd.DatetimeIndex`
+            The (UTC) timestamps of the timeline.
+
+        Returns
+        -------
+        `np.ndarray`
+            The boolean mask of rebalance events.
+        """
+        return (
+            np.asarray(dts >= self.start_date) &
+            np.asarray(dts.dayofweek == self.weekday) &
+            self.market_time_mask(self.pre_market_time, dts)
+        )
 
     # def _generate_rebalances(self):
     #     """
@@ -92,7 +114,3 @@ class WeeklyRebalance(Rebalance):
     #     ]
 
     #     return rebalance_times
-
-    def is_rebalance_event(self, dt) -> bool:
-        return dt >= self.start_date and self.weekday == dt.day_of_week and self.is_market_time(self.pre_market_time, dt)
-    
\ No newline at end of file
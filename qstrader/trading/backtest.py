@@ -13,8 +13,12 @@ from qstrader.broker.simulated_broker import SimulatedBroker
 from qstrader.broker.fee_model.zero_fee_model import ZeroFeeModel
 from qstrader.data.backtest_data_handler import BacktestDataHandler
 from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader.data.intraday_bar_csv import CSVIntradayBarDataSource
 from qstrader.exchange.simulated_exchange import SimulatedExchange
+from qstrader.exchange.trading_calendar import TradingCalendar
 from qstrader.simulation.daily_bday import DailyBusinessDaySimulationEngine
+from qstrader.simulation.event_skipping import EventSkippingSimulationEngine
+from qstrader.simulation.intraday_bar import IntradayBarSimulationEngine
 from qstrader.system.qts import QuantTradingSystem
 from qstrader.system.rebalance.buy_and_hold import BuyAndHoldRebalance
 from qstrader.system.rebalance.daily import DailyRebalance
@@ -68,6 +72,22 @@ class BacktestTradingSession(TradingSession):
     burn_in_dt : `pd.Timestamp`, optional
         The optional date provided to begin tracking strategy statistics,
         which is used for strategies requiring a period of data 'burn in'
+    calendar : `TradingCalendar`, optional
+        The calendar of trading days to simulate, which is shared
+        with the broker's exchange. Defaults to the calendar of the
+        broker's exchange, if any, otherwise every weekday.
+    skip_events : `Boolean`, optional
+        Whether to only simulate the events that can change the state
+        of the backtest, i.e. price updates at market close, rebalances
+        and events at which pending orders can be executed. Defaults
+        to False.
+    bar_minutes : `int`, optional
+        The length in minutes of intraday bars to simulate via an
+        IntradayBarSimulationEngine, which adds a 'market_bar' event
+        at the close of each bar between market open and close. The
+        broker is updated on each bar, so pending orders can execute
+        intraday, while signals, rebalances and the equity curve
+        remain daily. Defaults to None, i.e. daily events only.
     """
 
     def __init__(
@@ -85,10 +105,14 @@ class BacktestTradingSession(TradingSession):
         portfolio_name:str=DEFAULT_PORTFOLIO_NAME,
         long_only:bool=False,
         burn_in_dt:pd.Timestamp=None,
+        calendar:TradingCalendar=None,
+        skip_events:bool=False,
+        bar_minutes:int=None,
         **kwargs
     ):
         #self.start_dt = start_dt
         self.end_dt = end_dt
+        self.burn_in_dt = burn_in_dt
 
         super(BacktestTradingSession, self).__init__(
             start_dt=start_dt,
@@ -99,14 +123,16 @@ class BacktestTradingSession(TradingSession):
             portfolio_id=portfolio_id,
             rebalance=rebalance,
             rebalance_weekday=rebalance_weekday,
-            long_only=long_only
+            long_only=long_only,
+            calendar=self._create_calendar(calendar, broker)
             
         )
 
         self.signals = self.alpha_model.signals
         self.account_name = account_name
         self.portfolio_name = portfolio_name
-        self.burn_in_dt = burn_in_dt
+        self.skip_events = skip_events
+        self.bar_minutes = bar_minutes
 
         self.broker.create_portfolio(portfolio_id, portfolio_name)
         self.broker.subscribe_funds_to_portfolio(portfolio_id)
@@ -142,7 +168,8 @@ class BacktestTradingSession(TradingSession):
         used within the backtest.
 
         TODO: Currently defaults to CSV data sources of daily bar data in
-        the YahooFinance format.
+        the YahooFinance format, or of intraday bar data when the session
+        was created with `bar_minutes`.
 
         Parameters
         ----------
@@ -173,30 +200,103 @@ class BacktestTradingSession(TradingSession):
             csv_dir = os.environ.get('QSTRADER_CSV_DATA_DIR')
 
         # TODO: Only equities are supported by QSTrader for now.
-        data_source = CSVDailyBarDataSource(csv_dir, Equity)
+        if self.bar_minutes is not None:
+            data_source = CSVIntradayBarDataSource(csv_dir, Equity)
+        else:
+            data_source = CSVDailyBarDataSource(csv_dir, Equity)
 
         data_handler = BacktestDataHandler(
             self.universe, data_sources=[data_source]
         )
         return data_handler
 
-    
+    def _create_calendar(self, calendar, broker):
+        """
+        Determine the calendar of trading days to simulate, falling
+        back to the calendar of the broker's exchange and otherwise
+        to every weekday.
+
+        A provided calendar is also assigned to the broker's exchange,
+        so that the simulation engine, rebalance schedule and exchange
+        share a single calendar instance.
+
+        Parameters
+        ----------
+        calendar : `TradingCalendar` or None
+            The (potential) calendar of trading days.
+        broker : `Broker`
+            The broker whose exchange calendar is otherwise used.
+
+        Returns
+        -------
+        `TradingCalendar`
+            The calendar of trading days.
+        """
+        exchange = getattr(broker, 'exchange', None)
+        if calendar is None:
+            calendar = getattr(exchange, 'calendar', None)
+        if calendar is None:
+            calendar = TradingCalendar()
+        if exchange is not None and hasattr(exchange, 'calendar'):
+            exchange.calendar = calendar
+        return calendar
+
+    def _create_rebalance_event_times(self):
+        """
+        Creates the rebalance schedule used to determine when to
+        execute the quant trading strategy throughout the backtest.
+
+        As rebalances are not carried out during any 'burn in' period,
+        a buy and hold rebalance is instead scheduled from the end of
+        the burn in period, otherwise it would never be carried out.
+
+        Returns
+        -------
+        `Rebalance`
+            The rebalance schedule.
+        """
+        if (
+            self.rebalance == 'buy_and_hold' and
+            self.burn_in_dt is not None and
+            self.burn_in_dt > self.start_dt
+        ):
+            return BuyAndHoldRebalance(self.burn_in_dt, calendar=self.calendar)
+        return super(BacktestTradingSession, self)._create_rebalance_event_times()
 
     def _create_simulation_engine(self):
         """
         Create a simulation engine instance to generate the events
-        used for the quant trading algorithm to act upon.
-
-        TODO: Currently hardcoded to daily events
+        used for the quant trading algorithm to act upon, either
+        daily or on an intraday bar frequency if 'bar_minutes' is set.
 
         Returns
         -------
         `SimulationEngine`
             The simulation engine generating simulation timestamps.
         """
-        return DailyBusinessDaySimulationEngine(
-            self.start_dt, self.end_dt, pre_market=False, post_market=False
-        )
+        if self.bar_minutes is None:
+            sim_engine = DailyBusinessDaySimulationEngine(
+                self.start_dt, self.end_dt, pre_market=False, post_market=False,
+                calendar=self.calendar
+            )
+            timeline = sim_engine.timestamps
+        else:
+            sim_engine = IntradayBarSimulationEngine(
+                self.start_dt, self.end_dt, bar_minutes=self.bar_minutes,
+                calendar=self.calendar
+            )
+            # Rebalances only occur at market open or close, so the
+            # schedule is compiled against these rather than every bar
+            timeline = sim_engine.market_timestamps
+
+        # Compile the rebalance schedule against the event
+        # timeline so that each rebalance check is a hash lookup
+        self.rebalance_schedule.compile(timeline)
+        if self.skip_events:
+            return EventSkippingSimulationEngine(
+                sim_engine, self.rebalance_schedule, self.broker
+            )
+        return sim_engine
 
     def ___create_rebalance_event_times(self):
         """
@@ -350,13 +450,29 @@ class BacktestTradingSession(TradingSession):
 
         stats = {'target_allocations': []}
 
+        # Fill the signal buffers from the historical prices
+        # prior to the start of the backtest
+        if self.signals is not None and self.signals.warm_start:
+            self.signals.warm_start_buffers(self.start_dt)
+
+        # Precompute the signals over the whole price history
+        # at the market close timestamps on which they would be updated,
+        # taken from the simulation engine's timeline arrays rather than
+        # by generating every (intraday) event
+        if self.signals is not None and self.signals.precompute:
+            self.signals.precompute_signals(
+                pd.to_datetime(self.sim_engine.market_close_timestamps, utc=True)
+            )
+
         for event in self.sim_engine:
             # Output the system event and timestamp
             dt = event.ts
             if settings.PRINT_EVENTS:
                 print("(%s) - %s" % (event.ts, event.event_type))
 
-            # Update the simulated broker
+            # Update the simulated broker, which for intraday
+            # 'market_bar' events is all that is carried out, as
+            # signals and the equity curve are updated at market close
             self.broker.update(dt)
 
             # Update any signals on a daily basis
@@ -7,6 +7,7 @@ from qstrader.system.rebalance.buy_and_hold import BuyAndHoldRebalance
 from qstrader.system.qts import QuantTradingSystem
 from build.lib.qstrader.broker.broker import Broker
 from qstrader.exchange.exchange import Exchange
+from qstrader.exchange.trading_calendar import TradingCalendar
 from qstrader.broker.fee_model.fee_model import FeeModel
 from qstrader.asset.universe.universe import Universe
 from qstrader import data
@@ -32,6 +33,7 @@ class TradingSession(object):
         long_only:bool,
         rebalance:str,
         rebalance_weekday:str=None,
+        calendar:TradingCalendar=None,
         **kwargs
         
     ) -> None:
@@ -44,6 +46,7 @@ class TradingSession(object):
         self.long_only = long_only
         self.rebalance = rebalance
         self.rebalance_weekday = rebalance_weekday
+        self.calendar = calendar
 
         if rebalance == 'weekly' and rebalance_weekday is None:
             raise ValueError(
@@ -126,13 +129,19 @@ class TradingSession(object):
             The list of rebalance timestamps.
         """
         if self.rebalance == 'buy_and_hold':
-            rebalancer = BuyAndHoldRebalance(self.start_dt)
+            rebalancer = BuyAndHoldRebalance(
+                self.start_dt, calendar=self.calendar
+            )
         elif self.rebalance == 'daily':
             rebalancer = DailyRebalance(self.start_dt)
         elif self.rebalance == 'weekly':
             rebalancer = WeeklyRebalance(self.start_dt, self.rebalance_weekday)
         elif self.rebalance == 'end_of_month':
             rebalancer = EndOfMonthRebalance(self.start_dt)
+        elif self.rebalance == 'end_of_business_month':
+            rebalancer = EndOfMonthRebalance(
+                self.start_dt, business_month_end=True, calendar=self.calendar
+            )
         else:
             raise ValueError(
                 'Unknown rebalance frequency "%s" provided.' % self.rebalance
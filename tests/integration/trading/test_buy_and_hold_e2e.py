@@ -0,0 +1,47 @@
+import pandas as pd
+import pytz
+
+from qstrader.alpha_model.fixed_signals import FixedSignalsAlphaModel
+from qstrader.asset.equity import Equity
+from qstrader.asset.universe.static import StaticUniverse
+from qstrader.broker.simulated_broker import SimulatedBroker
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader.exchange.simulated_exchange import SimulatedExchange
+from qstrader.trading.backtest import BacktestTradingSession
+from qstrader import settings
+
+
+def test_buy_and_hold_rebalances_after_burn_in(etf_filepath):
+    """
+    Checks that a buy and hold backtest with a burn in period later
+    than its start date rebalances once, at the end of the burn in.
+    """
+    settings.set_print_events(False)
+    assets = ['EQ:ABC', 'EQ:DEF']
+    universe = StaticUniverse(assets)
+    start_dt = pd.Timestamp('2019-01-01 00:00:00', tz=pytz.UTC)
+    burn_in_dt = pd.Timestamp('2019-01-10 00:00:00', tz=pytz.UTC)
+    end_dt = pd.Timestamp('2019-01-31 23:59:00', tz=pytz.UTC)
+
+    data_handler = BacktestDataHandler(
+        universe, data_sources=[CSVDailyBarDataSource(etf_filepath, Equity)]
+    )
+    broker = SimulatedBroker(start_dt, SimulatedExchange(start_dt), data_handler)
+    backtest = BacktestTradingSession(
+        start_dt,
+        end_dt,
+        universe,
+        FixedSignalsAlphaModel({'EQ:ABC': 0.6, 'EQ:DEF': 0.4}),
+        broker=broker,
+        rebalance='buy_and_hold',
+        long_only=True,
+        cash_buffer_percentage=0.05,
+        burn_in_dt=burn_in_dt
+    )
+    backtest.run(results=False)
+
+    assert backtest.rebalance_schedule.rebalance_set == frozenset(
+        [pd.Timestamp('2019-01-10 21:00:00', tz=pytz.UTC).value]
+    )
+    assert len(backtest.broker.portfolios['000001'].pos_handler.positions) == 2
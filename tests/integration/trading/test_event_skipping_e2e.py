@@ -0,0 +1,63 @@
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.alpha_model.fixed_signals import FixedSignalsAlphaModel
+from qstrader.asset.equity import Equity
+from qstrader.asset.universe.static import StaticUniverse
+from qstrader.broker.simulated_broker import SimulatedBroker
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader.exchange.simulated_exchange import SimulatedExchange
+from qstrader.trading.backtest import BacktestTradingSession
+from qstrader import settings
+
+
+def _run_backtest(etf_filepath, rebalance, skip_events):
+    """
+    Run a fixed weight backtest over the ETF fixtures.
+    """
+    settings.set_print_events(False)
+    assets = ['EQ:ABC', 'EQ:DEF']
+    universe = StaticUniverse(assets)
+    start_dt = pd.Timestamp('2019-01-01 00:00:00', tz=pytz.UTC)
+    end_dt = pd.Timestamp('2019-01-31 23:59:00', tz=pytz.UTC)
+
+    data_handler = BacktestDataHandler(
+        universe, data_sources=[CSVDailyBarDataSource(etf_filepath, Equity)]
+    )
+    broker = SimulatedBroker(start_dt, SimulatedExchange(start_dt), data_handler)
+    backtest = BacktestTradingSession(
+        start_dt,
+        end_dt,
+        universe,
+        FixedSignalsAlphaModel({'EQ:ABC': 0.6, 'EQ:DEF': 0.4}),
+        broker=broker,
+        rebalance=rebalance,
+        rebalance_weekday='WED',
+        long_only=True,
+        cash_buffer_percentage=0.05,
+        skip_events=skip_events
+    )
+    backtest.run(results=False)
+    return backtest
+
+
+@pytest.mark.parametrize('rebalance', ['weekly', 'end_of_month'])
+def test_event_skipping_matches_full_simulation(etf_filepath, rebalance):
+    """
+    Checks that skipping events which cannot change the backtest
+    state produces the same equity curve and portfolio history
+    as simulating every event.
+    """
+    full = _run_backtest(etf_filepath, rebalance, skip_events=False)
+    skipped = _run_backtest(etf_filepath, rebalance, skip_events=True)
+
+    assert skipped.sim_engine.num_skipped > 0
+    pd.testing.assert_frame_equal(
+        skipped.get_equity_curve(), full.get_equity_curve()
+    )
+    pd.testing.assert_frame_equal(
+        skipped.broker.portfolios['000001'].history_to_df(),
+        full.broker.portfolios['000001'].history_to_df()
+    )
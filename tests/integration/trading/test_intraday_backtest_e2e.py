@@ -0,0 +1,78 @@
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.alpha_model.fixed_signals import FixedSignalsAlphaModel
+from qstrader.asset.equity import Equity
+from qstrader.asset.universe.static import StaticUniverse
+from qstrader.broker.simulated_broker import SimulatedBroker
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader.data.intraday_bar_csv import CSVIntradayBarDataSource
+from qstrader.exchange.simulated_exchange import SimulatedExchange
+from qstrader.simulation.intraday_bar import IntradayBarSimulationEngine
+from qstrader.trading.backtest import BacktestTradingSession
+from qstrader import settings
+
+
+def _run_backtest(etf_filepath, rebalance, bar_minutes):
+    """
+    Run a fixed weight backtest over the ETF fixtures.
+    """
+    settings.set_print_events(False)
+    assets = ['EQ:ABC', 'EQ:DEF']
+    universe = StaticUniverse(assets)
+    start_dt = pd.Timestamp('2019-01-01 00:00:00', tz=pytz.UTC)
+    end_dt = pd.Timestamp('2019-01-31 23:59:00', tz=pytz.UTC)
+
+    data_handler = BacktestDataHandler(
+        universe, data_sources=[CSVDailyBarDataSource(etf_filepath, Equity)]
+    )
+    broker = SimulatedBroker(start_dt, SimulatedExchange(start_dt), data_handler)
+    backtest = BacktestTradingSession(
+        start_dt,
+        end_dt,
+        universe,
+        FixedSignalsAlphaModel({'EQ:ABC': 0.6, 'EQ:DEF': 0.4}),
+        broker=broker,
+        rebalance=rebalance,
+        rebalance_weekday='WED',
+        long_only=True,
+        cash_buffer_percentage=0.05,
+        bar_minutes=bar_minutes
+    )
+    backtest.run(results=False)
+    return backtest
+
+
+@pytest.mark.parametrize('rebalance', ['weekly', 'end_of_month'])
+def test_intraday_bars_match_daily_simulation(etf_filepath, rebalance):
+    """
+    Checks that simulating intraday bars over daily bar data, whose
+    prices do not change between market open and close, produces the
+    same equity curve and portfolio history as a daily simulation.
+    """
+    daily = _run_backtest(etf_filepath, rebalance, bar_minutes=None)
+    intraday = _run_backtest(etf_filepath, rebalance, bar_minutes=60)
+
+    assert isinstance(intraday.sim_engine, IntradayBarSimulationEngine)
+    pd.testing.assert_frame_equal(
+        intraday.get_equity_curve(), daily.get_equity_curve()
+    )
+    pd.testing.assert_frame_equal(
+        intraday.broker.portfolios['000001'].history_to_df(),
+        daily.broker.portfolios['000001'].history_to_df()
+    )
+
+
+def test_intraday_backtest_default_data_source(etf_filepath, monkeypatch):
+    """
+    Checks that a session simulating intraday bars creates a default
+    data handler streaming intraday bar CSV data.
+    """
+    monkeypatch.setenv('QSTRADER_CSV_DATA_DIR', etf_filepath)
+    backtest = _run_backtest(etf_filepath, 'end_of_month', bar_minutes=60)
+
+    data_handler = backtest._create_data_handler(None)
+    assert len(data_handler.data_sources) == 1
+    assert isinstance(data_handler.data_sources[0], CSVIntradayBarDataSource)
@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.asset.universe.static import StaticUniverse
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader import settings
+
+
+ABC_CSV_DATA = (
+    "Date,Open,Close,Adj Close\n"
+    "2020-01-02,100.0,101.0,101.0\n"
+    "2020-01-03,102.0,104.0,104.0\n"
+    "2020-01-06,103.0,102.0,102.0\n"
+    "2020-01-07,105.0,106.0,106.0\n"
+)
+
+DEF_CSV_DATA = (
+    "Date,Open,Close,Adj Close\n"
+    "2020-01-03,50.0,51.0,51.0\n"
+    "2020-01-06,52.0,53.0,53.0\n"
+)
+
+
+@pytest.fixture
+def data_source(tmp_path):
+    settings.set_print_events(False)
+    (tmp_path / 'ABC.csv').write_text(ABC_CSV_DATA)
+    (tmp_path / 'DEF.csv').write_text(DEF_CSV_DATA)
+    return CSVDailyBarDataSource(str(tmp_path), None)
+
+
+def test_cursor_mode_matches_random_access(data_source):
+    """
+    Checks that the cursor mode of the data handler produces the
+    same prices as random-access lookups, both for a forward-moving
+    sequence of timestamps and for subsequent earlier timestamps.
+    """
+    universe = StaticUniverse(['EQ:ABC', 'EQ:DEF'])
+    random_access = BacktestDataHandler(universe, data_sources=[data_source])
+    cursor = BacktestDataHandler(
+        universe, data_sources=[data_source], use_cursors=True
+    )
+
+    dts = list(
+        pd.date_range(
+            '2020-01-01 14:30:00', '2020-01-08 21:00:00',
+            freq='390min', tz=pytz.UTC
+        )
+    )
+    dts += [
+        pd.Timestamp('2020-01-03 21:00:00', tz=pytz.UTC),
+        pd.Timestamp('2020-01-01 00:00:00', tz=pytz.UTC),
+        pd.Timestamp('2020-01-07 14:30:00', tz=pytz.UTC),
+    ]
+    for dt in dts:
+        for asset in universe.get_assets(dt):
+            expected = random_access.get_asset_latest_bid_price(dt, asset)
+            result = cursor.get_asset_latest_bid_price(dt, asset)
+            if np.isnan(expected):
+                assert np.isnan(result)
+            else:
+                assert result == expected
+                assert cursor.get_asset_latest_ask_price(dt, asset) == expected
+
+
+@pytest.mark.parametrize(
+    "dt",
+    [
+        '2020-01-01 21:00:00',
+        '2020-01-02 21:00:00',
+        '2020-01-03 14:30:00',
+        '2020-01-06 21:00:00',
+        '2020-01-10 14:30:00',
+    ]
+)
+def test_batched_prices_match_single_asset_prices(data_source, dt):
+    """
+    Checks that the batched cross-sectional price lookup returns
+    prices aligned to the requested assets, which match the
+    single-asset lookups, with NaN for unavailable prices.
+    """
+    universe = StaticUniverse(['EQ:ABC', 'EQ:DEF'])
+    data_handler = BacktestDataHandler(universe, data_sources=[data_source])
+    ts = pd.Timestamp(dt, tz=pytz.UTC)
+    assets = ['EQ:DEF', 'EQ:XYZ', 'EQ:ABC']
+
+    bids, asks = data_handler.get_assets_latest_bid_ask_prices(ts, assets)
+    mids = data_handler.get_assets_latest_mid_prices(ts, assets)
+    expected = [
+        data_handler.get_asset_latest_bid_price(ts, asset) for asset in assets
+    ]
+    np.testing.assert_array_equal(bids, expected)
+    np.testing.assert_array_equal(asks, expected)
+    np.testing.assert_array_equal(mids, expected)
+
+
+def test_historical_range_close_price(data_source):
+    """
+    Checks that the historical range of closing prices is
+    obtained from the data source with dates aligned across
+    the assets.
+    """
+    universe = StaticUniverse(['EQ:ABC', 'EQ:DEF'])
+    data_handler = BacktestDataHandler(universe, data_sources=[data_source])
+    closes = data_handler.get_assets_historical_range_close_price(
+        pd.Timestamp('2020-01-02', tz=pytz.UTC),
+        pd.Timestamp('2020-01-06', tz=pytz.UTC),
+        ['EQ:ABC', 'EQ:DEF']
+    )
+    assert list(closes.columns) == ['EQ:ABC', 'EQ:DEF']
+    np.testing.assert_array_equal(
+        closes.values, [[101.0, np.NaN], [104.0, 51.0], [102.0, 53.0]]
+    )
+
+
+def test_asset_source_routing_priority(tmp_path):
+    """
+    Checks that assets are routed only to the data sources holding
+    them, in priority order, with a lower priority source used when
+    the higher priority source does not yet have a price.
+    """
+    settings.set_print_events(False)
+    etf_dir = tmp_path / 'etf'
+    stock_dir = tmp_path / 'stock'
+    etf_dir.mkdir()
+    stock_dir.mkdir()
+    (etf_dir / 'ABC.csv').write_text(DEF_CSV_DATA)
+    (stock_dir / 'ABC.csv').write_text(ABC_CSV_DATA)
+    (stock_dir / 'DEF.csv').write_text(DEF_CSV_DATA)
+    etf_source = CSVDailyBarDataSource(str(etf_dir), None)
+    stock_source = CSVDailyBarDataSource(str(stock_dir), None, lazy=True)
+
+    universe = StaticUniverse(['EQ:ABC', 'EQ:DEF'])
+    data_handler = BacktestDataHandler(
+        universe, data_sources=[etf_source, stock_source]
+    )
+    assert data_handler.asset_sources == {
+        'EQ:ABC': (etf_source, stock_source),
+        'EQ:DEF': (stock_source,)
+    }
+
+    early_dt = pd.Timestamp('2020-01-02 21:00:00', tz=pytz.UTC)
+    late_dt = pd.Timestamp('2020-01-03 21:00:00', tz=pytz.UTC)
+    assert data_handler.get_asset_latest_bid_price(early_dt, 'EQ:ABC') == 101.0
+    assert data_handler.get_asset_latest_ask_price(late_dt, 'EQ:ABC') == 51.0
+    assert np.isnan(data_handler.get_asset_latest_bid_price(late_dt, 'EQ:XYZ'))
+
+    assets = ['EQ:XYZ', 'EQ:DEF', 'EQ:ABC']
+    bids, asks = data_handler.get_assets_latest_bid_ask_prices(early_dt, assets)
+    np.testing.assert_array_equal(bids, [np.NaN, np.NaN, 101.0])
+    bids, asks = data_handler.get_assets_latest_bid_ask_prices(late_dt, assets)
+    np.testing.assert_array_equal(asks, [np.NaN, 51.0, 51.0])
+
+    closes = data_handler.get_assets_historical_range_close_price(
+        pd.Timestamp('2020-01-01', tz=pytz.UTC), late_dt, assets
+    )
+    assert list(closes.columns) == ['EQ:DEF', 'EQ:ABC']
+    np.testing.assert_array_equal(closes.values, [[51.0, 51.0]])
@@ -0,0 +1,130 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.data.cache import PriceSeriesCache
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader import settings
+
+
+CSV_DATA = (
+    "Date,Open,Close,Adj Close\n"
+    "2020-01-02,100.0,101.0,50.5\n"
+    "2020-01-03,102.0,104.0,52.0\n"
+    "2020-01-06,103.0,102.0,51.0\n"
+)
+
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    settings.set_print_events(False)
+    csv_dir = tmp_path / 'csv'
+    csv_dir.mkdir()
+    (csv_dir / 'ABC.csv').write_text(CSV_DATA)
+    return str(csv_dir)
+
+
+def assert_data_sources_equal(ds1, ds2):
+    assert ds1.asset_bid_ask_prices.keys() == ds2.asset_bid_ask_prices.keys()
+    for asset in ds1.asset_bid_ask_prices.keys():
+        bid_ask1 = ds1.asset_bid_ask_prices[asset]
+        bid_ask2 = ds2.asset_bid_ask_prices[asset]
+        np.testing.assert_array_equal(bid_ask1.timestamps, bid_ask2.timestamps)
+        np.testing.assert_array_equal(bid_ask1.bids, bid_ask2.bids)
+        np.testing.assert_array_equal(bid_ask1.asks, bid_ask2.asks)
+
+        close1 = ds1.asset_close_prices[asset]
+        close2 = ds2.asset_close_prices[asset]
+        np.testing.assert_array_equal(close1.timestamps, close2.timestamps)
+        np.testing.assert_array_equal(close1.closes, close2.closes)
+        np.testing.assert_array_equal(close1.adj_closes, close2.adj_closes)
+
+
+@pytest.mark.parametrize("adjust_prices", [True, False])
+def test_cached_data_source_matches_uncached(csv_dir, tmp_path, adjust_prices):
+    """
+    Checks that a data source loaded from a warm cache is
+    identical to one loaded directly from the CSV files.
+    """
+    cache_dir = str(tmp_path / 'cache')
+    uncached = CSVDailyBarDataSource(csv_dir, None, adjust_prices=adjust_prices)
+    cold = CSVDailyBarDataSource(
+        csv_dir, None, adjust_prices=adjust_prices, cache_dir=cache_dir
+    )
+    warm = CSVDailyBarDataSource(
+        csv_dir, None, adjust_prices=adjust_prices, cache_dir=cache_dir
+    )
+    assert_data_sources_equal(uncached, cold)
+    assert_data_sources_equal(uncached, warm)
+
+    dt = pd.Timestamp('2020-01-03 14:30:00', tz=pytz.UTC)
+    assert warm.get_bid(dt, 'EQ:ABC') == uncached.get_bid(dt, 'EQ:ABC')
+
+
+def test_cache_entry_keyed_on_csv_and_adjustment(csv_dir, tmp_path):
+    """
+    Checks that cache entries are separate for adjusted and
+    unadjusted prices and are invalidated when the CSV changes.
+    """
+    cache_dir = str(tmp_path / 'cache')
+    csv_path = os.path.join(csv_dir, 'ABC.csv')
+    CSVDailyBarDataSource(csv_dir, None, adjust_prices=True, cache_dir=cache_dir)
+
+    cache = PriceSeriesCache(cache_dir)
+    assert cache.load(csv_path, True) is not None
+    assert cache.load(csv_path, False) is None
+
+    with open(csv_path, 'a') as csv_file:
+        csv_file.write("2020-01-07,104.0,105.0,52.5\n")
+    assert cache.load(csv_path, True) is None
+
+    ds = CSVDailyBarDataSource(csv_dir, None, adjust_prices=True, cache_dir=cache_dir)
+    assert len(ds.asset_close_prices['EQ:ABC']) == 4
+    assert len(PriceSeriesCache(cache_dir).load(csv_path, True)[1]) == 4
+
+
+def test_cache_entry_keyed_on_format_version(csv_dir, tmp_path, monkeypatch):
+    """
+    Checks that cache entries written at an earlier format version
+    are ignored and rewritten rather than loaded.
+    """
+    cache_dir = str(tmp_path / 'cache')
+    csv_path = os.path.join(csv_dir, 'ABC.csv')
+    CSVDailyBarDataSource(csv_dir, None, cache_dir=cache_dir)
+    assert PriceSeriesCache(cache_dir).load(csv_path, True) is not None
+
+    monkeypatch.setattr(
+        PriceSeriesCache, 'FORMAT_VERSION', PriceSeriesCache.FORMAT_VERSION + 1
+    )
+    assert PriceSeriesCache(cache_dir).load(csv_path, True) is None
+
+    CSVDailyBarDataSource(csv_dir, None, cache_dir=cache_dir)
+    cache = PriceSeriesCache(cache_dir)
+    assert cache.load(csv_path, True) is not None
+    assert len(cache.manifest) == 2
+
+
+def test_amortised_manifest_writes(tmp_path):
+    """
+    Checks that amortised manifest writes are deferred until the
+    unwritten entries number at least the written entries, while
+    non-amortised writes occur whenever there are unwritten entries.
+    """
+    cache = PriceSeriesCache(str(tmp_path / 'cache'))
+    writes = []
+    for i in range(8):
+        cache.manifest['entry%s' % i] = {}
+        cache.num_unwritten += 1
+        cache.write_manifest(amortised=True)
+        if cache.num_unwritten == 0:
+            writes.append(i)
+    assert writes == [0, 1, 3, 7]
+
+    cache.manifest['extra'] = {}
+    cache.num_unwritten += 1
+    cache.write_manifest()
+    assert cache.num_unwritten == 0
+    assert len(PriceSeriesCache(str(tmp_path / 'cache')).manifest) == 9
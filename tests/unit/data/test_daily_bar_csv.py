@@ -0,0 +1,185 @@
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader import settings
+
+
+CSV_DATA = (
+    "Date,Open,Close,Adj Close\n"
+    "2020-01-02,100.0,101.0,50.5\n"
+    "2020-01-03,102.0,104.0,52.0\n"
+    "2020-01-06,103.0,102.0,51.0\n"
+)
+
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    settings.set_print_events(False)
+    (tmp_path / 'ABC.csv').write_text(CSV_DATA)
+    return str(tmp_path)
+
+
+@pytest.mark.parametrize(
+    "dt,adjust_prices,expected",
+    [
+        ('2020-01-01 23:59:00', False, np.NaN),
+        ('2020-01-02 14:29:59', False, np.NaN),
+        ('2020-01-02 14:30:00', False, 100.0),
+        ('2020-01-02 20:59:59', False, 100.0),
+        ('2020-01-02 21:00:00', False, 101.0),
+        ('2020-01-04 12:00:00', False, 104.0),
+        ('2020-01-06 14:30:00', False, 103.0),
+        ('2020-12-31 21:00:00', False, 102.0),
+        ('2020-01-02 14:30:00', True, 50.0),
+        ('2020-01-03 21:00:00', True, 52.0),
+    ]
+)
+def test_get_bid_ask(csv_dir, dt, adjust_prices, expected):
+    """
+    Checks that the array-backed bid/ask lookups return the
+    latest available price at or prior to the timestamp, and
+    NaN before the first available price.
+    """
+    ds = CSVDailyBarDataSource(
+        csv_dir, None, adjust_prices=adjust_prices, csv_symbols=['ABC']
+    )
+    ts = pd.Timestamp(dt, tz=pytz.UTC)
+
+    bid = ds.get_bid(ts, 'EQ:ABC')
+    ask = ds.get_ask(ts, 'EQ:ABC')
+    if np.isnan(expected):
+        assert np.isnan(bid)
+        assert np.isnan(ask)
+    else:
+        assert bid == pytest.approx(expected)
+        assert ask == pytest.approx(expected)
+
+
+def test_get_bid_unknown_asset_raises(csv_dir):
+    """
+    Checks that requesting a price for an asset not present
+    in the data source raises a KeyError.
+    """
+    ds = CSVDailyBarDataSource(csv_dir, None, csv_symbols=['ABC'])
+    with pytest.raises(KeyError):
+        ds.get_bid(pd.Timestamp('2020-01-03', tz=pytz.UTC), 'EQ:XYZ')
+
+
+def test_parallel_loading_matches_serial(tmp_path):
+    """
+    Checks that loading CSV files across worker processes
+    produces identical price arrays, in the same order, to
+    serial loading.
+    """
+    settings.set_print_events(False)
+    for i, symbol in enumerate(['ABC', 'DEF', 'GHI', 'JKL']):
+        (tmp_path / ('%s.csv' % symbol)).write_text(
+            CSV_DATA.replace('10', str(20 + i))
+        )
+
+    serial = CSVDailyBarDataSource(str(tmp_path), None)
+    parallel = CSVDailyBarDataSource(str(tmp_path), None, max_workers=2)
+
+    assert list(serial.asset_bid_ask_prices) == list(parallel.asset_bid_ask_prices)
+    for asset, bid_ask in serial.asset_bid_ask_prices.items():
+        np.testing.assert_array_equal(
+            bid_ask.timestamps, parallel.asset_bid_ask_prices[asset].timestamps
+        )
+        np.testing.assert_array_equal(
+            bid_ask.bids, parallel.asset_bid_ask_prices[asset].bids
+        )
+        np.testing.assert_array_equal(
+            serial.asset_close_prices[asset].closes,
+            parallel.asset_close_prices[asset].closes
+        )
+
+    # Workers only receive the parsing configuration, not loaded prices
+    assert set(parallel._obtain_converter_config()) == {
+        'csv_dir', 'asset_type', 'adjust_prices'
+    }
+
+
+def test_lazy_loading_and_eviction(tmp_path):
+    """
+    Checks that lazy mode only loads the CSV files of requested
+    symbols, evicts the least recently used symbols beyond the
+    provided limit and produces the same prices as eager loading.
+    """
+    settings.set_print_events(False)
+    for symbol in ['ABC', 'DEF', 'GHI']:
+        (tmp_path / ('%s.csv' % symbol)).write_text(CSV_DATA)
+    dt = pd.Timestamp('2020-01-03 21:00:00', tz=pytz.UTC)
+
+    eager = CSVDailyBarDataSource(str(tmp_path), None)
+    lazy = CSVDailyBarDataSource(
+        str(tmp_path), None, lazy=True, max_loaded_symbols=2
+    )
+    assert len(lazy.asset_bid_ask_prices) == 0
+
+    assert lazy.get_bid(dt, 'EQ:ABC') == eager.get_bid(dt, 'EQ:ABC')
+    assert list(lazy.asset_bid_ask_prices) == ['EQ:ABC']
+
+    bids, asks = lazy.get_bids_asks(dt, ['EQ:DEF', 'EQ:XYZ'])
+    assert bids[0] == eager.get_bid(dt, 'EQ:DEF')
+    assert np.isnan(bids[1])
+    assert list(lazy.asset_bid_ask_prices) == ['EQ:ABC', 'EQ:DEF']
+
+    lazy.get_ask(dt, 'EQ:ABC')
+    lazy.get_ask(dt, 'EQ:GHI')
+    assert list(lazy.asset_bid_ask_prices) == ['EQ:ABC', 'EQ:GHI']
+    assert lazy.get_bid_ask_panel().assets == ['EQ:ABC', 'EQ:GHI']
+    bids, asks = lazy.get_bids_asks(dt, ['EQ:GHI', 'EQ:ABC'])
+    np.testing.assert_array_equal(
+        bids, eager.get_bids_asks(dt, ['EQ:GHI', 'EQ:ABC'])[0]
+    )
+
+    start_dt = pd.Timestamp('2020-01-01', tz=pytz.UTC)
+    closes = lazy.get_assets_historical_closes(start_dt, dt, ['EQ:DEF'])
+    assert len(closes) == 2
+    pd.testing.assert_frame_equal(
+        closes, eager.get_assets_historical_closes(start_dt, dt, ['EQ:DEF'])
+    )
+    with pytest.raises(KeyError):
+        lazy.get_bid(dt, 'EQ:XYZ')
+
+
+@pytest.mark.parametrize(
+    "adjust_prices,expected_prices",
+    [
+        (False, [np.NaN, 101.0, 102.0, 102.0, 103.0, 103.0]),
+        (True, [np.NaN, 50.5, 50.5, 50.5, 51.5, 51.5]),
+    ]
+)
+def test_convert_bar_frame_into_bid_ask_prices(adjust_prices, expected_prices):
+    """
+    Checks that daily bars are interleaved into open/close prices
+    timestamped at 14:30 and 21:00 UTC, optionally adjusted, with
+    missing prices forward-filled.
+    """
+    bar_df = pd.DataFrame(
+        {
+            'Open': [np.NaN, 102.0, 103.0],
+            'Close': [101.0, np.NaN, 103.0],
+            'Adj Close': [50.5, np.NaN, 51.5]
+        },
+        index=pd.DatetimeIndex(
+            ['2020-01-02', '2020-01-03', '2020-01-06'], tz=pytz.UTC, name='Date'
+        )
+    )
+    ds = CSVDailyBarDataSource.__new__(CSVDailyBarDataSource)
+    ds.adjust_prices = adjust_prices
+    bid_ask = ds._convert_bar_frame_into_bid_ask_prices(bar_df)
+
+    expected_timestamps = pd.DatetimeIndex(
+        [
+            '2020-01-02 14:30:00', '2020-01-02 21:00:00',
+            '2020-01-03 14:30:00', '2020-01-03 21:00:00',
+            '2020-01-06 14:30:00', '2020-01-06 21:00:00'
+        ], tz=pytz.UTC
+    )
+    np.testing.assert_array_equal(bid_ask.timestamps, expected_timestamps.asi8)
+    np.testing.assert_array_equal(bid_ask.bids, expected_prices)
+    np.testing.assert_array_equal(bid_ask.asks, expected_prices)
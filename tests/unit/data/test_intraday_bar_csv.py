@@ -0,0 +1,116 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.data.intraday_bar_csv import CSVIntradayBarDataSource
+
+
+@pytest.fixture
+def intraday_csv_dir(tmpdir):
+    """
+    Writes minute bar CSV files for two assets, with the
+    second asset's bars starting later and containing gaps.
+    """
+    timestamps = pd.date_range('2020-01-02 14:31:00', periods=50, freq='min')
+    closes = np.arange(50, dtype=np.float64) + 100.0
+    for symbol, selection in [
+        ('ABC', np.arange(50)), ('DEF', np.arange(10, 50, 3))
+    ]:
+        pd.DataFrame(
+            {
+                'Timestamp': timestamps[selection].strftime('%Y-%m-%d %H:%M:%S'),
+                'Open': closes[selection],
+                'High': closes[selection],
+                'Low': closes[selection],
+                'Close': closes[selection] + (1000.0 if symbol == 'DEF' else 0.0),
+                'Volume': 1000
+            }
+        ).to_csv(os.path.join(str(tmpdir), '%s.csv' % symbol), index=False)
+    return str(tmpdir)
+
+
+@pytest.mark.parametrize('window_size', [3, 1000])
+def test_latest_bar_close_across_chunks(intraday_csv_dir, window_size):
+    """
+    Checks that the bid/ask prices are the closes of the latest bars
+    at or prior to each timestamp as the chunked streams and the
+    window of batched prices move forward, and after rewinding for
+    an earlier timestamp.
+    """
+    ds = CSVIntradayBarDataSource(
+        intraday_csv_dir, 'Equity', chunk_size=4, window_size=window_size
+    )
+    assets = ['EQ:ABC', 'EQ:DEF', 'EQ:XYZ']
+    assert ds.get_assets() == ['EQ:ABC', 'EQ:DEF']
+
+    expected_df = pd.concat(
+        [
+            pd.read_csv(
+                os.path.join(intraday_csv_dir, '%s.csv' % symbol),
+                index_col='Timestamp', parse_dates=True
+            )['Close'].rename('EQ:%s' % symbol).tz_localize(pytz.UTC)
+            for symbol in ['ABC', 'DEF']
+        ], axis=1
+    )
+    dts = pd.date_range(
+        '2020-01-02 14:30:00', '2020-01-02 15:30:00', freq='30s', tz=pytz.UTC
+    )
+    for dt in list(dts) + [dts[7]]:
+        bids, asks = ds.get_bids_asks(dt, assets)
+        expected = expected_df.loc[:dt].ffill()
+        for i, asset in enumerate(assets[:2]):
+            expected_price = (
+                expected[asset].iloc[-1] if len(expected) > 0 else np.NaN
+            )
+            np.testing.assert_equal(bids[i], expected_price)
+            np.testing.assert_equal(ds.get_ask(dt, asset), expected_price)
+        assert np.isnan(bids[2]) and np.isnan(asks[2])
+
+
+def test_stream_bars_merges_assets_in_time_order(intraday_csv_dir):
+    """
+    Checks that the bars of all assets are streamed in time order
+    and that historical closes are restricted to the provided range.
+    """
+    ds = CSVIntradayBarDataSource(intraday_csv_dir, 'Equity', chunk_size=7)
+    bars = list(ds.stream_bars())
+    assert len(bars) == 50 + 14
+    assert [bar[0] for bar in bars] == sorted(bar[0] for bar in bars)
+    assert bars[0] == (
+        pd.Timestamp('2020-01-02 14:31:00', tz=pytz.UTC).value, 'EQ:ABC', 100.0
+    )
+
+    closes_df = ds.get_assets_historical_closes(
+        pd.Timestamp('2020-01-02 14:40:00', tz=pytz.UTC),
+        pd.Timestamp('2020-01-02 14:50:00', tz=pytz.UTC),
+        ['EQ:DEF', 'EQ:ABC']
+    )
+    assert list(closes_df.columns) == ['EQ:DEF', 'EQ:ABC']
+    assert len(closes_df) == 11
+    assert closes_df['EQ:DEF'].dropna().tolist() == [1110.0, 1113.0, 1116.0, 1119.0]
+
+
+def test_historical_bids_asks_match_latest_prices(intraday_csv_dir):
+    """
+    Checks that the historical bid/ask prices at unordered timestamps
+    match the latest prices at each timestamp, without moving the
+    latest price streams.
+    """
+    ds = CSVIntradayBarDataSource(intraday_csv_dir, 'Equity', chunk_size=4)
+    assets = ['EQ:DEF', 'EQ:XYZ', 'EQ:ABC']
+    dts = pd.date_range(
+        '2020-01-02 14:30:00', '2020-01-02 15:30:00', freq='7min', tz=pytz.UTC
+    )[::-1]
+
+    bids, asks = ds.get_historical_bids_asks(dts, assets)
+    assert bids.shape == (len(dts), len(assets))
+    assert len(ds.asset_streams) == 0
+
+    latest = CSVIntradayBarDataSource(intraday_csv_dir, 'Equity', chunk_size=4)
+    for row, dt in enumerate(dts[::-1]):
+        expected = latest.get_bids_asks(dt, assets)[0]
+        np.testing.assert_array_equal(bids[len(dts) - 1 - row], expected)
+        np.testing.assert_array_equal(asks[len(dts) - 1 - row], expected)
@@ -0,0 +1,245 @@
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.data.price_series import (
+    BidAskPriceCursor, BidAskPricePanel, BidAskPriceSeries, ClosePricePanel,
+    ClosePriceSeries, timestamp_to_nanoseconds
+)
+
+
+@pytest.fixture
+def price_series():
+    timestamps = pd.date_range(
+        '2020-01-01 14:30:00', periods=50, freq='6H', tz=pytz.UTC
+    )
+    prices = np.arange(1.0, 51.0)
+    return BidAskPriceSeries(timestamps.asi8, prices, prices + 0.5)
+
+
+@pytest.mark.parametrize(
+    "dt,expected_idx",
+    [
+        ('2020-01-01 14:29:59', -1),
+        ('2020-01-01 14:30:00', 0),
+        ('2020-01-01 20:29:59', 0),
+        ('2020-01-01 20:30:00', 1),
+        ('2020-02-01 00:00:00', 49),
+    ]
+)
+def test_index_at(price_series, dt, expected_idx):
+    """
+    Checks that the binary search finds the latest row at or
+    prior to the provided timestamp.
+    """
+    ns = timestamp_to_nanoseconds(pd.Timestamp(dt, tz=pytz.UTC))
+    assert price_series.index_at(ns) == expected_idx
+
+
+def test_cursor_matches_binary_search(price_series):
+    """
+    Checks that the price cursor produces identical rows to a
+    fresh binary search for forward steps of varying size as
+    well as for backward (earlier timestamp) requests.
+    """
+    cursor = BidAskPriceCursor(price_series, max_steps=3)
+    start = timestamp_to_nanoseconds(
+        pd.Timestamp('2020-01-01 00:00:00', tz=pytz.UTC)
+    )
+    hour = 3600 * 10**9
+    offsets = [0, 14, 15, 16, 21, 40, 41, 100, 60, 61, 5, 300, 301, 10]
+    for offset in offsets:
+        ns = start + offset * hour
+        assert cursor.seek(ns) == price_series.index_at(ns)
+
+
+def test_cursor_prices(price_series):
+    """
+    Checks that the price cursor returns NaN prior to the first
+    price and the correct bid/ask thereafter.
+    """
+    cursor = BidAskPriceCursor(price_series)
+    assert np.isnan(cursor.get_bid(pd.Timestamp('2019-12-31', tz=pytz.UTC)))
+    dt = pd.Timestamp('2020-01-02 03:00:00', tz=pytz.UTC)
+    assert cursor.get_bid(dt) == 3.0
+    assert cursor.get_ask(dt) == 3.5
+
+
+@pytest.fixture
+def close_panel():
+    dates = pd.date_range('2020-01-01', periods=6, freq='D', tz=pytz.UTC)
+    return ClosePricePanel.from_series({
+        'EQ:ABC': ClosePriceSeries(
+            dates.asi8[:4], [1.0, 2.0, 3.0, 4.0], [0.5, 1.0, 1.5, 2.0]
+        ),
+        'EQ:DEF': ClosePriceSeries(dates.asi8[2:], [13.0, 14.0, 15.0, 16.0]),
+        'EQ:GHI': ClosePriceSeries(dates.asi8[1:3], [22.0, 23.0]),
+    })
+
+
+def test_close_panel_range_is_view(close_panel):
+    """
+    Checks that a date range of contiguous assets is returned
+    as a view onto the close price panel.
+    """
+    closes = close_panel.get_closes(
+        pd.Timestamp('2020-01-02', tz=pytz.UTC),
+        pd.Timestamp('2020-01-04', tz=pytz.UTC),
+        ['EQ:ABC', 'EQ:DEF']
+    )
+    assert np.shares_memory(closes.values, close_panel.closes)
+    np.testing.assert_array_equal(
+        closes.values, [[2.0, np.NaN], [3.0, 13.0], [4.0, 14.0]]
+    )
+    assert list(closes.columns) == ['EQ:ABC', 'EQ:DEF']
+
+
+def test_close_panel_drops_empty_dates(close_panel):
+    """
+    Checks that non-contiguous and unknown assets are handled and
+    that dates without any price for the assets are dropped.
+    """
+    closes = close_panel.get_closes(
+        None, None, ['EQ:GHI', 'EQ:XYZ', 'EQ:ABC'], adjusted=True
+    )
+    assert list(closes.columns) == ['EQ:GHI', 'EQ:ABC']
+    assert list(closes.index) == list(
+        pd.date_range('2020-01-01', periods=4, freq='D', tz=pytz.UTC)
+    )
+    np.testing.assert_array_equal(
+        closes.values,
+        [[np.NaN, 0.5], [np.NaN, 1.0], [np.NaN, 1.5], [np.NaN, 2.0]]
+    )
+
+
+def test_bid_ask_panel_shares_identical_bids_and_asks():
+    """
+    Checks that a single matrix is shared between the bid and ask
+    prices when every asset's bids equal its asks, but not otherwise.
+    """
+    timestamps = np.array([1, 3, 5], dtype=np.int64)
+    prices = np.array([10.0, 11.0, 12.0])
+    same = BidAskPriceSeries(timestamps, prices, prices.copy())
+    assert same.asks is same.bids
+
+    panel = BidAskPricePanel.from_series({'EQ:ABC': same, 'EQ:DEF': same})
+    assert panel.asks is panel.bids
+
+    spread = BidAskPriceSeries(timestamps, prices, prices + 0.5)
+    panel = BidAskPricePanel.from_series({'EQ:ABC': same, 'EQ:DEF': spread})
+    assert panel.asks is not panel.bids
+    np.testing.assert_array_equal(panel.asks[:, 1], prices + 0.5)
+
+
+@pytest.mark.parametrize('spread', [0.0, 0.5])
+def test_panels_with_assets_match_rebuilt_panels(spread):
+    """
+    Checks that removing and appending assets to existing panels gives
+    the same prices as panels rebuilt from the remaining price series.
+    """
+    bid_ask_series = {
+        'EQ:ABC': BidAskPriceSeries(
+            np.array([1, 3, 5]), np.array([1.0, 2.0, 3.0]),
+            np.array([1.0, 2.0, 3.0]) + spread
+        ),
+        'EQ:DEF': BidAskPriceSeries(
+            np.array([2, 3]), np.array([4.0, 5.0]), np.array([4.0, 5.0])
+        ),
+        'EQ:GHI': BidAskPriceSeries(
+            np.array([0, 4, 6]), np.array([6.0, 7.0, 8.0]),
+            np.array([6.0, 7.0, 8.0])
+        )
+    }
+    close_series = {
+        asset: ClosePriceSeries(series.timestamps, series.bids, series.bids * 0.5)
+        for asset, series in bid_ask_series.items()
+    }
+
+    def select(series, assets):
+        return {asset: series[asset] for asset in assets}
+
+    bid_ask_panel = BidAskPricePanel.from_series(
+        select(bid_ask_series, ['EQ:ABC', 'EQ:DEF'])
+    ).with_assets(['EQ:DEF'], select(bid_ask_series, ['EQ:GHI']))
+    expected = BidAskPricePanel.from_series(
+        select(bid_ask_series, ['EQ:DEF', 'EQ:GHI'])
+    )
+    assert bid_ask_panel.assets == ['EQ:DEF', 'EQ:GHI']
+    dts = pd.to_datetime(np.arange(8), utc=True)
+    for actual, wanted in zip(
+        bid_ask_panel.get_historical_bids_asks(dts, bid_ask_panel.assets),
+        expected.get_historical_bids_asks(dts, expected.assets)
+    ):
+        np.testing.assert_array_equal(actual, wanted)
+
+    close_panel = ClosePricePanel.from_series(
+        select(close_series, ['EQ:ABC', 'EQ:DEF'])
+    ).with_assets(['EQ:DEF'], select(close_series, ['EQ:GHI']))
+    expected = ClosePricePanel.from_series(
+        select(close_series, ['EQ:DEF', 'EQ:GHI'])
+    )
+    for adjusted in [False, True]:
+        pd.testing.assert_frame_equal(
+            close_panel.get_closes(None, None, ['EQ:DEF', 'EQ:GHI'], adjusted=adjusted),
+            expected.get_closes(None, None, ['EQ:DEF', 'EQ:GHI'], adjusted=adjusted)
+        )
+
+
+def _assert_panels_equal(panel, expected):
+    """
+    Check that two bid/ask price panels serve identical prices.
+    """
+    dts = pd.to_datetime(np.arange(10), utc=True)
+    for actual, wanted in zip(
+        panel.get_historical_bids_asks(dts, expected.assets),
+        expected.get_historical_bids_asks(dts, expected.assets)
+    ):
+        np.testing.assert_array_equal(actual, wanted)
+
+
+@pytest.mark.parametrize('spread', [0.0, 0.5])
+def test_panel_update_assets_in_place(spread):
+    """
+    Checks that removing and appending assets in place, with amortised
+    growth of the column capacity, gives the same prices as panels
+    rebuilt from the remaining price series, falling back to a rebuild
+    if the appended assets have timestamps absent from the panel.
+    """
+    timestamps = np.array([1, 3, 5, 7])
+    bid_ask_series = {
+        'EQ:%d' % i: BidAskPriceSeries(
+            timestamps[i % 2:], timestamps[i % 2:] + 10.0 * i,
+            timestamps[i % 2:] + 10.0 * i + (spread if i == 3 else 0.0)
+        )
+        for i in range(6)
+    }
+    panel = BidAskPricePanel.from_series({'EQ:0': bid_ask_series['EQ:0']})
+    loaded = ['EQ:0']
+    for i in range(1, 6):
+        storage = panel.storage[0]
+        panel.update_assets([], {'EQ:%d' % i: bid_ask_series['EQ:%d' % i]})
+        loaded.append('EQ:%d' % i)
+        if i == 3:
+            panel.update_assets(['EQ:1'])
+            loaded.remove('EQ:1')
+        if i in [1, 2, 4] and spread == 0.0:
+            # Only the doubling of the capacity reallocates the storage
+            assert (panel.storage[0] is storage) == (i == 4)
+        assert (panel.asks is panel.bids) == (spread == 0.0 or i < 3)
+        _assert_panels_equal(
+            panel, BidAskPricePanel.from_series(
+                {asset: bid_ask_series[asset] for asset in loaded}
+            )
+        )
+        assert sorted(panel.assets) == sorted(loaded)
+
+    extra = BidAskPriceSeries(np.array([0, 8]), np.array([1.0, 2.0]), np.array([1.0, 2.0]))
+    panel.update_assets(['EQ:0'], {'EQ:9': extra})
+    loaded = [asset for asset in panel.assets]
+    _assert_panels_equal(
+        panel, BidAskPricePanel.from_series(
+            {asset: dict(bid_ask_series, **{'EQ:9': extra})[asset] for asset in loaded}
+        )
+    )
+    assert 'EQ:0' not in loaded and 'EQ:9' in loaded
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader.data.shared_panel import (
+    publish_shared_panels, SharedPanelDataSource
+)
+from qstrader import settings
+
+
+CSV_DATA = (
+    "Date,Open,Close,Adj Close\n"
+    "2020-01-02,100.0,101.0,50.5\n"
+    "2020-01-03,102.0,104.0,52.0\n"
+    "2020-01-06,103.0,102.0,51.0\n"
+)
+
+
+def test_shared_panel_matches_csv_data_source(tmp_path):
+    """
+    Checks that a data source attached to published panels serves
+    identical prices to the original data source, from read-only
+    memory-mapped arrays.
+    """
+    settings.set_print_events(False)
+    csv_dir = tmp_path / 'csv'
+    csv_dir.mkdir()
+    (csv_dir / 'ABC.csv').write_text(CSV_DATA)
+    (csv_dir / 'DEF.csv').write_text(CSV_DATA.replace('2020-01-02', '2020-01-01'))
+
+    ds = CSVDailyBarDataSource(str(csv_dir), None)
+    shared_dir = str(tmp_path / 'shared')
+    publish_shared_panels(ds, shared_dir)
+    shared = SharedPanelDataSource(shared_dir)
+
+    assets = ['EQ:ABC', 'EQ:DEF']
+    for dt in pd.date_range('2020-01-01', '2020-01-07', freq='3H', tz=pytz.UTC):
+        for asset in assets:
+            np.testing.assert_equal(shared.get_bid(dt, asset), ds.get_bid(dt, asset))
+            np.testing.assert_equal(shared.get_ask(dt, asset), ds.get_ask(dt, asset))
+
+    start_dt = pd.Timestamp('2020-01-01', tz=pytz.UTC)
+    end_dt = pd.Timestamp('2020-01-06', tz=pytz.UTC)
+    for adjusted in [False, True]:
+        pd.testing.assert_frame_equal(
+            shared.get_assets_historical_closes(start_dt, end_dt, assets, adjusted=adjusted),
+            ds.get_assets_historical_closes(start_dt, end_dt, assets, adjusted=adjusted)
+        )
+
+    assert isinstance(shared.get_bid_ask_panel().bids, np.memmap)
+    assert not shared.get_close_panel().closes.flags.writeable
+    with pytest.raises(KeyError):
+        shared.get_bid(end_dt, 'EQ:XYZ')
+
+
+def test_shared_panel_missing_directory_raises(tmp_path):
+    """
+    Checks that attaching to a directory without published
+    panels raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        SharedPanelDataSource(str(tmp_path))
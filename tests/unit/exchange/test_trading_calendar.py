@@ -0,0 +1,108 @@
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.alpha_model.fixed_signals import FixedSignalsAlphaModel
+from qstrader.asset.universe.static import StaticUniverse
+from qstrader.broker.simulated_broker import SimulatedBroker
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+from qstrader.exchange.simulated_exchange import SimulatedExchange
+from qstrader.exchange.trading_calendar import (
+    NYSETradingCalendar, TradingCalendar
+)
+from qstrader.simulation.daily_bday import DailyBusinessDaySimulationEngine
+from qstrader.trading.backtest import BacktestTradingSession
+
+
+@pytest.mark.parametrize(
+    "year,expected_holidays",
+    [
+        (
+            2021,
+            [
+                '2021-01-01', '2021-01-18', '2021-02-15', '2021-04-02',
+                '2021-05-31', '2021-07-05', '2021-09-06', '2021-11-25',
+                '2021-12-24'
+            ]
+        ),
+        (
+            2023,
+            [
+                '2023-01-02', '2023-01-16', '2023-02-20', '2023-04-07',
+                '2023-05-29', '2023-06-19', '2023-07-04', '2023-09-04',
+                '2023-11-23', '2023-12-25'
+            ]
+        )
+    ]
+)
+def test_nyse_weekday_holidays(year, expected_holidays):
+    """
+    Checks that the NYSE calendar generates the observed
+    weekday holidays of a year.
+    """
+    calendar = NYSETradingCalendar()
+    days = pd.date_range('%s-01-01' % year, '%s-12-31' % year, tz=pytz.UTC)
+    holidays = days[(days.dayofweek < 5) & ~calendar.trading_day_mask(days)]
+    assert list(holidays.strftime('%Y-%m-%d')) == expected_holidays
+    for day in holidays:
+        assert not calendar.is_trading_day(day)
+
+
+def test_nyse_special_closures_and_unobserved_new_year():
+    """
+    Checks that one-off closures are holidays, while a New Year's
+    Day falling on a Saturday is not observed on the prior Friday.
+    """
+    calendar = NYSETradingCalendar()
+    assert not calendar.is_trading_day(pd.Timestamp('2001-09-12 14:30', tz=pytz.UTC))
+    assert not calendar.is_trading_day(pd.Timestamp('2012-10-29 14:30', tz=pytz.UTC))
+    assert calendar.is_trading_day(pd.Timestamp('2021-12-31 14:30', tz=pytz.UTC))
+    assert TradingCalendar().is_trading_day(pd.Timestamp('2021-12-24', tz=pytz.UTC))
+
+
+def test_calendar_shared_by_exchange_and_simulation_engine():
+    """
+    Checks that a shared calendar removes holidays from the
+    simulated events and closes the exchange on holidays.
+    """
+    calendar = NYSETradingCalendar()
+    exchange = SimulatedExchange(
+        pd.Timestamp('2020-12-21', tz=pytz.UTC), calendar=calendar
+    )
+    sim_engine = DailyBusinessDaySimulationEngine(
+        pd.Timestamp('2020-12-21', tz=pytz.UTC),
+        pd.Timestamp('2021-01-05', tz=pytz.UTC),
+        pre_market=False, post_market=False, calendar=calendar
+    )
+    days = sorted(set(event.ts.strftime('%Y-%m-%d') for event in sim_engine))
+    assert days == [
+        '2020-12-21', '2020-12-22', '2020-12-23', '2020-12-24',
+        '2020-12-28', '2020-12-29', '2020-12-30', '2020-12-31',
+        '2021-01-04', '2021-01-05'
+    ]
+    assert not exchange.is_open_at_datetime(pd.Timestamp('2020-12-25 15:00', tz=pytz.UTC))
+    assert exchange.is_open_at_datetime(pd.Timestamp('2020-12-24 15:00', tz=pytz.UTC))
+
+
+def test_backtest_calendar_shared_with_exchange():
+    """
+    Checks that the calendar provided to a backtest is shared
+    by its simulation engine, rebalance schedule and exchange.
+    """
+    start_dt = pd.Timestamp('2020-12-21 00:00:00', tz=pytz.UTC)
+    end_dt = pd.Timestamp('2021-01-05 23:59:00', tz=pytz.UTC)
+    universe = StaticUniverse(['EQ:ABC'])
+    exchange = SimulatedExchange(start_dt)
+    broker = SimulatedBroker(
+        start_dt, exchange, BacktestDataHandler(universe, data_sources=[])
+    )
+    calendar = NYSETradingCalendar()
+    backtest = BacktestTradingSession(
+        start_dt, end_dt, universe, FixedSignalsAlphaModel({'EQ:ABC': 1.0}),
+        broker=broker, rebalance='end_of_business_month', long_only=True,
+        cash_buffer_percentage=0.05, calendar=calendar
+    )
+    assert exchange.calendar is calendar
+    assert backtest.sim_engine.calendar is calendar
+    assert backtest.rebalance_schedule.calendar is calendar
+    assert not exchange.is_open_at_datetime(pd.Timestamp('2020-12-25 15:00', tz=pytz.UTC))
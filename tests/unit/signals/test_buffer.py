@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from qstrader.signals.buffer import AssetPriceBuffers, ArrayAssetPriceBuffers
+
+
+def test_array_buffers_match_deque_buffers():
+    """
+    Checks that the ring buffer windows match the deque-based
+    buffers before and after the ring buffer wraps around,
+    including for assets added subsequent to creation.
+    """
+    assets = ['EQ:ABC', 'EQ:DEF']
+    lookbacks = [3, 5]
+    deque_buffers = AssetPriceBuffers(list(assets), lookbacks=lookbacks)
+    array_buffers = ArrayAssetPriceBuffers(list(assets), lookbacks=lookbacks)
+
+    rng = np.random.RandomState(42)
+    for i in range(12):
+        step_assets = assets + ['EQ:GHI'] if i >= 4 else assets
+        prices = rng.uniform(50.0, 150.0, size=len(step_assets))
+        deque_buffers.append_prices(step_assets, prices)
+        array_buffers.append_prices(step_assets, prices)
+
+        for lookback in lookbacks:
+            for asset in step_assets:
+                np.testing.assert_array_equal(
+                    array_buffers.window(asset, lookback),
+                    deque_buffers.window(asset, lookback)
+                )
+            windows = array_buffers.windows(step_assets, lookback)
+            assert windows.shape == (len(step_assets), lookback)
+            for row, asset in enumerate(step_assets):
+                expected = deque_buffers.window(asset, lookback)
+                np.testing.assert_array_equal(
+                    windows[row, lookback - len(expected):], expected
+                )
+                assert np.all(np.isnan(windows[row, :lookback - len(expected)]))
+
+
+def test_array_buffers_window_is_view():
+    """
+    Checks that a single-asset window is a view onto the
+    ring buffer rather than a copy.
+    """
+    buffers = ArrayAssetPriceBuffers(['EQ:ABC'], lookbacks=[4])
+    for price in [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]:
+        buffers.append('EQ:ABC', price)
+    window = buffers.window('EQ:ABC', 3)
+    np.testing.assert_array_equal(window, [4.0, 5.0, 6.0])
+    assert np.shares_memory(window, buffers.prices)
+
+
+def test_array_buffers_non_positive_price_raises():
+    """
+    Checks that appending a non-positive price raises a ValueError.
+    """
+    buffers = ArrayAssetPriceBuffers(['EQ:ABC', 'EQ:DEF'], lookbacks=[4])
+    with pytest.raises(ValueError):
+        buffers.append_prices(['EQ:ABC', 'EQ:DEF'], [1.0, 0.0])
+
+
+@pytest.mark.parametrize('buffers_class', [AssetPriceBuffers, ArrayAssetPriceBuffers])
+def test_shorter_lookbacks_served_from_largest_lookback(buffers_class):
+    """
+    Checks that the prices of all lookback periods are served
+    from a single buffer of the largest lookback period, and that
+    lookback periods beyond it are rejected.
+    """
+    buffers = buffers_class(['EQ:ABC'], lookbacks=[2, 6, 4])
+    assert buffers.max_lookback == 6
+    for price in range(1, 10):
+        buffers.append('EQ:ABC', float(price))
+
+    np.testing.assert_array_equal(buffers.window('EQ:ABC', 2), [8.0, 9.0])
+    np.testing.assert_array_equal(buffers.window('EQ:ABC', 4), [6.0, 7.0, 8.0, 9.0])
+    np.testing.assert_array_equal(
+        buffers.window('EQ:ABC', 6), [4.0, 5.0, 6.0, 7.0, 8.0, 9.0]
+    )
+    with pytest.raises(ValueError):
+        buffers.window('EQ:ABC', 7)
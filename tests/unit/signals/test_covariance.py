@@ -0,0 +1,79 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.signals.covariance import CovarianceSignal
+
+
+@pytest.mark.parametrize('array_buffers', [False, True])
+def test_streaming_covariance_matches_window_cov(array_buffers):
+    """
+    Checks that the running cross-product covariance and correlation
+    matrices match those calculated directly from the returns within
+    each lookback window, including across recomputations and for
+    an asset with missing initial prices.
+    """
+    start_dt = pd.Timestamp('2019-01-01 14:30:00', tz=pytz.utc)
+    assets = ['EQ:ABC', 'EQ:DEF', 'EQ:GHI']
+    universe = Mock()
+    universe.get_assets.return_value = assets
+    lookbacks = [4, 10]
+
+    prices = np.random.RandomState(42).uniform(50.0, 150.0, size=(40, 3))
+    prices[:5, 2] = np.NaN
+
+    cov = CovarianceSignal(
+        start_dt, universe, lookbacks,
+        array_buffers=array_buffers, recompute_interval=7
+    )
+    returns = pd.DataFrame(prices).pct_change().fillna(0.0).to_numpy()[1:]
+    for i in range(len(prices)):
+        cov.append_prices(assets, prices[i])
+        for lookback in lookbacks:
+            window = returns[max(i - lookback, 0):i]
+            if len(window) == 0:
+                assert np.isnan(cov.covariance(assets, lookback)).all()
+                continue
+
+            expected = np.cov(window.T, ddof=0)
+            np.testing.assert_allclose(
+                cov.covariance(assets, lookback), expected, atol=1e-12
+            )
+            np.testing.assert_allclose(
+                cov.evaluate(assets, lookback), np.diag(expected), atol=1e-12
+            )
+            np.testing.assert_allclose(
+                cov.covariance(assets[::-1], lookback),
+                expected[::-1, ::-1], atol=1e-12
+            )
+            if i > 5 + lookback:
+                np.testing.assert_allclose(
+                    cov.correlation(assets, lookback),
+                    np.corrcoef(window.T), atol=1e-9
+                )
+
+
+def test_covariance_adds_assets_entering_universe():
+    """
+    Checks that an asset entering the universe part way through
+    receives zero returns prior to its first price.
+    """
+    start_dt = pd.Timestamp('2019-01-01 14:30:00', tz=pytz.utc)
+    universe = Mock()
+    universe.get_assets.return_value = ['EQ:ABC']
+    cov = CovarianceSignal(start_dt, universe, [5])
+    cov.append_prices(['EQ:ABC'], [100.0])
+    cov.append_prices(['EQ:ABC'], [110.0])
+
+    universe.get_assets.return_value = ['EQ:ABC', 'EQ:DEF']
+    cov.update_assets(start_dt + pd.Timedelta(days=2))
+    cov.append_prices(['EQ:ABC', 'EQ:DEF'], [99.0, 50.0])
+    cov.append_prices(['EQ:ABC', 'EQ:DEF'], [108.9, 55.0])
+
+    window = np.array([[0.1, 0.0], [-0.1, 0.0], [0.1, 0.1]])
+    np.testing.assert_allclose(
+        cov.covariance(['EQ:ABC', 'EQ:DEF'], 5), np.cov(window.T, ddof=0), atol=1e-12
+    )
@@ -0,0 +1,74 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.signals.ema import EMASignal
+from qstrader.signals.signals_collection import SignalsCollection
+
+
+@pytest.mark.parametrize('array_buffers', [False, True])
+def test_ema_signal(array_buffers):
+    """
+    Checks that the EMA signal matches the pandas exponentially
+    weighted mean for various spans, for a standalone signal and
+    for one updated via a SignalsCollection.
+    """
+    start_dt = pd.Timestamp('2019-01-01 14:30:00', tz=pytz.utc)
+    assets = ['EQ:ABC', 'EQ:DEF']
+    universe = Mock()
+    universe.get_assets.return_value = assets
+    spans = [3, 10]
+
+    prices = np.random.RandomState(42).uniform(50.0, 150.0, size=(30, 2))
+    prices[:4, 1] = np.NaN
+    data_handler = Mock()
+    data_handler.get_assets_latest_mid_prices.side_effect = list(prices)
+
+    ema = EMASignal(start_dt, universe, spans, array_buffers=array_buffers)
+    collection_ema = EMASignal(start_dt, universe, spans, array_buffers=array_buffers)
+    signals = SignalsCollection({'ema': collection_ema}, data_handler)
+    for i in range(len(prices)):
+        ema.append_prices(assets, prices[i])
+        signals.update(start_dt + pd.Timedelta(days=i))
+
+    for span in spans:
+        expected = [
+            pd.Series(prices[:, j]).dropna().ewm(span=span, adjust=False).mean().iloc[-1]
+            for j in range(len(assets))
+        ]
+        np.testing.assert_allclose(ema.ema(assets, span), expected)
+        np.testing.assert_allclose(signals['ema'].ema(assets, span), expected)
+        assert np.isclose(ema('EQ:ABC', span), expected[0])
+
+
+@pytest.mark.parametrize('span', [1, 3, 50])
+def test_ema_precompute_matches_streaming(span):
+    """
+    Checks that the vectorised precomputed EMA matches the streaming
+    EMA at every row, including missing prices and an asset that
+    enters part way through.
+    """
+    start_dt = pd.Timestamp('2019-01-01 14:30:00', tz=pytz.utc)
+    assets = ['EQ:ABC', 'EQ:DEF', 'EQ:GHI']
+    universe = Mock()
+    universe.get_assets.return_value = assets
+
+    rng = np.random.RandomState(42)
+    prices = 100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, size=(300, 3)), axis=0)
+    prices[rng.uniform(size=prices.shape) < 0.05] = np.NaN
+    appended = np.ones(prices.shape, dtype=bool)
+    appended[:40, 2] = False
+
+    ema = EMASignal(start_dt, universe, [span])
+    expected = np.empty(prices.shape)
+    for row in range(len(prices)):
+        row_assets = [asset for col, asset in enumerate(assets) if appended[row, col]]
+        ema.append_prices(row_assets, prices[row, appended[row]])
+        expected[row] = ema.ema(assets, span)
+
+    np.testing.assert_allclose(
+        ema.precompute(prices, appended, span), expected, rtol=1e-12
+    )
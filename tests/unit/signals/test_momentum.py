@@ -23,7 +23,8 @@ from qstrader.signals.momentum import MomentumSignal
         )
     ]
 )
-def test_momentum_signal(start_dt, lookbacks, prices, expected):
+@pytest.mark.parametrize('array_buffers', [False, True])
+def test_momentum_signal(start_dt, lookbacks, prices, expected, array_buffers):
     """
     Checks that the momentum signal correctly calculates the
     holding period return based momentum for various lookbacks.
@@ -31,9 +32,44 @@ def test_momentum_signal(start_dt, lookbacks, prices, expected):
     universe = Mock()
     universe.get_assets.return_value = ['EQ:SPY']
 
-    mom = MomentumSignal(start_dt, universe, lookbacks)
+    mom = MomentumSignal(start_dt, universe, lookbacks, array_buffers=array_buffers)
     for price_idx in range(len(prices)):
         mom.append('EQ:SPY', prices[price_idx])
 
     for i, lookback in enumerate(lookbacks):
         assert np.isclose(mom('EQ:SPY', lookback), expected[i])
+
+
+@pytest.mark.parametrize('array_buffers', [False, True])
+def test_momentum_matches_compounded_returns(array_buffers):
+    """
+    Checks that the endpoint-based single and multi-asset momentum
+    match the compounded returns of the price window, including
+    windows with missing prices.
+    """
+    start_dt = pd.Timestamp('2019-01-01 14:30:00', tz=pytz.utc)
+    assets = ['EQ:ABC', 'EQ:DEF', 'EQ:GHI']
+    universe = Mock()
+    universe.get_assets.return_value = assets
+    lookbacks = [3, 8]
+
+    prices = np.random.RandomState(42).uniform(50.0, 150.0, size=(12, 3))
+    prices[:5, 1] = np.NaN
+    prices[[2, 6, 7], 2] = np.NaN
+
+    mom = MomentumSignal(start_dt, universe, lookbacks, array_buffers=array_buffers)
+    for i in range(len(prices)):
+        mom.append_prices(assets, prices[i])
+
+        for lookback in lookbacks:
+            expected = []
+            for j in range(len(assets)):
+                window = pd.Series(prices[max(i - lookback, 0):i + 1, j])
+                returns = window.pct_change().dropna().to_numpy()
+                expected.append(
+                    0.0 if len(returns) < 1
+                    else (np.cumprod(1.0 + returns) - 1.0)[-1]
+                )
+            np.testing.assert_allclose(mom.momentum(assets, lookback), expected)
+            for j, asset in enumerate(assets):
+                assert np.isclose(mom(asset, lookback), expected[j])
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.asset.universe.dynamic import DynamicUniverse
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader.signals.ema import EMASignal
+from qstrader.signals.momentum import MomentumSignal
+from qstrader.signals.signals_collection import SignalsCollection
+from qstrader.signals.sma import SMASignal
+from qstrader.signals.vol import VolatilitySignal
+from qstrader.simulation.daily_bday import DailyBusinessDaySimulationEngine
+from qstrader import settings
+
+
+def _write_csv(path, dates, closes):
+    """
+    Write a daily bar CSV file with opens equal to closes.
+    """
+    rows = ['Date,Open,Close,Adj Close'] + [
+        '%s,%0.4f,%0.4f,%0.4f' % (date.strftime('%Y-%m-%d'), close, close, close)
+        for date, close in zip(dates, closes)
+    ]
+    path.write_text('\n'.join(rows) + '\n')
+
+
+def _create_signals(start_dt, universe):
+    """
+    Create a fresh set of signals of every type.
+    """
+    return {
+        'momentum': MomentumSignal(start_dt, universe, [5, 20]),
+        'vol': VolatilitySignal(start_dt, universe, [5, 20]),
+        'sma': SMASignal(start_dt, universe, [5, 20]),
+        'ema': EMASignal(start_dt, universe, [5, 20])
+    }
+
+
+@pytest.mark.parametrize('rtol,signal_names', [(0, ['momentum']), (1e-9, ['vol', 'sma', 'ema'])])
+def test_precomputed_signals_match_streaming(tmp_path, rtol, signal_names):
+    """
+    Checks that the precomputed signals match the streaming signals
+    at every update of a simulation, for assets with missing dates,
+    assets whose prices begin part way through and assets that
+    enter a dynamic universe part way through.
+    """
+    settings.set_print_events(False)
+    rng = np.random.RandomState(42)
+    dates = pd.bdate_range('2020-01-01', '2020-06-30')
+    for symbol, first_date in [('ABC', 0), ('DEF', 30), ('GHI', 0)]:
+        symbol_dates = dates[first_date:].delete([10, 11, 50])
+        closes = 100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, len(symbol_dates)))
+        _write_csv(tmp_path / ('%s.csv' % symbol), symbol_dates, closes)
+
+    start_dt = pd.Timestamp('2020-01-01 14:30:00', tz=pytz.UTC)
+    universe = DynamicUniverse(
+        {
+            'EQ:ABC': start_dt,
+            'EQ:DEF': start_dt,
+            'EQ:GHI': pd.Timestamp('2020-03-02', tz=pytz.UTC)
+        }
+    )
+    data_source = CSVDailyBarDataSource(str(tmp_path), None)
+    data_handler = BacktestDataHandler(universe, data_sources=[data_source])
+
+    streaming = SignalsCollection(_create_signals(start_dt, universe), data_handler)
+    precomputed = SignalsCollection(
+        _create_signals(start_dt, universe), data_handler, precompute=True
+    )
+    sim_engine = DailyBusinessDaySimulationEngine(
+        start_dt, pd.Timestamp('2020-07-03', tz=pytz.UTC),
+        pre_market=False, post_market=False
+    )
+    dts = [event.ts for event in sim_engine if event.event_type == 'market_close']
+    precomputed.precompute_signals(dts)
+
+    for dt in dts:
+        streaming.update(dt)
+        precomputed.update(dt)
+        assets = streaming['momentum'].assets
+        assert sorted(precomputed['momentum'].assets) == sorted(assets)
+        for name in signal_names:
+            for lookback in [5, 20]:
+                np.testing.assert_allclose(
+                    precomputed[name].evaluate(assets, lookback),
+                    streaming[name].evaluate(assets, lookback),
+                    rtol=rtol, atol=0
+                )
+                np.testing.assert_equal(
+                    precomputed[name](assets[-1], lookback),
+                    precomputed[name].evaluate(assets, lookback)[-1]
+                )
+                alias = streaming[name].evaluate_aliases[0]
+                np.testing.assert_allclose(
+                    getattr(precomputed[name], alias)(assets, lookback),
+                    getattr(streaming[name], alias)(assets, lookback),
+                    rtol=rtol, atol=0
+                )
+        for name in signal_names:
+            assert precomputed[name].lookbacks == streaming[name].lookbacks
+            assert np.isnan(precomputed[name]('EQ:XYZ', 5))
+            assert np.isnan(precomputed[name].evaluate(['EQ:XYZ'], 5)).all()
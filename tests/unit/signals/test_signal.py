@@ -0,0 +1,48 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.signals.ema import EMASignal
+from qstrader.signals.momentum import MomentumSignal
+from qstrader.signals.signal import Signal
+from qstrader.signals.sma import SMASignal
+from qstrader.signals.vol import VolatilitySignal
+
+
+class LastPriceSignal(Signal):
+    """
+    Signal without a vectorised calculation, to
+    check the default 'evaluate' implementation.
+    """
+
+    def __call__(self, asset, lookback):
+        return self.buffers.window(asset, lookback)[-1]
+
+
+@pytest.mark.parametrize(
+    'signal_class',
+    [LastPriceSignal, MomentumSignal, VolatilitySignal, SMASignal, EMASignal]
+)
+def test_evaluate_matches_single_asset_calls(signal_class):
+    """
+    Checks that the cross-sectional evaluation of a signal
+    matches calling the signal separately for each asset.
+    """
+    start_dt = pd.Timestamp('2019-01-01 14:30:00', tz=pytz.utc)
+    assets = ['EQ:ABC', 'EQ:DEF', 'EQ:GHI']
+    universe = Mock()
+    universe.get_assets.return_value = assets
+
+    signal = signal_class(start_dt, universe, [5])
+    prices = np.random.RandomState(42).uniform(50.0, 150.0, size=(8, 3))
+    for i in range(len(prices)):
+        signal.append_prices(assets, prices[i])
+
+    values = signal.evaluate(assets[::-1], 5)
+    assert isinstance(values, np.ndarray)
+    np.testing.assert_allclose(
+        values, [signal(asset, 5) for asset in assets[::-1]]
+    )
@@ -0,0 +1,199 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.asset.universe.static import StaticUniverse
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader.signals.covariance import CovarianceSignal
+from qstrader.signals.ema import EMASignal
+from qstrader.signals.momentum import MomentumSignal
+from qstrader.signals.signals_collection import SignalsCollection
+from qstrader.signals.sma import SMASignal
+from qstrader.signals.vol import VolatilitySignal
+
+
+@pytest.mark.parametrize('array_buffers', [False, True])
+def test_signals_share_single_price_buffer(array_buffers):
+    """
+    Checks that all signals in the collection read from a single
+    shared price buffer, that each price is obtained once per
+    update and that the signal values match standalone signals.
+    """
+    start_dt = pd.Timestamp('2019-01-01 14:30:00', tz=pytz.utc)
+    assets = ['EQ:ABC', 'EQ:DEF']
+    universe = Mock()
+    universe.get_assets.return_value = assets
+
+    prices = np.random.RandomState(42).uniform(50.0, 150.0, size=(15, 2))
+    data_handler = Mock()
+    data_handler.get_assets_latest_mid_prices.side_effect = [
+        prices[i] for i in range(len(prices))
+    ]
+
+    momentum = MomentumSignal(start_dt, universe, [6, 12], array_buffers=array_buffers)
+    sma = SMASignal(start_dt, universe, [5], array_buffers=array_buffers)
+    signals = SignalsCollection({'momentum': momentum, 'sma': sma}, data_handler)
+    assert momentum.buffers is signals.buffers
+    assert sma.buffers is signals.buffers
+    assert signals.buffers.max_lookback == 13
+
+    standalone_momentum = MomentumSignal(start_dt, universe, [6, 12])
+    standalone_sma = SMASignal(start_dt, universe, [5])
+    for i in range(len(prices)):
+        signals.update(start_dt + pd.Timedelta(days=i))
+        standalone_momentum.append_prices(assets, prices[i])
+        standalone_sma.append_prices(assets, prices[i])
+
+    assert data_handler.get_assets_latest_mid_prices.call_count == len(prices)
+    for asset in assets:
+        for lookback in [6, 12]:
+            assert np.isclose(
+                signals['momentum'](asset, lookback),
+                standalone_momentum(asset, lookback)
+            )
+        assert np.isclose(signals['sma'](asset, 5), standalone_sma(asset, 5))
+
+
+def _create_daily_data_handler(tmp_path, universe):
+    """
+    Create a data handler of random daily closing prices
+    for the assets of the universe.
+    """
+    rng = np.random.RandomState(42)
+    dates = pd.bdate_range('2020-01-01', '2020-04-30')
+    for asset in universe.get_assets(None):
+        closes = 100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, len(dates)))
+        rows = ['Date,Open,Close,Adj Close'] + [
+            '%s,%0.4f,%0.4f,%0.4f' % (date.strftime('%Y-%m-%d'), close, close, close)
+            for date, close in zip(dates, closes)
+        ]
+        symbol = asset.replace('EQ:', '')
+        (tmp_path / ('%s.csv' % symbol)).write_text('\n'.join(rows) + '\n')
+
+    data_source = CSVDailyBarDataSource(str(tmp_path), None)
+    return BacktestDataHandler(universe, data_sources=[data_source])
+
+
+@pytest.mark.parametrize('precompute', [False, True])
+def test_warm_start_buffers_matches_simulated_burn_in(tmp_path, precompute):
+    """
+    Checks that warm-starting the price buffer from historical
+    closing prices gives the same signal values as updating the
+    signals over the lookback period prior to the start date.
+    """
+    universe = StaticUniverse(['EQ:ABC', 'EQ:DEF'])
+    data_handler = _create_daily_data_handler(tmp_path, universe)
+
+    def create_signals(start_dt):
+        return {
+            'momentum': MomentumSignal(start_dt, universe, [5, 20]),
+            'sma': SMASignal(start_dt, universe, [5, 20]),
+            'vol': VolatilitySignal(start_dt, universe, [5, 20])
+        }
+
+    start_dt = pd.Timestamp('2020-03-02 14:30:00', tz=pytz.UTC)
+    update_dts = [
+        date + pd.Timedelta(hours=21) for date in
+        pd.bdate_range('2020-01-01', '2020-03-31', tz=pytz.UTC)
+    ]
+    burn_in_dts = [dt for dt in update_dts if dt < start_dt]
+    dts = [dt for dt in update_dts if dt >= start_dt]
+
+    simulated = SignalsCollection(create_signals(update_dts[0]), data_handler)
+    for dt in burn_in_dts:
+        simulated.update(dt)
+
+    warm = SignalsCollection(
+        create_signals(start_dt), data_handler,
+        precompute=precompute, warm_start=True
+    )
+    warm.warm_start_buffers(start_dt)
+    assert warm.warmup == warm.buffers.max_lookback
+    for asset in warm.assets:
+        np.testing.assert_array_equal(
+            warm.buffers.window(asset, 21), simulated.buffers.window(asset, 21)
+        )
+    if precompute:
+        warm.precompute_signals(dts)
+
+    for dt in dts:
+        simulated.update(dt)
+        warm.update(dt)
+        for name in ['momentum', 'sma', 'vol']:
+            for lookback in [5, 20]:
+                np.testing.assert_allclose(
+                    warm[name].evaluate(warm.assets, lookback),
+                    simulated[name].evaluate(warm.assets, lookback),
+                    rtol=1e-9
+                )
+
+
+def test_warm_start_buffers_fills_running_state(tmp_path):
+    """
+    Checks that signals keeping running state beyond their single
+    buffered price are warm-started with as many prices as they
+    need, rather than the lookback of the shared price buffer.
+    """
+    universe = StaticUniverse(['EQ:ABC', 'EQ:DEF', 'EQ:GHI'])
+    data_handler = _create_daily_data_handler(tmp_path, universe)
+
+    def create_signals(start_dt):
+        return {
+            'covariance': CovarianceSignal(start_dt, universe, [5, 20]),
+            'ema': EMASignal(start_dt, universe, [10])
+        }
+
+    start_dt = pd.Timestamp('2020-03-02 14:30:00', tz=pytz.UTC)
+    update_dts = [
+        date + pd.Timedelta(hours=21) for date in
+        pd.bdate_range('2020-01-01', '2020-03-31', tz=pytz.UTC)
+    ]
+    simulated = SignalsCollection(create_signals(update_dts[0]), data_handler)
+    for dt in update_dts:
+        if dt < start_dt:
+            simulated.update(dt)
+
+    warm = SignalsCollection(create_signals(start_dt), data_handler, warm_start=True)
+    assert warm.buffers.max_lookback == 1
+    warm.warm_start_buffers(start_dt)
+    assert warm.warmup == simulated.warmup
+
+    for dt in update_dts:
+        if dt < start_dt:
+            continue
+        simulated.update(dt)
+        warm.update(dt)
+        for lookback in [5, 20]:
+            np.testing.assert_allclose(
+                warm['covariance'].covariance(warm.assets, lookback),
+                simulated['covariance'].covariance(warm.assets, lookback),
+                rtol=1e-9
+            )
+        np.testing.assert_allclose(
+            warm['ema'].evaluate(warm.assets, 10),
+            simulated['ema'].evaluate(warm.assets, 10),
+            rtol=1e-9
+        )
+
+
+def test_precompute_signals_raises_for_unsupported_signals():
+    """
+    Checks that precomputing a collection containing a signal that
+    does not implement 'precompute' raises a ValueError naming it.
+    """
+    start_dt = pd.Timestamp('2019-01-01 14:30:00', tz=pytz.utc)
+    universe = StaticUniverse(['EQ:ABC', 'EQ:DEF'])
+    signals = SignalsCollection(
+        {
+            'covariance': CovarianceSignal(start_dt, universe, [5]),
+            'sma': SMASignal(start_dt, universe, [5])
+        },
+        Mock(), precompute=True
+    )
+    with pytest.raises(ValueError, match='covariance'):
+        signals.precompute_signals([start_dt])
+    assert not signals.precomputed
@@ -23,7 +23,8 @@ from qstrader.signals.sma import SMASignal
         )
     ]
 )
-def test_sma_signal(start_dt, lookbacks, prices, expected):
+@pytest.mark.parametrize('array_buffers', [False, True])
+def test_sma_signal(start_dt, lookbacks, prices, expected, array_buffers):
     """
     Checks that the SMA signal correctly calculates the
     simple moving average for various lookbacks.
@@ -31,9 +32,39 @@ def test_sma_signal(start_dt, lookbacks, prices, expected):
     universe = Mock()
     universe.get_assets.return_value = ['EQ:SPY']
 
-    sma = SMASignal(start_dt, universe, lookbacks)
+    sma = SMASignal(start_dt, universe, lookbacks, array_buffers=array_buffers)
     for price_idx in range(len(prices)):
         sma.append('EQ:SPY', prices[price_idx])
 
     for i, lookback in enumerate(lookbacks):
         assert np.isclose(sma('EQ:SPY', lookback), expected[i])
+
+
+@pytest.mark.parametrize('array_buffers', [False, True])
+def test_running_sum_sma_matches_window_mean(array_buffers):
+    """
+    Checks that the running-sum SMA matches the mean of the price
+    window for single and multiple assets, including windows with
+    missing prices and queries after more prices than are buffered.
+    """
+    start_dt = pd.Timestamp('2019-01-01 14:30:00', tz=pytz.utc)
+    assets = ['EQ:ABC', 'EQ:DEF']
+    universe = Mock()
+    universe.get_assets.return_value = assets
+    lookbacks = [3, 8]
+
+    prices = np.random.RandomState(42).uniform(50.0, 150.0, size=(40, 2))
+    prices[:5, 1] = np.NaN
+
+    sma = SMASignal(
+        start_dt, universe, lookbacks,
+        array_buffers=array_buffers, recompute_interval=5
+    )
+    for i in range(len(prices)):
+        sma.append_prices(assets, prices[i])
+        if i % 3 != 0 and i < 25:
+            continue
+        for lookback in lookbacks:
+            expected = np.mean(prices[max(i + 1 - lookback, 0):i + 1], axis=0)
+            np.testing.assert_allclose(sma.sma(assets, lookback), expected)
+            assert np.isclose(sma('EQ:ABC', lookback), expected[0])
@@ -0,0 +1,51 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.signals.vol import VolatilitySignal
+
+
+@pytest.mark.parametrize('array_buffers', [False, True])
+@pytest.mark.parametrize('query_every', [1, 3, 20])
+def test_streaming_volatility_matches_window_std(array_buffers, query_every):
+    """
+    Checks that the running-moment volatility matches the annualised
+    standard deviation of the returns within the price window, when
+    queried after every price, intermittently, or after more prices
+    than the buffers retain.
+    """
+    start_dt = pd.Timestamp('2019-01-01 14:30:00', tz=pytz.utc)
+    assets = ['EQ:ABC', 'EQ:DEF']
+    universe = Mock()
+    universe.get_assets.return_value = assets
+    lookbacks = [3, 8]
+
+    prices = np.random.RandomState(42).uniform(50.0, 150.0, size=(60, 2))
+    prices[:5, 1] = np.NaN
+
+    vol = VolatilitySignal(
+        start_dt, universe, lookbacks,
+        array_buffers=array_buffers, recompute_interval=5
+    )
+    for i in range(len(prices)):
+        vol.append_prices(assets, prices[i])
+        if i % query_every != 0:
+            continue
+
+        for lookback in lookbacks:
+            expected = []
+            for j in range(len(assets)):
+                window = pd.Series(prices[max(i - lookback, 0):i + 1, j])
+                returns = window.pct_change().dropna().to_numpy()
+                expected.append(
+                    0.0 if len(returns) < 1
+                    else np.std(returns) * np.sqrt(252)
+                )
+            np.testing.assert_allclose(
+                vol.volatility(assets, lookback), expected, atol=1e-12
+            )
+            for j, asset in enumerate(assets):
+                assert np.isclose(vol(asset, lookback), expected[j], atol=1e-12)
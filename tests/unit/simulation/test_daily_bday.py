@@ -67,3 +67,38 @@ def test_daily_rebalance(
         calculated_event = sim_events[0]
         expected_event = SimulationEvent(pd.Timestamp(sim_events[1][0], tz=pytz.UTC), sim_events[1][1])
         assert calculated_event == expected_event
+
+
+def test_event_timeline_length_and_slicing():
+    """
+    Checks that the precomputed event timeline supports len(),
+    indexing and slicing consistently with iteration.
+    """
+    sd = pd.Timestamp('2020-01-01 14:30:00', tz=pytz.UTC)
+    ed = pd.Timestamp('2020-03-31 23:59:00', tz=pytz.UTC)
+    sim_engine = DailyBusinessDaySimulationEngine(sd, ed, post_market=False)
+    events = list(sim_engine)
+
+    assert len(sim_engine) == len(events) == 3 * 65
+    assert sim_engine[0] == events[0]
+    assert sim_engine[-1] == SimulationEvent(
+        pd.Timestamp('2020-03-31 21:00:00', tz=pytz.UTC), 'market_close'
+    )
+    assert sim_engine[10:20] == events[10:20]
+
+
+def test_market_close_timestamps():
+    """
+    Checks that the market close timestamps taken from the event
+    timeline arrays match those of the iterated market close events.
+    """
+    sd = pd.Timestamp('2020-01-01 14:30:00', tz=pytz.UTC)
+    ed = pd.Timestamp('2020-03-31 23:59:00', tz=pytz.UTC)
+    sim_engine = DailyBusinessDaySimulationEngine(sd, ed)
+
+    assert list(
+        pd.DatetimeIndex(sim_engine.market_close_timestamps, tz=pytz.UTC)
+    ) == [
+        event.ts for event in sim_engine
+        if event.event_type == 'market_close'
+    ]
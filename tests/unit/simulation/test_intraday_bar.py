@@ -0,0 +1,54 @@
+import pandas as pd
+import pytz
+
+from qstrader.exchange.trading_calendar import NYSETradingCalendar
+from qstrader.simulation.intraday_bar import IntradayBarSimulationEngine
+
+
+def test_intraday_bar_events_per_trading_day():
+    """
+    Checks that a market open, a market bar at the close of each
+    intraday bar and a market close are generated for each trading
+    day, skipping weekends and calendar holidays.
+    """
+    sim_engine = IntradayBarSimulationEngine(
+        pd.Timestamp('2020-01-01', tz=pytz.UTC),
+        pd.Timestamp('2020-01-06', tz=pytz.UTC),
+        bar_minutes=30, calendar=NYSETradingCalendar()
+    )
+    events = [(event.ts, event.event_type) for event in sim_engine]
+
+    days = ['2020-01-02', '2020-01-03', '2020-01-06']
+    expected = []
+    for day in days:
+        open_dt = pd.Timestamp('%s 14:30:00' % day, tz=pytz.UTC)
+        expected.append((open_dt, 'market_open'))
+        expected.extend(
+            (open_dt + pd.Timedelta(minutes=30 * i), 'market_bar')
+            for i in range(1, 13)
+        )
+        expected.append(
+            (pd.Timestamp('%s 21:00:00' % day, tz=pytz.UTC), 'market_close')
+        )
+    assert events == expected
+    assert len(sim_engine) == len(expected)
+    assert list(pd.DatetimeIndex(sim_engine.market_timestamps, tz=pytz.UTC)) == [
+        dt for dt, event_type in expected if event_type != 'market_bar'
+    ]
+    assert list(
+        pd.DatetimeIndex(sim_engine.market_close_timestamps, tz=pytz.UTC)
+    ) == [dt for dt, event_type in expected if event_type == 'market_close']
+
+
+def test_intraday_bar_minute_events():
+    """
+    Checks the number of one minute bar events of a trading day.
+    """
+    sim_engine = IntradayBarSimulationEngine(
+        pd.Timestamp('2020-01-02', tz=pytz.UTC),
+        pd.Timestamp('2020-01-02', tz=pytz.UTC)
+    )
+    events = list(sim_engine)
+    assert len(events) == len(sim_engine) == 391
+    assert events[1].ts == pd.Timestamp('2020-01-02 14:31:00', tz=pytz.UTC)
+    assert events[-2].ts == pd.Timestamp('2020-01-02 20:59:00', tz=pytz.UTC)
@@ -0,0 +1,142 @@
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.exchange.trading_calendar import NYSETradingCalendar
+from qstrader.simulation.daily_bday import DailyBusinessDaySimulationEngine
+from qstrader.system.rebalance.buy_and_hold import BuyAndHoldRebalance
+from qstrader.system.rebalance.daily import DailyRebalance
+from qstrader.system.rebalance.end_of_month import EndOfMonthRebalance
+from qstrader.system.rebalance.weekly import WeeklyRebalance
+
+
+def _create_timeline(start_date, end_date, calendar=None):
+    """
+    Create the market open/close timeline of a simulation engine.
+    """
+    return DailyBusinessDaySimulationEngine(
+        pd.Timestamp(start_date, tz=pytz.UTC),
+        pd.Timestamp(end_date, tz=pytz.UTC),
+        pre_market=False, post_market=False, calendar=calendar
+    )
+
+
+@pytest.mark.parametrize(
+    "rebalance",
+    [
+        DailyRebalance(pd.Timestamp('2020-03-11', tz=pytz.UTC)),
+        DailyRebalance(pd.Timestamp('2020-03-11', tz=pytz.UTC), pre_market=True),
+        WeeklyRebalance(pd.Timestamp('2020-03-11', tz=pytz.UTC), 'MON'),
+        WeeklyRebalance(pd.Timestamp('2020-03-11', tz=pytz.UTC), 'WED', pre_market=True),
+        EndOfMonthRebalance(pd.Timestamp('2020-03-11', tz=pytz.UTC)),
+        EndOfMonthRebalance(
+            pd.Timestamp('2020-03-11', tz=pytz.UTC), business_month_end=True
+        )
+    ]
+)
+def test_compiled_schedule_matches_predicates(rebalance):
+    """
+    Checks that compiling a rebalance schedule against a timeline
+    produces the same rebalance events as the schedule predicates.
+    """
+    sim_engine = _create_timeline('2020-01-01', '2020-12-31 23:59:00')
+    expected = [
+        event.ts for event in sim_engine if rebalance.is_rebalance_event(event.ts)
+    ]
+    rebalance.compile(sim_engine.timestamps)
+    actual = [
+        event.ts for event in sim_engine if rebalance.is_rebalance_event(event.ts)
+    ]
+    assert len(expected) > 0
+    assert actual == expected
+
+
+def test_business_month_end_uses_final_trading_day():
+    """
+    Checks that business month ends are the final trading day of each
+    month, with none for a final month ending prior to its final day.
+    """
+    calendar = NYSETradingCalendar()
+    sim_engine = _create_timeline('2020-03-11', '2021-05-14', calendar=calendar)
+    rebalance = EndOfMonthRebalance(
+        pd.Timestamp('2020-03-11', tz=pytz.UTC),
+        business_month_end=True, calendar=calendar
+    )
+    mask = rebalance.compile(sim_engine.timestamps)
+    dates = pd.DatetimeIndex(sim_engine.timestamps[mask]).strftime('%Y-%m-%d')
+    assert list(dates) == [
+        '2020-03-31', '2020-04-30', '2020-05-29', '2020-06-30',
+        '2020-07-31', '2020-08-31', '2020-09-30', '2020-10-30',
+        '2020-11-30', '2020-12-31', '2021-01-29', '2021-02-26',
+        '2021-03-31', '2021-04-30'
+    ]
+
+
+def test_compiled_buy_and_hold_rebalances_once():
+    """
+    Checks that a buy and hold schedule rebalances only at the first
+    market close of the timeline from its start date onwards.
+    """
+    sim_engine = _create_timeline(
+        '2020-12-24', '2021-01-31', calendar=NYSETradingCalendar()
+    )
+    rebalance = BuyAndHoldRebalance(pd.Timestamp('2020-12-25', tz=pytz.UTC))
+    rebalance.compile(sim_engine.timestamps)
+    assert [
+        event.ts for event in sim_engine if rebalance.is_rebalance_event(event.ts)
+    ] == [pd.Timestamp('2020-12-28 21:00:00', tz=pytz.UTC)]
+
+
+@pytest.mark.parametrize(
+    "create_rebalance",
+    [
+        lambda calendar: BuyAndHoldRebalance(
+            pd.Timestamp('2020-12-25', tz=pytz.UTC), calendar=calendar
+        ),
+        lambda calendar: EndOfMonthRebalance(
+            pd.Timestamp('2020-03-11', tz=pytz.UTC),
+            business_month_end=True, calendar=calendar
+        )
+    ]
+)
+def test_compiled_schedule_matches_predicates_on_holiday_calendar(create_rebalance):
+    """
+    Checks that the compiled and uncompiled forms of the calendar-aware
+    schedules agree on a timeline with NYSE holidays, which include
+    Christmas Day 2020 and Memorial Day 2021 (the final day of May).
+    """
+    calendar = NYSETradingCalendar()
+    sim_engine = _create_timeline('2020-03-01', '2021-07-15', calendar=calendar)
+    rebalance = create_rebalance(calendar)
+    expected = [
+        event.ts for event in sim_engine if rebalance.is_rebalance_event(event.ts)
+    ]
+    rebalance.compile(sim_engine.timestamps)
+    actual = [
+        event.ts for event in sim_engine if rebalance.is_rebalance_event(event.ts)
+    ]
+    assert len(expected) > 0
+    assert actual == expected
+    if isinstance(rebalance, BuyAndHoldRebalance):
+        assert actual == [pd.Timestamp('2020-12-28 21:00:00', tz=pytz.UTC)]
+    else:
+        assert pd.Timestamp('2021-05-28 21:00:00', tz=pytz.UTC) in actual
+
+
+def test_business_month_end_timeline_ending_on_holiday():
+    """
+    Checks that a timeline ending on a month end holiday still
+    rebalances on the final trading day of that month.
+    """
+    calendar = NYSETradingCalendar()
+    sim_engine = _create_timeline(
+        '2021-05-01', '2021-05-31 23:59:00', calendar=calendar
+    )
+    rebalance = EndOfMonthRebalance(
+        pd.Timestamp('2021-05-01', tz=pytz.UTC),
+        business_month_end=True, calendar=calendar
+    )
+    mask = rebalance.compile(sim_engine.timestamps)
+    assert list(pd.DatetimeIndex(sim_engine.timestamps[mask])) == [
+        pd.Timestamp('2021-05-28 21:00:00')
+    ]